@@ -1,52 +1,37 @@
+import numpy as np
 import pandas as pd
 
-import matplotlib.pyplot as plt
-
 import streamlit as st
-from streamlit_folium import st_folium
-import streamlit.components.v1 as components
 
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.graph_objs import Layout
 
 from numerize.numerize import numerize
 
-import geopandas as gpd
-from geopandas import GeoDataFrame
-
-import folium
+from dados import TABELAS, get_data, get_indice, get_registro, get_top
+from figuras import (SECOES, aplica_parametros, escolhe_secao, fragmento,
+                     mostra_figura)
+from mapas import mostra_mapa, painel_coropletico, tem_camada
 
 st.set_page_config(page_title='Análise dos dados do TSE',
                    layout='wide',
                    initial_sidebar_state='collapsed')
 
-
-@st.experimental_memo
-def get_data(dados):
-    if (dados == 'Estadual - 1º turno'):
-        df = pd.read_csv('Dashboard/data/df_estados_1turno_2020.csv')
-    elif (dados == 'Estadual - 2º turno'):
-        df = pd.read_csv('Dashboard/data/df_estados_2turno_2020.csv')
-    elif (dados == 'Municipal - 1º turno'):
-        df = pd.read_csv('Dashboard/data/df_municipios_1turno_2020.csv')
-    else:
-        df = pd.read_csv('Dashboard/data/df_municipios_2turno_2020.csv')
-    return df
-
-
-df = get_data('Estadual - 1º turno')
-
 header_left, header_mid, header_right = st.columns([1, 2, 1], gap='large')
 
 with header_mid:
     st.title('Análise dos dados do TSE')
 
+# A eleição e a seção iniciais podem vir do endereço, como nas páginas que
+# o aquecimento do servidor abre (aquecimento.py)
+aplica_parametros({'dados': list(TABELAS), 'secao': SECOES})
+
 dados = st.selectbox(label='Selecione a eleição',
                      options=['Estadual - 1º turno', 'Estadual - 2º turno',
-                              'Municipal - 1º turno', 'Municipal - 2º turno'])
+                              'Municipal - 1º turno', 'Municipal - 2º turno'],
+                     key='dados')
 
-df = get_data(dados)
+df = get_data(dados, 'resumo')
 
 total_eleitores = float(df['aptos'].sum())
 total_eleitores_feminino = float(df['eleitorado_feminino'].sum())
@@ -88,31 +73,26 @@ if ((dados == 'Estadual - 1º turno')
     def format_func_estado(option):
         return ESTADOS[option]
 
+    # Estado clicado no mapa (mapas.mostra_coropletico)
+    clicado = st.session_state.pop('feicaoClicada', None)
+    if clicado and clicado[0] in ESTADOS.values:
+        st.session_state['estados'] = int(ESTADOS.index[ESTADOS == clicado[0]][0])
+
     estado = st.selectbox(
         "", options=list(ESTADOS.keys()), 
         format_func=format_func_estado,
         key='estados')
+    registro = get_registro(dados, format_func_estado(estado))
     
     Q1, Q2 = st.columns(2)
     with Q1:
-        st.write('Comparecimento percentual por estado')
-
-        if (dados == 'Estadual - 1º turno'):
-            htmlFile = open(
-                    "Dashboard/data/charts/estados_1turno/mapa_estados_1turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, width=620, height=460)
-        else:
-            htmlFile = open(
-                    "Dashboard/data/charts/estados_2turno/mapa_estados_2turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, width=620, height=460)
+        painel_coropletico(dados, height=460, width=620)
 
     with Q2:
         def plot_chart(estadoIndex, df):
             estado = format_func_estado(estadoIndex)
 
-            valor = df.loc[(df['estado'] == estado), 'comparecimento_percentual(%)'].values[0]
+            valor = registro['comparecimento_percentual(%)']
             fig = go.Figure(
                 go.Indicator(
                     value=valor,
@@ -121,775 +101,774 @@ if ((dados == 'Estadual - 1º turno')
                             'font_size': 80, "valueformat": ".2f"},
                     align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+            return fig
 
-        plot_chart(estado, df)
+        mostra_figura(('comparecimento_estado', dados, estado), plot_chart, estado, df)
 
-    st.write('Divisão por sexo por estado')
-    Q3, Q4 = st.columns(2)
-    with Q3:
-        homens = df['eleitorado_masculino_percentual(%)']
-        mulheres = df['eleitorado_feminino_percentual(%)']
+    secao = escolhe_secao()
 
-        homens = homens.drop_duplicates()
-        mulheres = mulheres.drop_duplicates()
+    if secao == 'Sexo':
+        df = get_data(dados, 'sexo')
+        st.write('Divisão por sexo por estado')
+        Q3, Q4 = st.columns(2)
+        with Q3:
+            def monta():
+                homens = df['eleitorado_masculino_percentual(%)']
+                mulheres = df['eleitorado_feminino_percentual(%)']
+
+                homens = homens.drop_duplicates()
+                mulheres = mulheres.drop_duplicates()
+
+                estados = df['estado'].drop_duplicates()
+
+                fig = go.Figure()
+
+                fig.add_trace(go.Bar(y=estados, x=homens,
+                                     name='Homens',
+                                     hovertemplate='%{y} %{x:.2f}%',
+                                     marker_color='#355070',
+                                     orientation='h'))
+
+                fig.add_trace(go.Bar(y=estados,
+                                     x=mulheres,
+                                     hovertemplate='%{y} %{x:.2f}%',
+                                     marker_color='#FCC202',
+                                     name='Mulheres',
+                                     orientation='h'))
+
+                fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
+                                  title_font_size=22, barmode='relative',
+                                  hoverlabel=dict(bgcolor='#FFFFFF'),
+                                  template='simple_white',
+                                  bargap=0, bargroupgap=0,
+                                  margin=dict(l=1, r=1, t=60, b=1),
+                                  xaxis_range=[0, 100],
+                                  xaxis=dict(tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                                             ticktext=['0%', '10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%']))
 
-        estados = df['estado'].drop_duplicates()
+                fig.update_traces(width=0.5)
 
-        fig = go.Figure()
+                return fig
 
-        fig.add_trace(go.Bar(y=estados, x=homens,
-                             name='Homens',
-                             hovertemplate='%{y} %{x:.2f}%',
-                             marker_color='#355070',
-                             orientation='h'))
+            mostra_figura(('sexo_estados', dados), monta)
+    
+        with Q4:
+            #st.write('Divisão por sexo no estado selecionado')
+            def plot_chart(estadoIndex, df):
+                estado = format_func_estado(estadoIndex)
+                nomeEstado = [estado]
+            
+                homens = [registro['eleitorado_masculino_percentual(%)']]
+            
+                mulheres = [registro['eleitorado_feminino_percentual(%)']]
 
-        fig.add_trace(go.Bar(y=estados,
-                             x=mulheres,
-                             hovertemplate='%{y} %{x:.2f}%',
-                             marker_color='#FCC202',
-                             name='Mulheres',
-                             orientation='h'))
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
 
-        fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
-                          title_font_size=22, barmode='relative',
-                          hoverlabel=dict(bgcolor='#FFFFFF'),
-                          template='simple_white',
-                          bargap=0, bargroupgap=0,
-                          margin=dict(l=1, r=1, t=60, b=1),
-                          xaxis_range=[0, 100],
-                          xaxis=dict(tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                                     ticktext=['0%', '10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%']))
+                fig_sexoEstado = go.Figure()
+                fig_sexoEstado.add_trace(go.Bar(y=nomeEstado, x=homens,
+                                                   name='Homens',
+                                                   hovertemplate='Homens: %{x:.2f}%',
+                                                   marker_color='#355070',
+                                                   orientation='h'))
+
+                fig_sexoEstado.add_trace(go.Bar(y=nomeEstado, x=mulheres,
+                                                   hovertemplate='Mulheres: %{x:.2f}%',
+                                                   marker_color='#FCC202',
+                                                   name='Mulheres',
+                                                   orientation='h'))
+
+                fig_sexoEstado.update_layout(barmode='relative',
+                                                hoverlabel=dict(bgcolor='#FFFFFF'),
+                                                template='simple_white',
+                                                bargap=0, bargroupgap=0,
+                                                margin=dict(l=1, r=1, t=60, b=1),
+                                                xaxis_range=[0, 100],
+                                                xaxis=dict(
+                                                    tickvals=[0, 10, 20, 30, 40,
+                                                              50, 60, 70, 80, 90, 100],
+                                                    ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
+                                                              '60%', '70%', '80%', '90%', '100%']))
+
+                fig_sexoEstado.update_traces(width=0.5)
+                fig_sexoEstado.update_xaxes(ticksuffix="")
+                fig_sexoEstado.update_yaxes(ticksuffix="")
+                return fig_sexoEstado
+
+            mostra_figura(('sexo_estado', dados, estado), plot_chart, estado, df)
+
+    if secao == 'Estado civil':
+        df = get_data(dados, 'estado_civil')
+        st.write('Divisão por estado civil por estado')
+        Q80, Q81 = st.columns(2)
+        with Q80:
+            # Só este painel reroda quando o estado civil muda
+            @fragmento
+            def painel_estado_civil(dados):
+                df = get_data(dados, 'estado_civil')
+                estado_civil = st.selectbox(label='Selecione o estado civil',
+                             options=['solteiro', 'casado', 'divorciado', 
+                                      'viuvo', 'separado judicialmente'])
+        
+                if (estado_civil == 'separado judicialmente'):
+                    estado_civil = 'separado_judicialmente'
+                def monta():
+                    homens = df[estado_civil + '_masculino']
+                    mulheres = df[estado_civil + '_feminino']
+
+                    estados = df['estado'].drop_duplicates()
+
+                    fig = go.Figure()
+
+                    fig.add_trace(go.Bar(y=estados,
+                                         x=mulheres,
+                                         customdata=mulheres.astype('int'),
+                                         hovertemplate='%{y} %{customdata}',
+                                         marker_color='#FCC202',
+                                         name='Mulheres',
+                                         orientation='h'))
+
+                    fig.add_trace(go.Bar(y=estados, x=homens*-1,
+                                         name='Homens',
+                                         customdata=homens.astype('int'),
+                                         hovertemplate='%{y} %{customdata}',
+                                         marker_color='#355070',
+                                         orientation='h'))
+
+                    fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
+                                      title_font_size=22, barmode='relative',
+                                      hoverlabel=dict(bgcolor='#FFFFFF'),
+                                      template='simple_white',
+                                      bargap=0, bargroupgap=0,
+                                      margin=dict(l=1, r=1, t=60, b=1),
+                                      xaxis_range=[-8500000, 8500000], 
+                                      xaxis=dict(tickvals=[-8500000, -7000000, -5500000, -4000000, -2500000, 
+                                                   -1000000, 0, 1000000, 2500000, 4000000, 
+                                                   5500000, 7000000, 8500000],
+                                                 ticktext=['8500000', '7000000', '5500000', '4000000', '2500000', 
+                                                   '1000000', '0,' '1000000', '2500000', '4000000', 
+                                                   '5500000', '7000000', '8500000']),
+                                                 )
+
+                    fig.update_traces(width=0.5)
+                    return fig
+
+                mostra_figura(('estado_civil_estados', dados, estado_civil), monta)
+
+            painel_estado_civil(dados)
+
+        with Q81:
+            def plot_chart(estadoIndex, df):
+                estado = format_func_estado(estadoIndex)
+                nomeEstado = [estado]
+            
+                data = {
+                    'estado': [estado],
+                    'solteiro_masculino': [registro['solteiro_masculino'] * -1],
+                    'casado_masculino': [registro['casado_masculino'] * -1],
+                    'divorciado_masculino': [registro['divorciado_masculino'] * -1],
+                    'viuvo_masculino': [registro['viuvo_masculino'] * -1],
+                    'separado_judicialmente_masculino': [registro['separado_judicialmente_masculino'] * -1],
+                    'solteiro_feminino': [registro['solteiro_feminino']],
+                    'casado_feminino': [registro['casado_feminino']],
+                    'divorciado_feminino': [registro['divorciado_feminino']],
+                    'viuvo_feminino': [registro['viuvo_feminino']],
+                    'separado_judicialmente_feminino': [registro['separado_judicialmente_feminino']],
+                    }
+
+                df = pd.DataFrame(data)
+                fig = go.Figure()
+
+                fig.add_trace(go.Bar(
+                    y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
+                    x=df[['separado_judicialmente_masculino', 'divorciado_masculino', 'solteiro_masculino', 'casado_masculino', 'viuvo_masculino']].iloc[0],
+                    orientation='h',
+                    name='Homens',
+                    hoverinfo='x+text',
+                    marker=dict(color=['#355070', '#355070', '#355070', '#355070', '#355070']),
+                ))
+
+                # Adicionar barras correspondentes para mulheres
+                fig.add_trace(go.Bar(
+                    y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
+                    x=df[['separado_judicialmente_feminino', 'divorciado_feminino', 'solteiro_feminino', 'casado_feminino', 'viuvo_feminino',]].iloc[0],
+                    orientation='h',
+                    name='Mulheres',
+                    hoverinfo='x+text',
+                    marker=dict(color=['#FCC202', '#FCC202', '#FCC202', '#FCC202', '#FCC202']),
+                ))
+
+                # Atualizar layout e mostrar a figura
+                fig.update_layout(barmode='relative', title='', plot_bgcolor="rgba(0,0,0,0)",
+                              hoverlabel=dict(bgcolor='#FFFFFF'),
+                              template='simple_white',
+                              bargap=0, bargroupgap=0,
+                              margin=dict(l=1, r=1, t=60, b=1),
+                              xaxis_range=[df['solteiro_masculino'].values[0] - 50000, -df['solteiro_masculino'].values[0]+ 50000], 
+                               xaxis=dict(tickvals=[df['solteiro_masculino'].values[0] - 50000, df['solteiro_masculino'].values[0] / 2, 0 , -df['solteiro_masculino'].values[0]/ 2, -df['solteiro_masculino'].values[0]+ 50000],
+                                          ),
+                                         )
+                fig.update_traces(width=0.5)
+                fig.update_xaxes(ticksuffix="")
+                fig.update_yaxes(ticksuffix="")
+                return fig
 
-        fig.update_traces(width=0.5)
+            mostra_figura(('estado_civil_estado', dados, estado), plot_chart, estado, df)
 
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with Q4:
-        #st.write('Divisão por sexo no estado selecionado')
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            nomeEstado = [df.loc[(df['estado'] == estado, 'estado')].values[0]]
-            
-            homens = [df.loc[(df['estado'] == estado), 
-                'eleitorado_masculino_percentual(%)'].values[0]]
-            
-            mulheres = [df.loc[(df['estado'] == estado), 
-                'eleitorado_feminino_percentual(%)'].values[0]]
+    if secao == 'Escolaridade':
+        df = get_data(dados, 'escolaridade')
+        st.write('Divisão por escolaridade por estado')
+        Q5, Q6 = st.columns(2)
 
-            my_layout = Layout(hoverlabel=dict(
-                bgcolor='#FFFFFF'), template='simple_white')
+        with Q5:
+            def monta():
+                escolaridade_percentual = df[['estado', 'analfabeto_percentual(%)', 'le_escreve_percentual(%)',
+                'fundamental_incompleto_percentual(%)', 'fundamental_completo_percentual(%)', 'medio_incompleto_percentual(%)',
+                'medio_completo_percentual(%)', 
+                'superior_incompleto_percentual(%)', 'superior_completo_percentual(%)']].iloc[get_top(dados, 'superior_completo_percentual(%)')]
+        
+                x1 = escolaridade_percentual['estado'] 
+                analfabeto = escolaridade_percentual['analfabeto_percentual(%)'] 
+                le_escreve = escolaridade_percentual['le_escreve_percentual(%)']
+                fundamental_incompleto = escolaridade_percentual['fundamental_incompleto_percentual(%)']
+                fundamental_completo = escolaridade_percentual['fundamental_completo_percentual(%)']
+                medio_incompleto = escolaridade_percentual['medio_incompleto_percentual(%)']
+                medio_completo = escolaridade_percentual['medio_completo_percentual(%)']
+                superior_incompleto = escolaridade_percentual['superior_incompleto_percentual(%)']
+                superior_completo = escolaridade_percentual['superior_completo_percentual(%)']
+
+                my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template = 'simple_white')
 
-            fig_sexoEstado = go.Figure()
-            fig_sexoEstado.add_trace(go.Bar(y=nomeEstado, x=homens,
-                                               name='Homens',
-                                               hovertemplate='Homens: %{x:.2f}%',
-                                               marker_color='#355070',
-                                               orientation='h'))
+                fig = go.Figure(data=[
+                    go.Bar(name='Analfabeto',x= x1, y=analfabeto, hovertemplate = 'Analfabeto: %{y:.2f}%', marker_color='#355070', showlegend = False),
+                    go.Bar(name='Lê e escreve', x=x1, y=le_escreve, hovertemplate = 'Lê e escreve: %{y:.2f}%', marker_color= '#597092', showlegend = False),
+                    go.Bar(name='Fundamental incompleto', x= x1, y=fundamental_incompleto, hovertemplate = 'Fundamental incompleto %{y:.2f}%', marker_color='#7179E6', showlegend = False),
+                    go.Bar(name='Fundamental completo', x=x1, y=fundamental_completo, hovertemplate = 'Fundamental completo %{y:.2f}%', marker_color= '#DEE0FC', showlegend = False),
+                    go.Bar(name='Médio incompleto', x= x1, y=medio_incompleto, hovertemplate = 'Médio incompleto: %{y:.2f}%', marker_color='#E9DEFC', showlegend = False),
+                    go.Bar(name='Médio completo', x=x1, y=medio_completo, hovertemplate = 'Médio completo: %{y:.2f}%', marker_color= '#FEE592', showlegend = False),
+                    go.Bar(name='Superior incompleto', x= x1, y=superior_incompleto, hovertemplate = 'Superior incompleto: %{y:.2f}%', marker_color='#E6DD39', showlegend = False),
+                    go.Bar(name='Superior completo', x=x1, y=superior_completo, hovertemplate = 'Superior completo: %{y:.2f}%', marker_color= '#FCC202', showlegend = False)
+                ], layout = my_layout)
 
-            fig_sexoEstado.add_trace(go.Bar(y=nomeEstado, x=mulheres,
-                                               hovertemplate='Mulheres: %{x:.2f}%',
-                                               marker_color='#FCC202',
-                                               name='Mulheres',
-                                               orientation='h'))
+                fig.update_layout(
+                xaxis=dict(
+                    rangeslider=dict(
+                    visible=True
+                    ),
+                ),
+                barmode='stack',
+                yaxis_range=[0,100],
+                yaxis = dict(
+                    tickvals = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                    ticktext = ['0%', '10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%'])
+                )
 
-            fig_sexoEstado.update_layout(barmode='relative',
-                                            hoverlabel=dict(bgcolor='#FFFFFF'),
-                                            template='simple_white',
-                                            bargap=0, bargroupgap=0,
-                                            margin=dict(l=1, r=1, t=60, b=1),
-                                            xaxis_range=[0, 100],
-                                            xaxis=dict(
-                                                tickvals=[0, 10, 20, 30, 40,
-                                                          50, 60, 70, 80, 90, 100],
-                                                ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
-                                                          '60%', '70%', '80%', '90%', '100%']))
+                fig.update_xaxes(ticksuffix = "")
+                fig.update_yaxes(ticksuffix = "")
+
+                return fig
+
+            mostra_figura(('escolaridade_estados', dados), monta)
+
+            with Q6:
+                #ESCOLARIDADE POR ESTADO
+                # st.write('Divisão por escolaridade por estado')
+
+                def plot_chart(estadoIndex, df):
+
+                    estado = format_func_estado(estadoIndex)
+                    nomeEstado = [estado]
+
+                    analfabeto = [registro['analfabeto_percentual(%)']]
+                    le_escreve = [registro['le_escreve_percentual(%)']]
+                    fundamental_incompleto = [registro['fundamental_incompleto_percentual(%)']]
+                    fundamental_completo = [registro['fundamental_completo_percentual(%)']]
+                    medio_incompleto = [registro['medio_incompleto_percentual(%)']]
+                    medio_completo = [registro['medio_completo_percentual(%)']]
+                    superior_incompleto = [registro['superior_incompleto_percentual(%)']]
+                    superior_completo = [registro['superior_completo_percentual(%)']]
+
+                    my_layout = Layout(hoverlabel=dict(
+                        bgcolor='#FFFFFF'), template='simple_white')
+
+                    fig = go.Figure(data=[
+                        go.Bar(name='Analfabeto', x=nomeEstado, y=analfabeto,
+                            hovertemplate='Analfabeto: {}%'.format(
+                            str(analfabeto[0]).replace('.', ',')), marker_color='#355070', showlegend=True),
+                        go.Bar(name='Lê e escreve', x=nomeEstado, y=le_escreve,
+                            hovertemplate='Lê e escreve: {}%'.format(
+                        str(le_escreve[0]).replace('.', ',')), marker_color='#597092', showlegend=True),
+                        go.Bar(name='Fundamental incompleto', x=nomeEstado, y=fundamental_incompleto,
+                            hovertemplate='Fundamental incompleto: {}%'.format(
+                        str(fundamental_incompleto[0]).replace('.', ',')), marker_color='#7179E6', showlegend=True),
+                        go.Bar(name='Fundamental completo', x=nomeEstado, y=fundamental_completo,
+                            hovertemplate='Fundamental completo: {}%'.format(
+                        str(fundamental_completo[0]).replace('.', ',')), marker_color='#DEE0FC', showlegend=True),
+                        go.Bar(name='Médio incompleto', x=nomeEstado, y=medio_incompleto,
+                            hovertemplate='Médio incompleto: {}%'.format(
+                        str(medio_incompleto[0]).replace('.', ',')), marker_color='#E9DEFC', showlegend=True),
+                        go.Bar(name='Médio completo', x=nomeEstado, y=medio_completo,
+                            hovertemplate='Médio completo: {}%'.format(
+                        str(medio_completo[0]).replace('.', ',')), marker_color='#FEE592', showlegend=True),
+                        go.Bar(name='Superior incompleto', x=nomeEstado, y=superior_incompleto,
+                            hovertemplate='Superior incompleto: {}%'.format(
+                        str(superior_incompleto[0]).replace('.', ',')), marker_color='#E6DD39', showlegend=True),
+                        go.Bar(name='Superior completo', x=nomeEstado, y=superior_completo,
+                            hovertemplate='Superior completo: {}%'.format(
+                        str(superior_completo[0]).replace('.', ',')), marker_color='#FCC202', showlegend=True)
+                    ], layout=my_layout)
+
+                    fig.update_layout(
+                        barmode='stack',
+                        bargap=0, bargroupgap=0,
+                        margin=dict(l=1, r=1, t=1, b=1),
+                        yaxis_range=[0, 100],
+                        yaxis=dict(
+                            tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                            ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
+                                    '60%', '70%', '80%', '90%', '100%']
+                        )
+                    )
 
-            fig_sexoEstado.update_traces(width=0.5)
-            fig_sexoEstado.update_xaxes(ticksuffix="")
-            fig_sexoEstado.update_yaxes(ticksuffix="")
-            st.plotly_chart(fig_sexoEstado, use_container_width=True)
+                    fig.update_traces(width=0.5)
+                    fig.update_xaxes(ticksuffix="")
+                    fig.update_yaxes(ticksuffix="")
+                    return fig
 
-        plot_chart(estado, df)
+                mostra_figura(('escolaridade_estado', dados, estado), plot_chart, estado, df)
 
-    st.write('Divisão por estado civil por estado')
-    Q80, Q81 = st.columns(2)
-    with Q80:
-        estado_civil = st.selectbox(label='Selecione o estado civil',
-                     options=['solteiro', 'casado', 'divorciado', 
-                              'viuvo', 'separado judicialmente'])
-        
-        if (estado_civil == 'separado judicialmente'):
-            estado_civil = 'separado_judicialmente'
-        homens = df[estado_civil + '_masculino']
-        mulheres = df[estado_civil + '_feminino']
-
-        estados = df['estado'].drop_duplicates()
-
-        fig = go.Figure()
-
-        fig.add_trace(go.Bar(y=estados,
-                             x=mulheres,
-                             customdata=mulheres.astype('int'),
-                             hovertemplate='%{y} %{customdata}',
-                             marker_color='#FCC202',
-                             name='Mulheres',
-                             orientation='h'))
-
-        fig.add_trace(go.Bar(y=estados, x=homens*-1,
-                             name='Homens',
-                             customdata=homens.astype('int'),
-                             hovertemplate='%{y} %{customdata}',
-                             marker_color='#355070',
-                             orientation='h'))
-
-        fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
-                          title_font_size=22, barmode='relative',
-                          hoverlabel=dict(bgcolor='#FFFFFF'),
-                          template='simple_white',
-                          bargap=0, bargroupgap=0,
-                          margin=dict(l=1, r=1, t=60, b=1),
-                          xaxis_range=[-8500000, 8500000], 
-                          xaxis=dict(tickvals=[-8500000, -7000000, -5500000, -4000000, -2500000, 
-                                       -1000000, 0, 1000000, 2500000, 4000000, 
-                                       5500000, 7000000, 8500000],
-                                     ticktext=['8500000', '7000000', '5500000', '4000000', '2500000', 
-                                       '1000000', '0,' '1000000', '2500000', '4000000', 
-                                       '5500000', '7000000', '8500000']),
-                                     )
-
-        fig.update_traces(width=0.5)
-        st.plotly_chart(fig, use_container_width=True)
-
-    with Q81:
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            nomeEstado = [df.loc[(df['estado'] == estado, 'estado')].values[0]]
-            
-            data = {
-                'estado': [estado],
-                'solteiro_masculino': [df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0] * -1],
-                'casado_masculino': [df.loc[(df['estado'] == estado), 
-                  'casado_masculino'].values[0] * -1],
-                'divorciado_masculino': [df.loc[(df['estado'] == estado), 
-                  'divorciado_masculino'].values[0] * -1],
-                'viuvo_masculino': [df.loc[(df['estado'] == estado), 
-                  'viuvo_masculino'].values[0] * -1],
-                'separado_judicialmente_masculino': [df.loc[(df['estado'] == estado), 
-                  'separado_judicialmente_masculino'].values[0] * -1],
-                'solteiro_feminino': [df.loc[(df['estado'] == estado), 
-                  'solteiro_feminino'].values[0]],
-                'casado_feminino': [df.loc[(df['estado'] == estado), 
-                  'casado_feminino'].values[0]],
-                'divorciado_feminino': [df.loc[(df['estado'] == estado), 
-                  'divorciado_feminino'].values[0]],
-                'viuvo_feminino': [df.loc[(df['estado'] == estado), 
-                  'viuvo_feminino'].values[0]],
-                'separado_judicialmente_feminino': [df.loc[(df['estado'] == estado), 
-                  'separado_judicialmente_feminino'].values[0]],
-                }
-
-            df = pd.DataFrame(data)
-            fig = go.Figure()
-
-            fig.add_trace(go.Bar(
-                y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
-                x=df[['separado_judicialmente_masculino', 'divorciado_masculino', 'solteiro_masculino', 'casado_masculino', 'viuvo_masculino']].iloc[0],
-                orientation='h',
-                name='Homens',
-                hoverinfo='x+text',
-                marker=dict(color=['#355070', '#355070', '#355070', '#355070', '#355070']),
-            ))
-
-            # Adicionar barras correspondentes para mulheres
-            fig.add_trace(go.Bar(
-                y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
-                x=df[['separado_judicialmente_feminino', 'divorciado_feminino', 'solteiro_feminino', 'casado_feminino', 'viuvo_feminino',]].iloc[0],
-                orientation='h',
-                name='Mulheres',
-                hoverinfo='x+text',
-                marker=dict(color=['#FCC202', '#FCC202', '#FCC202', '#FCC202', '#FCC202']),
-            ))
-
-            # Atualizar layout e mostrar a figura
-            fig.update_layout(barmode='relative', title='', plot_bgcolor="rgba(0,0,0,0)",
-                          hoverlabel=dict(bgcolor='#FFFFFF'),
-                          template='simple_white',
-                          bargap=0, bargroupgap=0,
-                          margin=dict(l=1, r=1, t=60, b=1),
-                          xaxis_range=[df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0] - 50000, -df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0]+ 50000], 
-                           xaxis=dict(tickvals=[df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0] - 50000, df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0] / 2, 0 , -df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0]/ 2, -df.loc[(df['estado'] == estado), 
-                  'solteiro_masculino'].values[0]+ 50000],
-                                      ),
-                                     )
-            fig.update_traces(width=0.5)
-            fig.update_xaxes(ticksuffix="")
-            fig.update_yaxes(ticksuffix="")
-            st.plotly_chart(fig, use_container_width=True)
+    if secao == 'Analfabetos':
+        df = get_data(dados, 'analfabetos')
+        st.write('Estados com mais eleitores analfabetos')
+        Q7, Q8 = st.columns(2)
 
-        plot_chart(estado, df)
-        
-    st.write('Divisão por escolaridade por estado')
-    Q5, Q6 = st.columns(2)
+        with Q7:
+            def monta():
+                top_10_analfabetos = df[['estado', 'analfabeto']].iloc[
+                    get_top(dados, 'analfabeto')]
 
-    with Q5:
-        escolaridade_percentual = df[['estado', 'analfabeto_percentual(%)', 'le_escreve_percentual(%)',
-        'fundamental_incompleto_percentual(%)', 'fundamental_completo_percentual(%)', 'medio_incompleto_percentual(%)',
-        'medio_completo_percentual(%)', 
-        'superior_incompleto_percentual(%)', 'superior_completo_percentual(%)']].sort_values(by = 'superior_completo_percentual(%)', ascending = False)[:10]
-        
-        x1 = escolaridade_percentual['estado'] 
-        analfabeto = escolaridade_percentual['analfabeto_percentual(%)'] 
-        le_escreve = escolaridade_percentual['le_escreve_percentual(%)']
-        fundamental_incompleto = escolaridade_percentual['fundamental_incompleto_percentual(%)']
-        fundamental_completo = escolaridade_percentual['fundamental_completo_percentual(%)']
-        medio_incompleto = escolaridade_percentual['medio_incompleto_percentual(%)']
-        medio_completo = escolaridade_percentual['medio_completo_percentual(%)']
-        superior_incompleto = escolaridade_percentual['superior_incompleto_percentual(%)']
-        superior_completo = escolaridade_percentual['superior_completo_percentual(%)']
-
-        my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template = 'simple_white')
-
-        fig = go.Figure(data=[
-            go.Bar(name='Analfabeto',x= x1, y=analfabeto, hovertemplate = 'Analfabeto: %{y:.2f}%', marker_color='#355070', showlegend = False),
-            go.Bar(name='Lê e escreve', x=x1, y=le_escreve, hovertemplate = 'Lê e escreve: %{y:.2f}%', marker_color= '#597092', showlegend = False),
-            go.Bar(name='Fundamental incompleto', x= x1, y=fundamental_incompleto, hovertemplate = 'Fundamental incompleto %{y:.2f}%', marker_color='#7179E6', showlegend = False),
-            go.Bar(name='Fundamental completo', x=x1, y=fundamental_completo, hovertemplate = 'Fundamental completo %{y:.2f}%', marker_color= '#DEE0FC', showlegend = False),
-            go.Bar(name='Médio incompleto', x= x1, y=medio_incompleto, hovertemplate = 'Médio incompleto: %{y:.2f}%', marker_color='#E9DEFC', showlegend = False),
-            go.Bar(name='Médio completo', x=x1, y=medio_completo, hovertemplate = 'Médio completo: %{y:.2f}%', marker_color= '#FEE592', showlegend = False),
-            go.Bar(name='Superior incompleto', x= x1, y=superior_incompleto, hovertemplate = 'Superior incompleto: %{y:.2f}%', marker_color='#E6DD39', showlegend = False),
-            go.Bar(name='Superior completo', x=x1, y=superior_completo, hovertemplate = 'Superior completo: %{y:.2f}%', marker_color= '#FCC202', showlegend = False)
-        ], layout = my_layout)
-
-        fig.update_layout(
-        xaxis=dict(
-            rangeslider=dict(
-            visible=True
-            ),
-        ),
-        barmode='stack',
-        yaxis_range=[0,100],
-        yaxis = dict(
-            tickvals = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-            ticktext = ['0%', '10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%'])
-        )
-
-        fig.update_xaxes(ticksuffix = "")
-        fig.update_yaxes(ticksuffix = "")
-
-        st.plotly_chart(fig, use_container_width=True)
-
-        with Q6:
-            #ESCOLARIDADE POR ESTADO
-            # st.write('Divisão por escolaridade por estado')
+                x1 = top_10_analfabetos['estado']
+                analfabeto = top_10_analfabetos['analfabeto']
 
-            def plot_chart(estadoIndex, df):
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
+
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
+
+                fig_analfabetos = go.Figure(data=[
+                    go.Bar(name='', x=x1, y=analfabeto, hovertemplate=' ',
+                           text=analfabeto, 
+                           textposition='outside',
+                           marker_color=colors, showlegend=False)],
+                    layout=my_layout)
+                if (dados == 'Estadual - 1º turno'):
+                    fig_analfabetos.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis_range=[0, 850000],
+                        yaxis=dict(
+                            tickvals=[0, 100000, 200000, 300000, 400000,
+                                      500000, 600000, 700000, 800000, ],
+                            ticktext=['0', '100 mil', '200 mil', '300 mil', '400 mil', '500 mil', '600 mil', '700 mil', '800 mil'])
+                    )
+                else:
+                    fig_analfabetos.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis_range=[0, 300000],
+                        yaxis=dict(
+                            tickvals=[0, 50000, 100000, 150000,
+                                      200000, 250000, 300000],
+                            ticktext=['0', '50 mil', '100 mil', '150 mil',
+                                      '200 mil', '250 mil', '300 mil'])
+                    )
+
+                return fig_analfabetos
+
+            mostra_figura(('top_analfabetos', dados), monta)
 
+        with Q8:
+            def plot_chart(estadoIndex, df):
                 estado = format_func_estado(estadoIndex)
-                nomeEstado = [df.loc[(df['estado'] == estado, 'estado')].values[0]]
-
-                analfabeto = [df.loc[(df['estado'] == estado), 'analfabeto_percentual(%)'].values[0]]
-                le_escreve = [df.loc[(df['estado'] == estado), 'le_escreve_percentual(%)'].values[0]]
-                fundamental_incompleto = [df.loc[(df['estado'] == estado), 
-                    'fundamental_incompleto_percentual(%)'].values[0]]
-                fundamental_completo = [df.loc[(df['estado'] == estado), 
-                    'fundamental_completo_percentual(%)'].values[0]]
-                medio_incompleto = [df.loc[(df['estado'] == estado), 'medio_incompleto_percentual(%)'].values[0]]
-                medio_completo = [df.loc[(df['estado'] == estado), 
-                    'medio_completo_percentual(%)'].values[0]]
-                superior_incompleto = [df.loc[(df['estado'] == estado), 
-                    'superior_incompleto_percentual(%)'].values[0]]
-                superior_completo = [df.loc[(df['estado'] == estado), 
-                    'superior_completo_percentual(%)'].values[0]]
+                valor = registro['analfabeto']
+            
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Número de eleitores analfabetos em {estado}"},
+                        number={'font_color': '#355070',
+                                'font_size': 80, "valueformat": ".0f"},
+                        align='center'))
+
+                return fig
+
+            mostra_figura(('analfabetos_estado', dados, estado), plot_chart, estado, df)
+    
+        st.write('Estados com maior percentual de eleitores analfabetos')
+        Q9, Q10 = st.columns(2)
+        with Q9:
+            def monta():
+                top_10_analfabetos_percentual = df[['estado', 'analfabeto_percentual(%)']].iloc[
+                    get_top(dados, 'analfabeto_percentual(%)')]
+
+                x1 = top_10_analfabetos_percentual['analfabeto_percentual(%)']
+                analfabeto = top_10_analfabetos_percentual['estado']
+
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                        '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
 
                 my_layout = Layout(hoverlabel=dict(
                     bgcolor='#FFFFFF'), template='simple_white')
 
-                fig = go.Figure(data=[
-                    go.Bar(name='Analfabeto', x=nomeEstado, y=analfabeto,
-                        hovertemplate='Analfabeto: {}%'.format(
-                        str(analfabeto[0]).replace('.', ',')), marker_color='#355070', showlegend=True),
-                    go.Bar(name='Lê e escreve', x=nomeEstado, y=le_escreve,
-                        hovertemplate='Lê e escreve: {}%'.format(
-                    str(le_escreve[0]).replace('.', ',')), marker_color='#597092', showlegend=True),
-                    go.Bar(name='Fundamental incompleto', x=nomeEstado, y=fundamental_incompleto,
-                        hovertemplate='Fundamental incompleto: {}%'.format(
-                    str(fundamental_incompleto[0]).replace('.', ',')), marker_color='#7179E6', showlegend=True),
-                    go.Bar(name='Fundamental completo', x=nomeEstado, y=fundamental_completo,
-                        hovertemplate='Fundamental completo: {}%'.format(
-                    str(fundamental_completo[0]).replace('.', ',')), marker_color='#DEE0FC', showlegend=True),
-                    go.Bar(name='Médio incompleto', x=nomeEstado, y=medio_incompleto,
-                        hovertemplate='Médio incompleto: {}%'.format(
-                    str(medio_incompleto[0]).replace('.', ',')), marker_color='#E9DEFC', showlegend=True),
-                    go.Bar(name='Médio completo', x=nomeEstado, y=medio_completo,
-                        hovertemplate='Médio completo: {}%'.format(
-                    str(medio_completo[0]).replace('.', ',')), marker_color='#FEE592', showlegend=True),
-                    go.Bar(name='Superior incompleto', x=nomeEstado, y=superior_incompleto,
-                        hovertemplate='Superior incompleto: {}%'.format(
-                    str(superior_incompleto[0]).replace('.', ',')), marker_color='#E6DD39', showlegend=True),
-                    go.Bar(name='Superior completo', x=nomeEstado, y=superior_completo,
-                        hovertemplate='Superior completo: {}%'.format(
-                    str(superior_completo[0]).replace('.', ',')), marker_color='#FCC202', showlegend=True)
-                ], layout=my_layout)
+                fig_percentual_analfabetos = go.Figure(data=[
+                    go.Bar(name='', x=x1, y=analfabeto, 
+                        hovertemplate=[f"{percent:.2f}%" for percent in x1],
+                        text=[f"{percent:.2f}%" for percent in x1], 
+                        textposition='outside', 
+                        marker_color=colors, showlegend=False,
+                        orientation='h',)], layout=my_layout)
 
-                fig.update_layout(
-                    barmode='stack',
-                    bargap=0, bargroupgap=0,
-                    margin=dict(l=1, r=1, t=1, b=1),
-                    yaxis_range=[0, 100],
-                    yaxis=dict(
-                        tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                        ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
-                                '60%', '70%', '80%', '90%', '100%']
-                    )
+                fig_percentual_analfabetos.update_layout(
+                    xaxis_range=[0, 100]
                 )
 
-                fig.update_traces(width=0.5)
-                fig.update_xaxes(ticksuffix="")
-                fig.update_yaxes(ticksuffix="")
-                st.plotly_chart(fig, use_container_width=True)
+                fig_percentual_analfabetos.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis=dict(
+                        showgrid=False,
+                        zeroline=False,
+                        tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                        ticktext=['0%', '10%', '20%', '30%', '40%', '50%', 
+                            '60%', '70%', '80%', '90%', '100%']),
+                    yaxis=dict(showgrid=False, zeroline=False, autorange="reversed"))
 
-            plot_chart(estado, df)
+                return fig_percentual_analfabetos
 
-    st.write('Estados com mais eleitores analfabetos')
-    Q7, Q8 = st.columns(2)
+            mostra_figura(('top_analfabetos_percentual', dados), monta)
+        with Q10:
+            def plot_chart(estadoIndex, df):
+                estado = format_func_estado(estadoIndex)
+                valor = registro['analfabeto_percentual(%)']
+            
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Percentual de eleitores analfabetos em {estado}"},
+                        number={'font_color': '#355070', 'suffix':'%',
+                                'font_size': 80, "valueformat": ".2f"},
+                        align='center'))
 
-    with Q7:
-        top_10_analfabetos = df[['estado', 'analfabeto']].sort_values(
-            by='analfabeto', ascending=False)[:10]
+                return fig
 
-        x1 = top_10_analfabetos['estado']
-        analfabeto = top_10_analfabetos['analfabeto']
+            mostra_figura(('analfabetos_percentual_estado', dados, estado), plot_chart, estado, df)
 
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
-                  '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
+    if secao == 'Deficiência':
+        df = get_data(dados, 'deficiencia')
+        st.write('Estados com mais eleitores com deficiência')
+        Q11, Q12 = st.columns(2)
 
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
+        with Q11:
+            def monta():
+                top_10_deficiencia = df[['estado', 'eleitores_deficiencia']].iloc[
+                    get_top(dados, 'eleitores_deficiencia')].reset_index()
 
-        fig_analfabetos = go.Figure(data=[
-            go.Bar(name='', x=x1, y=analfabeto, hovertemplate=' ',
-                   text=analfabeto, 
-                   textposition='outside',
-                   marker_color=colors, showlegend=False)],
-            layout=my_layout)
-        if (dados == 'Estadual - 1º turno'):
-            fig_analfabetos.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis_range=[0, 850000],
-                yaxis=dict(
-                    tickvals=[0, 100000, 200000, 300000, 400000,
-                              500000, 600000, 700000, 800000, ],
-                    ticktext=['0', '100 mil', '200 mil', '300 mil', '400 mil', '500 mil', '600 mil', '700 mil', '800 mil'])
-            )
-        else:
-            fig_analfabetos.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis_range=[0, 300000],
-                yaxis=dict(
-                    tickvals=[0, 50000, 100000, 150000,
-                              200000, 250000, 300000],
-                    ticktext=['0', '50 mil', '100 mil', '150 mil',
-                              '200 mil', '250 mil', '300 mil'])
-            )
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
 
-        st.plotly_chart(fig_analfabetos, use_container_width=True)
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
 
-    with Q8:
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            valor = df.loc[(df['estado'] == estado), 'analfabeto'].values[0]
+                fig_deficientes = go.Figure(layout=my_layout)
+                fig_deficientes.update_xaxes(title_text=' ')
+                fig_deficientes.update_yaxes(title_text=' ')
+                fig_deficientes.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis=dict(
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                    ),
+                    yaxis=dict(
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                        tickvals=[0, 50000, 100000, 150000, 200000,
+                                  250000, 300000, 350000, 400000, 450000],
+                        ticktext=['0', '50 mil', '100 mil', '150 mil',
+                                  '200 mil', '250 mil', '300 mil', '350 mil', '400 mil', '450 mil']
+                    ))
+
+                # pontos
+                fig_deficientes.add_trace(
+                    go.Scatter(
+                        x=top_10_deficiencia["estado"],
+                        y=top_10_deficiencia["eleitores_deficiencia"],
+                        mode='markers+text',
+                        name='',
+                        text=top_10_deficiencia["eleitores_deficiencia"],
+                        textposition='top center',
+                        hovertemplate='%{y}',
+                        marker_color=colors,
+                        marker_size=25))
+                # linhas
+                for i, v in top_10_deficiencia["eleitores_deficiencia"].items():
+                    fig_deficientes.add_shape(
+                        type='line',
+                        x0=i, y0=0,
+                        x1=i,
+                        y1=v,
+                        line=dict(color=colors[i], width=10))
+
+                return fig_deficientes
+
+            mostra_figura(('top_deficiencia', dados), monta)
+
+        with Q12:
+            def plot_chart(estadoIndex, df):
+                estado = format_func_estado(estadoIndex)
+                valor = registro['eleitores_deficiencia']
             
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Número de eleitores analfabetos em {estado}"},
-                    number={'font_color': '#355070',
-                            'font_size': 80, "valueformat": ".0f"},
-                    align='center'))
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Número de eleitores com deficiência em {estado}"},
+                        number={'font_color': '#355070', 
+                                'font_size': 80, "valueformat": ".0f"},
+                        align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+                return fig
 
-        plot_chart(estado, df)
-    
-    st.write('Estados com maior percentual de eleitores analfabetos')
-    Q9, Q10 = st.columns(2)
-    with Q9:
-        top_10_analfabetos_percentual = df[['estado', 'analfabeto_percentual(%)']].sort_values(
-            by='analfabeto_percentual(%)', ascending=False)[:10]
-
-        x1 = top_10_analfabetos_percentual['analfabeto_percentual(%)']
-        analfabeto = top_10_analfabetos_percentual['estado']
-
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
-                '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
-
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-
-        fig_percentual_analfabetos = go.Figure(data=[
-            go.Bar(name='', x=x1, y=analfabeto, 
-                hovertemplate=[f"{percent:.2f}%" for percent in x1],
-                text=[f"{percent:.2f}%" for percent in x1], 
-                textposition='outside', 
-                marker_color=colors, showlegend=False,
-                orientation='h',)], layout=my_layout)
-
-        fig_percentual_analfabetos.update_layout(
-            xaxis_range=[0, 100]
-        )
-
-        fig_percentual_analfabetos.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                showgrid=False,
-                zeroline=False,
-                tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                ticktext=['0%', '10%', '20%', '30%', '40%', '50%', 
-                    '60%', '70%', '80%', '90%', '100%']),
-            yaxis=dict(showgrid=False, zeroline=False, autorange="reversed"))
-
-        st.plotly_chart(fig_percentual_analfabetos, use_container_width=True)
-    with Q10:
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            valor = df.loc[(df['estado'] == estado), 'analfabeto_percentual(%)'].values[0]
-            
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Percentual de eleitores analfabetos em {estado}"},
-                    number={'font_color': '#355070', 'suffix':'%',
-                            'font_size': 80, "valueformat": ".2f"},
-                    align='center'))
+            mostra_figura(('deficiencia_estado', dados, estado), plot_chart, estado, df)
 
-            st.plotly_chart(fig, use_container_width=True)
+        st.write('Estados com maior percentual de eleitores com deficiência')
+        Q13, Q14 = st.columns(2)
 
-        plot_chart(estado, df)
-    
-    st.write('Estados com mais eleitores com deficiência')
-    Q11, Q12 = st.columns(2)
-
-    with Q11:
-        top_10_deficiencia = df[['estado', 'eleitores_deficiencia']].sort_values(
-            by='eleitores_deficiencia', ascending=False)[:10].reset_index()
-
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
-                  '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
-
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-
-        fig_deficientes = go.Figure(layout=my_layout)
-        fig_deficientes.update_xaxes(title_text=' ')
-        fig_deficientes.update_yaxes(title_text=' ')
-        fig_deficientes.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-            ),
-            yaxis=dict(
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-                tickvals=[0, 50000, 100000, 150000, 200000,
-                          250000, 300000, 350000, 400000, 450000],
-                ticktext=['0', '50 mil', '100 mil', '150 mil',
-                          '200 mil', '250 mil', '300 mil', '350 mil', '400 mil', '450 mil']
-            ))
-
-        # pontos
-        fig_deficientes.add_trace(
-            go.Scatter(
-                x=top_10_deficiencia["estado"],
-                y=top_10_deficiencia["eleitores_deficiencia"],
-                mode='markers+text',
-                name='',
-                text=top_10_deficiencia["eleitores_deficiencia"],
-                textposition='top center',
-                hovertemplate='%{y}',
-                marker_color=colors,
-                marker_size=25))
-        # linhas
-        for i, v in top_10_deficiencia["eleitores_deficiencia"].items():
-            fig_deficientes.add_shape(
-                type='line',
-                x0=i, y0=0,
-                x1=i,
-                y1=v,
-                line=dict(color=colors[i], width=10))
-
-        st.plotly_chart(fig_deficientes, use_container_width=True)
-
-    with Q12:
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            valor = df.loc[(df['estado'] == estado), 'eleitores_deficiencia'].values[0]
+        with Q13:
+            def monta():
+                top_10_deficiencia_percentual = df[['estado', 'eleitores_deficiencia_percentual(%)']].iloc[
+                    get_top(dados, 'eleitores_deficiencia_percentual(%)')].reset_index()
+
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
+
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
+        
+                fig_percentual_deficientes = go.Figure(layout=my_layout)
+                fig_percentual_deficientes.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis_range=[0, 100],
+                    xaxis=dict(
+                        ticks="outside",
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                        tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                        ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
+                                '60%', '70%', '80%', '90%', '100%']),
+                    yaxis=dict(
+                        ticks="outside",
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                        autorange="reversed"))
+
+                # pontos
+                fig_percentual_deficientes.add_trace(
+                    go.Scatter(
+                        x=top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"],
+                        y=top_10_deficiencia_percentual["estado"],
+                        mode='markers+text',
+                        name='',
+                        text=[f"{percent:.2f}%" for percent in top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"]],
+                        textposition='middle right',
+                        hovertemplate=[
+                            f"{percent:.2f}%" for percent in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)']],
+                        marker_color=colors,
+                        marker_size=20))
+                # linhas
+                for i, v in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)'].items():
+                    fig_percentual_deficientes.add_shape(
+                        type='line',
+                        x0=0, y0=i,
+                        x1=v,
+                        y1=i,
+                        line=dict(color=colors[i], width=8))
+
+                return fig_percentual_deficientes
+
+            mostra_figura(('top_deficiencia_percentual', dados), monta)
+
+        with Q14:
+            def plot_chart(estadoIndex, df):
+                estado = format_func_estado(estadoIndex)
+                valor = registro['eleitores_deficiencia_percentual(%)']
             
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Número de eleitores com deficiência em {estado}"},
-                    number={'font_color': '#355070', 
-                            'font_size': 80, "valueformat": ".0f"},
-                    align='center'))
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Percentual de eleitores com deficiência em {estado}"},
+                        number={'font_color': '#355070', 'suffix': '%', 
+                                'font_size': 80, "valueformat": ".2f"},
+                        align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+                return fig
 
-        plot_chart(estado, df)
+            mostra_figura(('deficiencia_percentual_estado', dados, estado), plot_chart, estado, df)
+            # st.write('Estados com maior percentual de eleitores com deficiência')
+            # 
 
-    st.write('Estados com maior percentual de eleitores com deficiência')
-    Q13, Q14 = st.columns(2)
+    if secao == 'Facultativo':
+        df = get_data(dados, 'facultativo')
+        st.write('Eleitorado facultativo por estado')
 
-    with Q13:
-        top_10_deficiencia_percentual = df[['estado', 'eleitores_deficiencia_percentual(%)']].sort_values(
-            by='eleitores_deficiencia_percentual(%)', ascending=False)[:10].reset_index()
+        with st.empty():
+            def monta():
+                facultativos = df[['estado', 'eleitorado_facultativo_percentual(%)', '16_anos_percentual(%)', '17_anos_percentual(%)',
+                                   '65_69_anos_percentual(%)', '70_74_anos_percentual(%)', '75_79_anos_percentual(%)',
+                                   '80_84_anos_percentual(%)', '85_89_anos_percentual(%)', '90_94_anos_percentual(%)',
+                                   '95_99_anos_percentual(%)', '100_anos_percentual(%)']].iloc[get_top(dados, 'eleitorado_facultativo_percentual(%)', n=None)]
 
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-        
-        fig_percentual_deficientes = go.Figure(layout=my_layout)
-        fig_percentual_deficientes.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis_range=[0, 100],
-            xaxis=dict(
-                ticks="outside",
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-                tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
-                        '60%', '70%', '80%', '90%', '100%']),
-            yaxis=dict(
-                ticks="outside",
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-                autorange="reversed"))
-
-        # pontos
-        fig_percentual_deficientes.add_trace(
-            go.Scatter(
-                x=top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"],
-                y=top_10_deficiencia_percentual["estado"],
-                mode='markers+text',
-                name='',
-                text=[f"{percent:.2f}%" for percent in top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"]],
-                textposition='middle right',
-                hovertemplate=[
-                    f"{percent:.2f}%" for percent in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)']],
-                marker_color=colors,
-                marker_size=20))
-        # linhas
-        for i, v in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)'].items():
-            fig_percentual_deficientes.add_shape(
-                type='line',
-                x0=0, y0=i,
-                x1=v,
-                y1=i,
-                line=dict(color=colors[i], width=8))
-
-        st.plotly_chart(fig_percentual_deficientes, use_container_width=True)
-
-    with Q14:
-        def plot_chart(estadoIndex, df):
-            estado = format_func_estado(estadoIndex)
-            valor = df.loc[(df['estado'] == estado), 'eleitores_deficiencia_percentual(%)'].values[0]
-            
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Percentual de eleitores com deficiência em {estado}"},
-                    number={'font_color': '#355070', 'suffix': '%', 
-                            'font_size': 80, "valueformat": ".2f"},
-                    align='center'))
+                jovens = facultativos['16_anos_percentual(%)'] + \
+                    facultativos['17_anos_percentual(%)']
+                idosos = facultativos['65_69_anos_percentual(%)'] + facultativos['70_74_anos_percentual(%)'] + facultativos['75_79_anos_percentual(%)'] + facultativos['80_84_anos_percentual(%)'] + \
+                    facultativos['85_89_anos_percentual(%)'] + facultativos['90_94_anos_percentual(%)'] + \
+                    facultativos['95_99_anos_percentual(%)'] + \
+                    facultativos['100_anos_percentual(%)']
 
-            st.plotly_chart(fig, use_container_width=True)
-
-        plot_chart(estado, df)
-        # st.write('Estados com maior percentual de eleitores com deficiência')
-        # 
-
-    st.write('Eleitorado facultativo por estado')
-
-    with st.empty():
-        facultativos = df[['estado', 'eleitorado_facultativo_percentual(%)', '16_anos_percentual(%)', '17_anos_percentual(%)',
-                           '65_69_anos_percentual(%)', '70_74_anos_percentual(%)', '75_79_anos_percentual(%)',
-                           '80_84_anos_percentual(%)', '85_89_anos_percentual(%)', '90_94_anos_percentual(%)',
-                           '95_99_anos_percentual(%)', '100_anos_percentual(%)']].sort_values(by='eleitorado_facultativo_percentual(%)', ascending=False)
-
-        jovens = facultativos['16_anos_percentual(%)'] + \
-            facultativos['17_anos_percentual(%)']
-        idosos = facultativos['65_69_anos_percentual(%)'] + facultativos['70_74_anos_percentual(%)'] + facultativos['75_79_anos_percentual(%)'] + facultativos['80_84_anos_percentual(%)'] + \
-            facultativos['85_89_anos_percentual(%)'] + facultativos['90_94_anos_percentual(%)'] + \
-            facultativos['95_99_anos_percentual(%)'] + \
-            facultativos['100_anos_percentual(%)']
-
-        colors = ['#FCC202', '#355070']
-
-        df = facultativos
-        df['jovens'] = jovens
-        df['idosos'] = idosos
-        df['total'] = jovens + idosos
-
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-
-        fig_facultativo = go.Figure(layout=my_layout)
-
-        fig_facultativo.add_trace(go.Scatter(
-            x=facultativos['estado'],
-            y=df['idosos'],
-            hovertemplate=[f"{percent:.2f}%" for percent in df['idosos']],
-            marker=dict(color="#FCC202"),
-            name='Idosos',
-            showlegend=True))
-
-        fig_facultativo.add_trace(go.Scatter(
-            x=df['estado'],
-            y=df['jovens'],
-            hovertemplate=[f"{percent:.2f}%" for percent in df['jovens']],
-            marker=dict(color="#355070"),
-            name='Jovens',
-            showlegend=True))
-
-        fig_facultativo.add_trace(go.Scatter(
-            x=facultativos['estado'],
-            y=df['total'],
-            hovertemplate=[f"{percent:.2f}%" for percent in df['total']],
-            marker=dict(color="#296B21"),
-            name='Total',
-            showlegend=True))
-
-        fig_facultativo.update_layout(hovermode="x unified", yaxis_range=[0, 100], plot_bgcolor='rgba(255,255,255,255)',
-                                      xaxis=dict(showgrid=False,
-                                                 zeroline=False),
-                                      yaxis=dict(showgrid=False,
-                                                 zeroline=False,
-                                                 tickvals=[
-                                                     0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                                                 ticktext=['0%', '10%', '20%', '30%', '40%',
-                                                           '50%', '60%', '70%', '80%', '90%', '100%']),
-                                      xaxis_title="",
-                                      yaxis_title="",
-                                      legend_title='Legenda',)
-
-        st.plotly_chart(fig_facultativo, use_container_width=True)
+                colors = ['#FCC202', '#355070']
+
+                facultativos['jovens'] = jovens
+                facultativos['idosos'] = idosos
+                facultativos['total'] = jovens + idosos
+
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
+
+                fig_facultativo = go.Figure(layout=my_layout)
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x=facultativos['estado'],
+                    y=facultativos['idosos'],
+                    hovertemplate=[f"{percent:.2f}%" for percent in facultativos['idosos']],
+                    marker=dict(color="#FCC202"),
+                    name='Idosos',
+                    showlegend=True))
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x=facultativos['estado'],
+                    y=facultativos['jovens'],
+                    hovertemplate=[f"{percent:.2f}%" for percent in facultativos['jovens']],
+                    marker=dict(color="#355070"),
+                    name='Jovens',
+                    showlegend=True))
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x=facultativos['estado'],
+                    y=facultativos['total'],
+                    hovertemplate=[f"{percent:.2f}%" for percent in facultativos['total']],
+                    marker=dict(color="#296B21"),
+                    name='Total',
+                    showlegend=True))
+
+                fig_facultativo.update_layout(hovermode="x unified", yaxis_range=[0, 100], plot_bgcolor='rgba(255,255,255,255)',
+                                              xaxis=dict(showgrid=False,
+                                                         zeroline=False),
+                                              yaxis=dict(showgrid=False,
+                                                         zeroline=False,
+                                                         tickvals=[
+                                                             0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                                                         ticktext=['0%', '10%', '20%', '30%', '40%',
+                                                                   '50%', '60%', '70%', '80%', '90%', '100%']),
+                                              xaxis_title="",
+                                              yaxis_title="",
+                                              legend_title='Legenda',)
+
+                return fig_facultativo
+
+            mostra_figura(('facultativo_estados', dados), monta)
 else:
     ESTADOS = (df['estado'].drop_duplicates())
 
     def format_func_estado(option):
         return ESTADOS[option]
 
+    # Município clicado no mapa (mapas.mostra_coropletico)
+    linhas_estados, linha_chave = get_indice(dados)
+    clicado = st.session_state.pop('feicaoClicada', None)
+    if clicado in linha_chave:
+        st.session_state['estadosAnalfabetismoPercentualMunicipal'] = int(
+            ESTADOS.index[ESTADOS == clicado[0]][0])
+        st.session_state['analfabetismoPercentualMunicipal'] = int(
+            np.flatnonzero(linhas_estados[clicado[0]] == linha_chave[clicado])[0])
+
     estado = st.selectbox(
         "", options=list(ESTADOS.keys()), 
         format_func=format_func_estado,
         key='estadosAnalfabetismoPercentualMunicipal')
-    municipios = list(df.loc[df['estado'] == str(
-        format_func_estado(estado)), 'municipio'])
+    linhas_estado = linhas_estados[format_func_estado(estado)]
+    municipios = list(df['municipio'].values[linhas_estado])
 
     indexMunicipio = st.selectbox(
         "",
         range(len(municipios)),
         format_func=lambda x: municipios[x],
         key='analfabetismoPercentualMunicipal')
+    registro = get_registro(dados, format_func_estado(estado),
+                            municipios[indexMunicipio])
+
+    ranking = st.radio('Rankings de municípios',
+                       options=['Brasil', 'Estado selecionado'],
+                       horizontal=True)
+    uf_ranking = None
+    if (ranking == 'Estado selecionado'):
+        uf_ranking = format_func_estado(estado)
             
     # M U N I C Í P I O S
-    st.write('Comparecimento percentual por município')
-    if (dados == 'Municipal - 1º turno'):
-        Q1, Q2, Q3 = st.columns(3)
-
-        with Q1:
-            htmlFile = open(
-                "Dashboard/data/charts/municipios_1turno/mapa1_municipios_1turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, height=480)
-
-        with Q2:
-            htmlFile = open(
-                "Dashboard/data/charts/municipios_1turno/mapa2_municipios_1turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, height=480)
-
-        with Q3:
-            htmlFile = open(
-                "Dashboard/data/charts/municipios_1turno/mapa3_municipios_1turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, height=480)
-
-        with st.empty():
-            def plot_chart(estadoIndex, municipios, index, df):
-                estado = format_func_estado(estadoIndex)
-                cidade = municipios[index]
-
-                valor = df.loc[(df['estado'] == estado)
-                            & (df['municipio'] == cidade), 'comparecimento_percentual(%)'].values[0]
-                fig = go.Figure(
-                    go.Indicator(
-                        value=valor,
-                        title={'text': f"Comparecimento percentual em {cidade}"},
-                        number={'font_color': '#355070', "suffix": "%",
-                                'font_size': 80, "valueformat": ".2f"},
-                        align='center'))
-
-                st.plotly_chart(fig, use_container_width=True)
-
-            plot_chart(estado, municipios, indexMunicipio, df)
-
-    else:
-        Q4, Q5 = st.columns(2)
-        with Q4:
-            htmlFile = open(
-                "Dashboard/data/charts/municipios_2turno/mapa_municipios_2turno.html", 'r', encoding='utf-8')
-            source_code = htmlFile.read()
-            components.html(source_code, height=480)
+    Q4, Q5 = st.columns(2)
+    with Q4:
+        if tem_camada('municipios'):
+            painel_coropletico(dados, height=480, estado=uf_ranking)
+        elif dados == 'Municipal - 2º turno':
+            st.write('Comparecimento percentual por município')
+            mostra_mapa('municipios_2turno/mapa_municipios_2turno.html', height=480)
+        else:
+            st.info('O mapa dos municípios do 1º turno é gerado por '
+                    'code/mapas (python -m mapas).')
 
-        with Q5:
-            def plot_chart(estadoIndex, municipios, index, df):
-                estado = format_func_estado(estadoIndex)
-                cidade = municipios[index]
+    with Q5:
+        def plot_chart(estadoIndex, municipios, index, df):
+            estado = format_func_estado(estadoIndex)
+            cidade = municipios[index]
 
-                valor = df.loc[(df['estado'] == estado)
-                            & (df['municipio'] == cidade), 'comparecimento_percentual(%)'].values[0]
-                fig = go.Figure(
-                    go.Indicator(
-                        value=valor,
-                        title={'text': f"Comparecimento percentual em {cidade}"},
-                        number={'font_color': '#355070', "suffix":"%",
-                                'font_size': 70, "valueformat": ".2f"},
-                        align='center'))
+            valor = registro['comparecimento_percentual(%)']
+            fig = go.Figure(
+                go.Indicator(
+                    value=valor,
+                    title={'text': f"Comparecimento percentual em {cidade}"},
+                    number={'font_color': '#355070', "suffix":"%",
+                            'font_size': 70, "valueformat": ".2f"},
+                    align='center'))
 
-                st.plotly_chart(fig, use_container_width=True)
+            return fig
 
-            plot_chart(estado, municipios, indexMunicipio, df)
+        mostra_figura(('comparecimento_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
 
-    Q6, Q7 = st.columns(2)
+    secao = escolhe_secao()
 
-    with Q6:
+    if secao == 'Sexo':
+        df = get_data(dados, 'sexo')
         st.write('Divisão de sexos por município')
 
         def plot_chart(estadoIndex, municipios, index, df):
             estado = format_func_estado(estadoIndex)
             cidade = [municipios[index]]
 
-            homens = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'eleitorado_masculino_percentual(%)'].values[0]]
+            homens = [registro['eleitorado_masculino_percentual(%)']]
             
-            mulheres = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'eleitorado_feminino_percentual(%)'].values[0]]
+            mulheres = [registro['eleitorado_feminino_percentual(%)']]
 
             my_layout = Layout(hoverlabel=dict(
                 bgcolor='#FFFFFF'), template='simple_white')
@@ -924,183 +903,158 @@ else:
             fig_sexoMunicipio.update_traces(width=0.5)
             fig_sexoMunicipio.update_xaxes(ticksuffix="")
             fig_sexoMunicipio.update_yaxes(ticksuffix="")
-            st.plotly_chart(fig_sexoMunicipio, use_container_width=True)
-
-        plot_chart(estado, municipios, indexMunicipio, df)
-
-    st.write('Divisão por estado civil por município')
-    Q82, Q83 = st.columns(2)
-    with Q82:
-        def plot_chart(estadoIndex, municipios, index, df):
-            
-            estado_civil = st.selectbox(label='Selecione o estado civil',
-                     options=['solteiro', 'casado', 'divorciado', 
-                              'viuvo', 'separado judicialmente'])
-            
-            estado = format_func_estado(estadoIndex)
-            cidade = [municipios[index]]
-
-            if (estado_civil == 'separado judicialmente'):
-                estado_civil = 'separado_judicialmente'
-
-            top_10_estado_civil = df[['estado', 'municipio', estado_civil, estado_civil + '_masculino',
-                                      estado_civil + '_feminino']].sort_values(
-                by=estado_civil, ascending=False)[:10]
-
-            homens = top_10_estado_civil[estado_civil + '_masculino']
-            mulheres = top_10_estado_civil[estado_civil + '_feminino']
-
-            estados = df['estado'].drop_duplicates()
-
-            fig = go.Figure()
-
-            fig.add_trace(go.Bar(y=top_10_estado_civil['municipio'],
-                                x=mulheres,
-                                customdata=mulheres.astype('int'),
-                                hovertemplate='%{y} %{customdata}',
-                                marker_color='#FCC202',
-                                name='Mulheres',
-                                orientation='h'))
-
-            fig.add_trace(go.Bar(y=top_10_estado_civil['municipio'], x=homens*-1,
-                                name='Homens',
-                                customdata=homens.astype('int'),
-                                hovertemplate='%{y} %{customdata}',
-                                marker_color='#355070',
-                                orientation='h'))
-
-            fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
-                            title_font_size=22, barmode='relative',
-                            hoverlabel=dict(bgcolor='#FFFFFF'),
-                            template='simple_white',
-                            bargap=0, bargroupgap=0,
-                            margin=dict(l=1, r=1, t=60, b=1),
-                            xaxis_range=[-1*mulheres.max(), mulheres.max()], 
-                            xaxis=dict(tickvals=[-1*mulheres.max(), -1*mulheres.max()/2, 0, 
-                                        mulheres.max()/2, mulheres.max()],
-                                        ticktext=[int(mulheres.max()), int(mulheres.max()/2), 0, 
-                                        int(mulheres.max()/2), mulheres.max()]),
-                                    )
-
-            fig.update_traces(width=0.5)
-            st.plotly_chart(fig, use_container_width=True)
+            return fig_sexoMunicipio
+
+        mostra_figura(('sexo_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
+
+    if secao == 'Estado civil':
+        df = get_data(dados, 'estado_civil')
+        st.write('Divisão por estado civil por município')
+        Q82, Q83 = st.columns(2)
+        with Q82:
+            # Só este painel reroda quando o estado civil muda
+            @fragmento
+            def painel_estado_civil(dados, estado, municipios, indexMunicipio, uf_ranking):
+                df = get_data(dados, 'estado_civil')
+                estado_civil = st.selectbox(label='Selecione o estado civil',
+                         options=['solteiro', 'casado', 'divorciado', 
+                                  'viuvo', 'separado judicialmente'])
+
+                if (estado_civil == 'separado judicialmente'):
+                    estado_civil = 'separado_judicialmente'
+
+                def plot_chart(estadoIndex, municipios, index, df):
+                    estado = format_func_estado(estadoIndex)
+                    cidade = [municipios[index]]
+
+                    top_10_estado_civil = df[['estado', 'municipio', estado_civil, estado_civil + '_masculino',
+                                              estado_civil + '_feminino']].iloc[
+                        get_top(dados, estado_civil, estado=uf_ranking)]
+
+                    homens = top_10_estado_civil[estado_civil + '_masculino']
+                    mulheres = top_10_estado_civil[estado_civil + '_feminino']
+
+                    estados = df['estado'].drop_duplicates()
+
+                    fig = go.Figure()
+
+                    fig.add_trace(go.Bar(y=top_10_estado_civil['municipio'],
+                                        x=mulheres,
+                                        customdata=mulheres.astype('int'),
+                                        hovertemplate='%{y} %{customdata}',
+                                        marker_color='#FCC202',
+                                        name='Mulheres',
+                                        orientation='h'))
+
+                    fig.add_trace(go.Bar(y=top_10_estado_civil['municipio'], x=homens*-1,
+                                        name='Homens',
+                                        customdata=homens.astype('int'),
+                                        hovertemplate='%{y} %{customdata}',
+                                        marker_color='#355070',
+                                        orientation='h'))
+
+                    fig.update_layout(title='', plot_bgcolor="rgba(0,0,0,0)",
+                                    title_font_size=22, barmode='relative',
+                                    hoverlabel=dict(bgcolor='#FFFFFF'),
+                                    template='simple_white',
+                                    bargap=0, bargroupgap=0,
+                                    margin=dict(l=1, r=1, t=60, b=1),
+                                    xaxis_range=[-1*mulheres.max(), mulheres.max()], 
+                                    xaxis=dict(tickvals=[-1*mulheres.max(), -1*mulheres.max()/2, 0, 
+                                                mulheres.max()/2, mulheres.max()],
+                                                ticktext=[int(mulheres.max()), int(mulheres.max()/2), 0, 
+                                                int(mulheres.max()/2), mulheres.max()]),
+                                            )
+
+                    fig.update_traces(width=0.5)
+                    return fig
         
-        plot_chart(estado, municipios, indexMunicipio, df)
+                mostra_figura(('top_estado_civil', dados, uf_ranking, estado_civil), plot_chart, estado, municipios, indexMunicipio, df)
 
-    with Q83:
-        def plot_chart(estadoIndex, municipios, index, df):
+            painel_estado_civil(dados, estado, municipios, indexMunicipio, uf_ranking)
+
+        with Q83:
+            def plot_chart(estadoIndex, municipios, index, df):
     
-            estado = format_func_estado(estadoIndex)
-            cidade = [municipios[index]]
-            nomeEstado = [df.loc[(df['estado'] == estado, 'estado')].values[0]]
+                estado = format_func_estado(estadoIndex)
+                cidade = [municipios[index]]
+                nomeEstado = [estado]
             
-            data = {
-                'estado': [estado],
-                'municipio': [cidade],
-                'solteiro_masculino': [df.loc[(df['estado'] == estado) 
-                                              & (df['municipio'] == cidade[0]), 
-                  'solteiro_masculino'].values[0] * -1],
-                'casado_masculino': [df.loc[(df['estado'] == estado) 
-                                            & (df['municipio'] == cidade[0]), 
-                  'casado_masculino'].values[0] * -1],
-                'divorciado_masculino': [df.loc[(df['estado'] == estado)
-                                                & (df['municipio'] == cidade[0]), 
-                  'divorciado_masculino'].values[0] * -1],
-                'viuvo_masculino': [df.loc[(df['estado'] == estado)
-                                           & (df['municipio'] == cidade[0]), 
-                  'viuvo_masculino'].values[0] * -1],
-                'separado_judicialmente_masculino': [df.loc[(df['estado'] == estado)
-                                                            & (df['municipio'] == cidade[0]), 
-                  'separado_judicialmente_masculino'].values[0] * -1],
-                'solteiro_feminino': [df.loc[(df['estado'] == estado) 
-                                             & (df['municipio'] == cidade[0]), 
-                  'solteiro_feminino'].values[0]],
-                'casado_feminino': [df.loc[(df['estado'] == estado) 
-                                           & (df['municipio'] == cidade[0]), 
-                  'casado_feminino'].values[0]],
-                'divorciado_feminino': [df.loc[(df['estado'] == estado)
-                                               & (df['municipio'] == cidade[0]), 
-                  'divorciado_feminino'].values[0]],
-                'viuvo_feminino': [df.loc[(df['estado'] == estado)
-                                          & (df['municipio'] == cidade[0]), 
-                  'viuvo_feminino'].values[0]],
-                'separado_judicialmente_feminino': [df.loc[(df['estado'] == estado)
-                                                           & (df['municipio'] == cidade[0]), 
-                  'separado_judicialmente_feminino'].values[0]],
-                }
-
-            df = pd.DataFrame(data)
-            fig = go.Figure()
-
-            fig.add_trace(go.Bar(
-                y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
-                x=df[['separado_judicialmente_masculino', 'divorciado_masculino', 'solteiro_masculino', 'casado_masculino', 'viuvo_masculino']].iloc[0],
-                orientation='h',
-                name='Homens',
-                hoverinfo='x+text',
-                marker=dict(color=['#355070', '#355070', '#355070', '#355070', '#355070']),
-            ))
-
-            # Adicionar barras correspondentes para mulheres
-            fig.add_trace(go.Bar(
-                y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
-                x=df[['separado_judicialmente_feminino', 'divorciado_feminino', 'solteiro_feminino', 'casado_feminino', 'viuvo_feminino',]].iloc[0],
-                orientation='h',
-                name='Mulheres',
-                hoverinfo='x+text',
-                marker=dict(color=['#FCC202', '#FCC202', '#FCC202', '#FCC202', '#FCC202']),
-            ))
-
-            # Atualizar layout e mostrar a figura
-            fig.update_layout(barmode='relative', title='', plot_bgcolor="rgba(0,0,0,0)",
-                          hoverlabel=dict(bgcolor='#FFFFFF'),
-                          template='simple_white',
-                          bargap=0, bargroupgap=0,
-                          margin=dict(l=1, r=1, t=60, b=1),
-                          xaxis_range=[df['solteiro_masculino'], -1*df['solteiro_masculino']], 
-                        #    xaxis=dict(tickvals=[int(df['solteiro_masculino']), 
-                        #     int(df['solteiro_masculino']/2), 0, int(df['solteiro_masculino']/2),
-                        #     int(df['solteiro_masculino'])],
-                        #     ticktext=[int(df['solteiro_masculino']), int(df['solteiro_masculino']/2), 0, 
-                        #                 int(df['solteiro_masculino']/2), df['solteiro_masculino']],
-                        #               ),
-                                     )
-            fig.update_traces(width=0.5)
-            fig.update_xaxes(ticksuffix="")
-            fig.update_yaxes(ticksuffix="")
-            st.plotly_chart(fig, use_container_width=True)
+                data = {
+                    'estado': [estado],
+                    'municipio': [cidade],
+                    'solteiro_masculino': [registro['solteiro_masculino'] * -1],
+                    'casado_masculino': [registro['casado_masculino'] * -1],
+                    'divorciado_masculino': [registro['divorciado_masculino'] * -1],
+                    'viuvo_masculino': [registro['viuvo_masculino'] * -1],
+                    'separado_judicialmente_masculino': [registro['separado_judicialmente_masculino'] * -1],
+                    'solteiro_feminino': [registro['solteiro_feminino']],
+                    'casado_feminino': [registro['casado_feminino']],
+                    'divorciado_feminino': [registro['divorciado_feminino']],
+                    'viuvo_feminino': [registro['viuvo_feminino']],
+                    'separado_judicialmente_feminino': [registro['separado_judicialmente_feminino']],
+                    }
+
+                df = pd.DataFrame(data)
+                fig = go.Figure()
+
+                fig.add_trace(go.Bar(
+                    y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
+                    x=df[['separado_judicialmente_masculino', 'divorciado_masculino', 'solteiro_masculino', 'casado_masculino', 'viuvo_masculino']].iloc[0],
+                    orientation='h',
+                    name='Homens',
+                    hoverinfo='x+text',
+                    marker=dict(color=['#355070', '#355070', '#355070', '#355070', '#355070']),
+                ))
+
+                # Adicionar barras correspondentes para mulheres
+                fig.add_trace(go.Bar(
+                    y=['Separado judicialmente', 'Divorciado', 'Solteiro', 'Casado', 'Viúvo'],
+                    x=df[['separado_judicialmente_feminino', 'divorciado_feminino', 'solteiro_feminino', 'casado_feminino', 'viuvo_feminino',]].iloc[0],
+                    orientation='h',
+                    name='Mulheres',
+                    hoverinfo='x+text',
+                    marker=dict(color=['#FCC202', '#FCC202', '#FCC202', '#FCC202', '#FCC202']),
+                ))
+
+                # Atualizar layout e mostrar a figura
+                fig.update_layout(barmode='relative', title='', plot_bgcolor="rgba(0,0,0,0)",
+                              hoverlabel=dict(bgcolor='#FFFFFF'),
+                              template='simple_white',
+                              bargap=0, bargroupgap=0,
+                              margin=dict(l=1, r=1, t=60, b=1),
+                              xaxis_range=[df['solteiro_masculino'], -1*df['solteiro_masculino']], 
+                            #    xaxis=dict(tickvals=[int(df['solteiro_masculino']), 
+                            #     int(df['solteiro_masculino']/2), 0, int(df['solteiro_masculino']/2),
+                            #     int(df['solteiro_masculino'])],
+                            #     ticktext=[int(df['solteiro_masculino']), int(df['solteiro_masculino']/2), 0, 
+                            #                 int(df['solteiro_masculino']/2), df['solteiro_masculino']],
+                            #               ),
+                                         )
+                fig.update_traces(width=0.5)
+                fig.update_xaxes(ticksuffix="")
+                fig.update_yaxes(ticksuffix="")
+                return fig
 
-        plot_chart(estado, municipios, indexMunicipio, df)
+            mostra_figura(('estado_civil_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
 
-    with Q7:
+    if secao == 'Escolaridade':
         #ESCOLARIDADE POR MUNICÍPIO
+        df = get_data(dados, 'escolaridade')
         st.write('Divisão por escolaridade por município')
 
         def plot_chart(estadoIndex, municipios, index, df):
 
             estado = format_func_estado(estadoIndex)
             cidade = [municipios[index]]
-            analfabeto = [df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade[0]), 'analfabeto_percentual(%)'].values[0]]
-            le_escreve = [df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade[0]), 'le_escreve_percentual(%)'].values[0]]
-            fundamental_incompleto = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'fundamental_incompleto_percentual(%)'].values[0]]
-            fundamental_completo = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'fundamental_completo_percentual(%)'].values[0]]
-            medio_incompleto = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 'medio_incompleto_percentual(%)'].values[0]]
-            medio_completo = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'medio_completo_percentual(%)'].values[0]]
-            superior_incompleto = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'superior_incompleto_percentual(%)'].values[0]]
-            superior_completo = [df.loc[(df['estado'] == estado)
-                & (df['municipio'] == cidade[0]), 
-                'superior_completo_percentual(%)'].values[0]]
+            analfabeto = [registro['analfabeto_percentual(%)']]
+            le_escreve = [registro['le_escreve_percentual(%)']]
+            fundamental_incompleto = [registro['fundamental_incompleto_percentual(%)']]
+            fundamental_completo = [registro['fundamental_completo_percentual(%)']]
+            medio_incompleto = [registro['medio_incompleto_percentual(%)']]
+            medio_completo = [registro['medio_completo_percentual(%)']]
+            superior_incompleto = [registro['superior_incompleto_percentual(%)']]
+            superior_completo = [registro['superior_completo_percentual(%)']]
 
             my_layout = Layout(hoverlabel=dict(
                 bgcolor='#FFFFFF'), template='simple_white')
@@ -1147,363 +1101,387 @@ else:
             fig.update_traces(width=0.5)
             fig.update_xaxes(ticksuffix="")
             fig.update_yaxes(ticksuffix="")
-            st.plotly_chart(fig, use_container_width=True)
-
-        plot_chart(estado, municipios, indexMunicipio, df)
-
-    Q8, Q9 = st.columns(2)
-    with Q8:
-        st.write('Municípios com mais eleitores analfabetos')
-        top_10_analfabetos = df[['municipio', 'analfabeto']].sort_values(
-            by='analfabeto', ascending=False)[:10]
-
-        x1 = top_10_analfabetos['municipio']
-        analfabeto = top_10_analfabetos['analfabeto']
-
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
-                  '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
-
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-
-        fig_analfabetos = go.Figure(data=[
-            go.Bar(name='', x=x1, y=analfabeto, hovertemplate=' ',
-                   text=analfabeto, textposition='outside',
-                   marker_color=colors, showlegend=False)],
-            layout=my_layout)
-        if (dados == 'Municipal - 1º turno'):
-            fig_analfabetos.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis_range=[0, 200000],
-                yaxis=dict(
-                    tickvals=[0, 50000, 100000, 150000, 200000],
-                    ticktext=['0', '50 mil', '100 mil', '150 mil', '200 mil'])
-            )
-        elif (dados == 'Municipal - 2º turno'):
-            fig_analfabetos.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis_range=[0, 200000],
-                yaxis=dict(
-                    tickvals=[0, 50000, 100000, 150000,
-                              200000, 250000, 300000],
-                    ticktext=['0', '50 mil', '100 mil', '150 mil',
-                              '200 mil', '250 mil', '300 mil'])
-            )
+            return fig
 
-        st.plotly_chart(fig_analfabetos, use_container_width=True)
+        mostra_figura(('escolaridade_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
 
-    with Q9:
-        def plot_chart(estadoIndex, municipios, index, df):
-            estado = format_func_estado(estadoIndex)
-            cidade = municipios[index]
+    if secao == 'Analfabetos':
+        df = get_data(dados, 'analfabetos')
+        Q8, Q9 = st.columns(2)
+        with Q8:
+            st.write('Municípios com mais eleitores analfabetos')
+            def monta():
+                top_10_analfabetos = df[['municipio', 'analfabeto']].iloc[
+                    get_top(dados, 'analfabeto', estado=uf_ranking)]
 
-            valor = df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade), 'analfabeto'].values[0]
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Número de eleitores analfabetos em {cidade}"},
-                    number={'font_color': '#355070',
-                            'font_size': 80, "valueformat": ".0f"},
-                    align='center'))
+                x1 = top_10_analfabetos['municipio']
+                analfabeto = top_10_analfabetos['analfabeto']
 
-            st.plotly_chart(fig, use_container_width=True)
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
 
-        plot_chart(estado, municipios, indexMunicipio, df)
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
+
+                fig_analfabetos = go.Figure(data=[
+                    go.Bar(name='', x=x1, y=analfabeto, hovertemplate=' ',
+                           text=analfabeto, textposition='outside',
+                           marker_color=colors, showlegend=False)],
+                    layout=my_layout)
+                if (dados == 'Municipal - 1º turno'):
+                    fig_analfabetos.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis_range=[0, 200000],
+                        yaxis=dict(
+                            tickvals=[0, 50000, 100000, 150000, 200000],
+                            ticktext=['0', '50 mil', '100 mil', '150 mil', '200 mil'])
+                    )
+                elif (dados == 'Municipal - 2º turno'):
+                    fig_analfabetos.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis_range=[0, 200000],
+                        yaxis=dict(
+                            tickvals=[0, 50000, 100000, 150000,
+                                      200000, 250000, 300000],
+                            ticktext=['0', '50 mil', '100 mil', '150 mil',
+                                      '200 mil', '250 mil', '300 mil'])
+                    )
+
+                return fig_analfabetos
+
+            mostra_figura(('top_analfabetos', dados, uf_ranking), monta)
+
+        with Q9:
+            def plot_chart(estadoIndex, municipios, index, df):
+                estado = format_func_estado(estadoIndex)
+                cidade = municipios[index]
+
+                valor = registro['analfabeto']
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Número de eleitores analfabetos em {cidade}"},
+                        number={'font_color': '#355070',
+                                'font_size': 80, "valueformat": ".0f"},
+                        align='center'))
+
+                return fig
+
+            mostra_figura(('analfabetos_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
     
-    Q10, Q11 = st.columns(2)
-    with Q10:
-        st.write('Municípios com maior percentual de eleitores analfabetos')
-        top_10_analfabetos = df[['municipio', 'analfabeto_percentual(%)']].sort_values(
-            by='analfabeto_percentual(%)', ascending=False)[:10]
-
-        x1 = top_10_analfabetos['municipio']
-        analfabeto = top_10_analfabetos['analfabeto_percentual(%)']
-
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
-                  '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
-
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
-
-        fig_analfabetos_percentual = go.Figure(data=[
-            go.Bar(name='', x=analfabeto, y=x1, hovertemplate=' ',
-                   text=[f"{percent:.2f}%" for percent in analfabeto], textposition='outside',
-                   marker_color=colors, showlegend=False, orientation='h')],
-            layout=my_layout)
-        fig_analfabetos_percentual.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis=dict(autorange="reversed"),
-                xaxis_range=[0, 100],
-                xaxis=dict(
-                    tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                    ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
-                    '60%', '70%', '80%', '90%', '100%'])
-            )
-        st.plotly_chart(fig_analfabetos_percentual, use_container_width=True)
+        Q10, Q11 = st.columns(2)
+        with Q10:
+            st.write('Municípios com maior percentual de eleitores analfabetos')
+            def monta():
+                top_10_analfabetos = df[['municipio', 'analfabeto_percentual(%)']].iloc[
+                    get_top(dados, 'analfabeto_percentual(%)', estado=uf_ranking)]
 
-    with Q11:
-        #ANALFABETISMO PERCENTUAL MUNICIPAL
-        def plot_chart(estadoIndex, municipios, index, df):
-            estado = format_func_estado(estadoIndex)
-            cidade = municipios[index]
+                x1 = top_10_analfabetos['municipio']
+                analfabeto = top_10_analfabetos['analfabeto_percentual(%)']
 
-            valor = df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade), 'analfabeto_percentual(%)'].values[0]
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Percentual de eleitores analfabetos em {cidade}"},
-                    number={'font_color': '#355070', "suffix": "%",
-                            'font_size': 80, "valueformat": ".2f"},
-                    align='center'))
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
 
-            st.plotly_chart(fig, use_container_width=True)
-
-        plot_chart(estado, municipios, indexMunicipio, df)
-
-    Q12, Q13 = st.columns(2)
-    with Q12:
-        #ELEITORADO COM DEFICIÊNCIA
-        st.write('Municípios com mais eleitores com deficiência')
-        top_10_deficiencia = df[['municipio', 'eleitores_deficiencia']].drop_duplicates().sort_values(by = 'eleitores_deficiencia', ascending = False)[:10].reset_index()
-
-        colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7', '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
-
-        my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template='simple_white')
-
-        fig_deficientes = go.Figure(layout=my_layout)
-        fig_deficientes.update_xaxes(title_text=' ')
-        fig_deficientes.update_yaxes(title_text=' ')
-        fig_deficientes.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,),
-            yaxis=dict(
-                showgrid=False, 
-                zeroline=False,
-                mirror=False,
-                showline=True,
-                tickvals = [0, 50000, 100000, 150000, 200000],
-                ticktext = ['0', '50 mil', '100 mil', '150 mil', '200 mil']
-            ))
-
-        # pontos
-        fig_deficientes.add_trace(
-            go.Scatter(
-                x = top_10_deficiencia["municipio"],
-                y = top_10_deficiencia["eleitores_deficiencia"], 
-                mode = 'markers+text',
-                name='',
-                text=top_10_deficiencia["eleitores_deficiencia"],
-                textposition='top center',
-                hovertemplate = '%{y}',
-                marker_color =colors,
-                marker_size  = 25))
-        # linhas
-        for i, v in top_10_deficiencia["eleitores_deficiencia"].items():
-            fig_deficientes.add_shape(
-                type='line',
-                x0 = i, y0 = 0,
-                x1 = i,
-                y1 = v,
-                line=dict(color=colors[i], width = 10))
-        if (dados == 'Municipal - 1º turno'):
-            fig_deficientes.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            yaxis_range=[0, 200000],
-            yaxis=dict(
-                tickvals=[0, 25000, 50000, 75000, 
-                100000, 125000, 150000, 175000, 200000],
-                ticktext=['0', '25 mil', '50 mil', '75 mil', 
-                '100 mil', '125 mil', '150 mil', '175 mil', '200 mil'])
-            )
-        elif (dados == 'Municipal - 2º turno'):
-            fig_deficientes.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                yaxis_range=[0, 200000],
-                yaxis=dict(
-                    tickvals=[0, 25000, 50000, 75000,
-                        100000, 125000,
-                        150000, 175000, 200000],
-                    ticktext=['0', '25 mil', '50 mil', '75 mil',
-                        '100 mil', '125 mil', '150 mil',
-                        '175 mil', '200 mil'])
-            )
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
 
-        st.plotly_chart(fig_deficientes, use_container_width=True)
+                fig_analfabetos_percentual = go.Figure(data=[
+                    go.Bar(name='', x=analfabeto, y=x1, hovertemplate=' ',
+                           text=[f"{percent:.2f}%" for percent in analfabeto], textposition='outside',
+                           marker_color=colors, showlegend=False, orientation='h')],
+                    layout=my_layout)
+                fig_analfabetos_percentual.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis=dict(autorange="reversed"),
+                        xaxis_range=[0, 100],
+                        xaxis=dict(
+                            tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                            ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
+                            '60%', '70%', '80%', '90%', '100%'])
+                    )
+                return fig_analfabetos_percentual
 
-    with Q13:
-        #ELEITORADO MUNICIPAL COM DEFICIÊNCIA
-        def plot_chart(estadoIndex, municipios, index, df):
-            estado = format_func_estado(estadoIndex)
-            cidade = municipios[index]
+            mostra_figura(('top_analfabetos_percentual', dados, uf_ranking), monta)
 
-            valor = df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade), 'eleitores_deficiencia'].values[0]
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Número de eleitores com deficiência em {cidade}"},
-                    number={'font_color': '#355070',
-                            'font_size': 80, "valueformat": ".0f"},
-                    align='center'))
+        with Q11:
+            #ANALFABETISMO PERCENTUAL MUNICIPAL
+            def plot_chart(estadoIndex, municipios, index, df):
+                estado = format_func_estado(estadoIndex)
+                cidade = municipios[index]
+
+                valor = registro['analfabeto_percentual(%)']
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Percentual de eleitores analfabetos em {cidade}"},
+                        number={'font_color': '#355070', "suffix": "%",
+                                'font_size': 80, "valueformat": ".2f"},
+                        align='center'))
+
+                return fig
+
+            mostra_figura(('analfabetos_percentual_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
+
+    if secao == 'Deficiência':
+        df = get_data(dados, 'deficiencia')
+        Q12, Q13 = st.columns(2)
+        with Q12:
+            #ELEITORADO COM DEFICIÊNCIA
+            st.write('Municípios com mais eleitores com deficiência')
+            def monta():
+                top_10_deficiencia = df[['municipio', 'eleitores_deficiencia']].iloc[get_top(dados, 'eleitores_deficiencia', estado=uf_ranking)].reset_index()
+
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7', '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
+
+                my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template='simple_white')
+
+                fig_deficientes = go.Figure(layout=my_layout)
+                fig_deficientes.update_xaxes(title_text=' ')
+                fig_deficientes.update_yaxes(title_text=' ')
+                fig_deficientes.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis=dict(
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,),
+                    yaxis=dict(
+                        showgrid=False, 
+                        zeroline=False,
+                        mirror=False,
+                        showline=True,
+                        tickvals = [0, 50000, 100000, 150000, 200000],
+                        ticktext = ['0', '50 mil', '100 mil', '150 mil', '200 mil']
+                    ))
+
+                # pontos
+                fig_deficientes.add_trace(
+                    go.Scatter(
+                        x = top_10_deficiencia["municipio"],
+                        y = top_10_deficiencia["eleitores_deficiencia"], 
+                        mode = 'markers+text',
+                        name='',
+                        text=top_10_deficiencia["eleitores_deficiencia"],
+                        textposition='top center',
+                        hovertemplate = '%{y}',
+                        marker_color =colors,
+                        marker_size  = 25))
+                # linhas
+                for i, v in top_10_deficiencia["eleitores_deficiencia"].items():
+                    fig_deficientes.add_shape(
+                        type='line',
+                        x0 = i, y0 = 0,
+                        x1 = i,
+                        y1 = v,
+                        line=dict(color=colors[i], width = 10))
+                if (dados == 'Municipal - 1º turno'):
+                    fig_deficientes.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    yaxis_range=[0, 200000],
+                    yaxis=dict(
+                        tickvals=[0, 25000, 50000, 75000, 
+                        100000, 125000, 150000, 175000, 200000],
+                        ticktext=['0', '25 mil', '50 mil', '75 mil', 
+                        '100 mil', '125 mil', '150 mil', '175 mil', '200 mil'])
+                    )
+                elif (dados == 'Municipal - 2º turno'):
+                    fig_deficientes.update_layout(
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        yaxis_range=[0, 200000],
+                        yaxis=dict(
+                            tickvals=[0, 25000, 50000, 75000,
+                                100000, 125000,
+                                150000, 175000, 200000],
+                            ticktext=['0', '25 mil', '50 mil', '75 mil',
+                                '100 mil', '125 mil', '150 mil',
+                                '175 mil', '200 mil'])
+                    )
+
+                return fig_deficientes
+
+            mostra_figura(('top_deficiencia', dados, uf_ranking), monta)
+
+        with Q13:
+            #ELEITORADO MUNICIPAL COM DEFICIÊNCIA
+            def plot_chart(estadoIndex, municipios, index, df):
+                estado = format_func_estado(estadoIndex)
+                cidade = municipios[index]
+
+                valor = registro['eleitores_deficiencia']
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Número de eleitores com deficiência em {cidade}"},
+                        number={'font_color': '#355070',
+                                'font_size': 80, "valueformat": ".0f"},
+                        align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+                return fig
 
-        plot_chart(estado, municipios, indexMunicipio, df)
+            mostra_figura(('deficiencia_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
 
-    Q14, Q15 = st.columns(2)
-    with Q14:
-        st.write('Municípios com maior percentual de eleitores com deficiência')
-        top_10_deficiencia_percentual = df[['municipio', 'eleitores_deficiencia_percentual(%)']].sort_values(
-            by='eleitores_deficiencia_percentual(%)', ascending=False)[:10].reset_index()
+        Q14, Q15 = st.columns(2)
+        with Q14:
+            st.write('Municípios com maior percentual de eleitores com deficiência')
+            def monta():
+                top_10_deficiencia_percentual = df[['municipio', 'eleitores_deficiencia_percentual(%)']].iloc[
+                    get_top(dados, 'eleitores_deficiencia_percentual(%)', estado=uf_ranking)].reset_index()
 
-        my_layout = Layout(hoverlabel=dict(
-            bgcolor='#FFFFFF'), template='simple_white')
+                colors = ['#FCC202', '#E6DD39', '#FEE592', '#FEE592', '#E1E0C7',
+                          '#DEE0FC', '#A6ACE6', '#7179E6', '#597092', '#355070']
+
+                my_layout = Layout(hoverlabel=dict(
+                    bgcolor='#FFFFFF'), template='simple_white')
         
-        fig_percentual_deficientes = go.Figure(layout=my_layout)
-        fig_percentual_deficientes.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis_range=[0, 100],
-            xaxis=dict(
-                ticks="outside",
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-                tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
-                '60%', '70%', '80%', '90%', '100%']),
-            yaxis=dict(
-                ticks="outside",
-                mirror=False,
-                showline=True,
-                showgrid=False,
-                zeroline=False,
-                autorange="reversed"))
-
-        # pontos
-        fig_percentual_deficientes.add_trace(
-            go.Scatter(
-                x=top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"],
-                y=top_10_deficiencia_percentual["municipio"],
-                mode='markers+text',
-                name='',
-                text=[f"{percent:.2f}%" for percent in top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"]],
-                textposition='middle right',
-                hovertemplate=[
-                    f"{percent:.2f}%" for percent in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)']],
-                marker_color=colors,
-                marker_size=20))
-        # linhas
-        for i, v in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)'].items():
-            fig_percentual_deficientes.add_shape(
-                type='line',
-                x0=0, y0=i,
-                x1=v,
-                y1=i,
-                line=dict(color=colors[i], width=8))
-
-        st.plotly_chart(fig_percentual_deficientes, use_container_width=True)
-
-    with Q15:
-        def plot_chart(estadoIndex, municipios, index, df):
-            estado = format_func_estado(estadoIndex)
-            cidade = municipios[index]
+                fig_percentual_deficientes = go.Figure(layout=my_layout)
+                fig_percentual_deficientes.update_layout(
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis_range=[0, 100],
+                    xaxis=dict(
+                        ticks="outside",
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                        tickvals=[0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                        ticktext=['0%', '10%', '20%', '30%', '40%', '50%',
+                        '60%', '70%', '80%', '90%', '100%']),
+                    yaxis=dict(
+                        ticks="outside",
+                        mirror=False,
+                        showline=True,
+                        showgrid=False,
+                        zeroline=False,
+                        autorange="reversed"))
+
+                # pontos
+                fig_percentual_deficientes.add_trace(
+                    go.Scatter(
+                        x=top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"],
+                        y=top_10_deficiencia_percentual["municipio"],
+                        mode='markers+text',
+                        name='',
+                        text=[f"{percent:.2f}%" for percent in top_10_deficiencia_percentual["eleitores_deficiencia_percentual(%)"]],
+                        textposition='middle right',
+                        hovertemplate=[
+                            f"{percent:.2f}%" for percent in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)']],
+                        marker_color=colors,
+                        marker_size=20))
+                # linhas
+                for i, v in top_10_deficiencia_percentual['eleitores_deficiencia_percentual(%)'].items():
+                    fig_percentual_deficientes.add_shape(
+                        type='line',
+                        x0=0, y0=i,
+                        x1=v,
+                        y1=i,
+                        line=dict(color=colors[i], width=8))
+
+                return fig_percentual_deficientes
+
+            mostra_figura(('top_deficiencia_percentual', dados, uf_ranking), monta)
+
+        with Q15:
+            def plot_chart(estadoIndex, municipios, index, df):
+                estado = format_func_estado(estadoIndex)
+                cidade = municipios[index]
 
-            valor = df.loc[(df['estado'] == estado)
-                           & (df['municipio'] == cidade), 'eleitores_deficiencia_percentual(%)'].values[0]
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Percentual de eleitores com deficiência em {cidade}"},
-                    number={'font_color': '#355070', "suffix": "%",
-                            'font_size': 80, "valueformat": ".2f"},
-                    align='center'))
+                valor = registro['eleitores_deficiencia_percentual(%)']
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Percentual de eleitores com deficiência em {cidade}"},
+                        number={'font_color': '#355070', "suffix": "%",
+                                'font_size': 80, "valueformat": ".2f"},
+                        align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+                return fig
 
-        plot_chart(estado, municipios, indexMunicipio, df)
+            mostra_figura(('deficiencia_percentual_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
 
-    Q16, Q17 = st.columns(2)
+    if secao == 'Facultativo':
+        df = get_data(dados, 'facultativo')
+        Q16, Q17 = st.columns(2)
 
-    facultativos = df[['estado', 'municipio', 'eleitorado_facultativo_percentual(%)','16_anos_percentual(%)', '17_anos_percentual(%)', 
-      '65_69_anos_percentual(%)', '70_74_anos_percentual(%)', '75_79_anos_percentual(%)',
-       '80_84_anos_percentual(%)', '85_89_anos_percentual(%)', '90_94_anos_percentual(%)',
-       '95_99_anos_percentual(%)', '100_anos_percentual(%)']].sort_values(by = 'eleitorado_facultativo_percentual(%)', ascending = False)
+        facultativos = df[['estado', 'municipio', 'eleitorado_facultativo_percentual(%)','16_anos_percentual(%)', '17_anos_percentual(%)', 
+          '65_69_anos_percentual(%)', '70_74_anos_percentual(%)', '75_79_anos_percentual(%)',
+           '80_84_anos_percentual(%)', '85_89_anos_percentual(%)', '90_94_anos_percentual(%)',
+           '95_99_anos_percentual(%)', '100_anos_percentual(%)']].iloc[get_top(dados, 'eleitorado_facultativo_percentual(%)', estado=uf_ranking)]
     
-    with Q16:
-        st.write('Municípios com maior eleitorado facultativo')
-        jovens = facultativos['16_anos_percentual(%)'] + facultativos['17_anos_percentual(%)']
-        idosos = facultativos['65_69_anos_percentual(%)'] + facultativos['70_74_anos_percentual(%)'] + facultativos['75_79_anos_percentual(%)'] + facultativos['80_84_anos_percentual(%)'] + facultativos['85_89_anos_percentual(%)'] + facultativos['90_94_anos_percentual(%)'] + facultativos['95_99_anos_percentual(%)'] + facultativos['100_anos_percentual(%)']
-
-        colors = ['#FCC202', '#355070']
-
-        facultativos['jovens'] = jovens
-        facultativos['idosos'] = idosos
-        facultativos['total'] = jovens + idosos
-
-        my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template='simple_white')
-
-        fig_facultativo = go.Figure(layout=my_layout)
-
-        fig_facultativo.add_trace(go.Scatter(
-            x = facultativos['municipio'][:10],
-            y = facultativos['idosos'][:10],
-            hovertemplate = [f"{percent:.2f}%" for percent in facultativos['idosos']],
-            marker=dict(color="#FCC202"),
-            name='Idosos',
-            showlegend = True))
-
-        fig_facultativo.add_trace(go.Scatter(
-            x = facultativos['municipio'][:10],
-            y = facultativos['jovens'][:10],
-            hovertemplate = [f"{percent:.2f}%" for percent in facultativos['jovens']],
-            marker=dict(color="#355070"),
-            name='Jovens',
-            showlegend=True))
-
-        fig_facultativo.add_trace(go.Scatter(
-            x = facultativos['municipio'][:10],
-            y = facultativos['total'][:10],
-            hovertemplate = [f"{percent:.2f}%" for percent in facultativos['total']],
-            marker=dict(color="#296B21"),
-            name='Total',
-            showlegend = True))
-
-        fig_facultativo.update_layout(hovermode="x unified", yaxis_range=[0,100], plot_bgcolor='rgba(255,255,255,255)',
-                        xaxis=dict(showgrid=False, 
-                                    zeroline=False), 
-                        yaxis=dict(showgrid=False, 
-                                    zeroline=False,
-                                    tickvals = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
-                                    ticktext = ['0%', '10%', '20%', '30%', '40%', 
-                                    '50%', '60%', '70%', '80%', '90%', '100%']),
-                        xaxis_title="",
-                        yaxis_title="",
-                        legend_title='Legenda',)
-
-        st.plotly_chart(fig_facultativo, use_container_width=True)
+        with Q16:
+            st.write('Municípios com maior eleitorado facultativo')
+            def monta():
+                jovens = facultativos['16_anos_percentual(%)'] + facultativos['17_anos_percentual(%)']
+                idosos = facultativos['65_69_anos_percentual(%)'] + facultativos['70_74_anos_percentual(%)'] + facultativos['75_79_anos_percentual(%)'] + facultativos['80_84_anos_percentual(%)'] + facultativos['85_89_anos_percentual(%)'] + facultativos['90_94_anos_percentual(%)'] + facultativos['95_99_anos_percentual(%)'] + facultativos['100_anos_percentual(%)']
+
+                colors = ['#FCC202', '#355070']
+
+                facultativos['jovens'] = jovens
+                facultativos['idosos'] = idosos
+                facultativos['total'] = jovens + idosos
+
+                my_layout = Layout(hoverlabel = dict(bgcolor = '#FFFFFF'), template='simple_white')
+
+                fig_facultativo = go.Figure(layout=my_layout)
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x = facultativos['municipio'][:10],
+                    y = facultativos['idosos'][:10],
+                    hovertemplate = [f"{percent:.2f}%" for percent in facultativos['idosos']],
+                    marker=dict(color="#FCC202"),
+                    name='Idosos',
+                    showlegend = True))
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x = facultativos['municipio'][:10],
+                    y = facultativos['jovens'][:10],
+                    hovertemplate = [f"{percent:.2f}%" for percent in facultativos['jovens']],
+                    marker=dict(color="#355070"),
+                    name='Jovens',
+                    showlegend=True))
+
+                fig_facultativo.add_trace(go.Scatter(
+                    x = facultativos['municipio'][:10],
+                    y = facultativos['total'][:10],
+                    hovertemplate = [f"{percent:.2f}%" for percent in facultativos['total']],
+                    marker=dict(color="#296B21"),
+                    name='Total',
+                    showlegend = True))
+
+                fig_facultativo.update_layout(hovermode="x unified", yaxis_range=[0,100], plot_bgcolor='rgba(255,255,255,255)',
+                                xaxis=dict(showgrid=False, 
+                                            zeroline=False), 
+                                yaxis=dict(showgrid=False, 
+                                            zeroline=False,
+                                            tickvals = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100],
+                                            ticktext = ['0%', '10%', '20%', '30%', '40%', 
+                                            '50%', '60%', '70%', '80%', '90%', '100%']),
+                                xaxis_title="",
+                                yaxis_title="",
+                                legend_title='Legenda',)
+
+                return fig_facultativo
+
+            mostra_figura(('top_facultativo', dados, uf_ranking), monta)
     
-    with Q17:
-        def plot_chart(estadoIndex, municipios, index, df):
-            estado = format_func_estado(estadoIndex)
-            cidade = municipios[index]
+        with Q17:
+            def plot_chart(estadoIndex, municipios, index, df):
+                estado = format_func_estado(estadoIndex)
+                cidade = municipios[index]
 
-            valor = facultativos.loc[(facultativos['estado'] == estado)
-                & (facultativos['municipio'] == cidade), 'total'].values[0]
-            fig = go.Figure(
-                go.Indicator(
-                    value=valor,
-                    title={'text': f"Percentual do eleitorado facultativo em {cidade}"},
-                    number={'font_color': '#355070', "suffix": "%",
-                            'font_size': 80, "valueformat": ".2f"},
-                    align='center'))
+                jovens = registro['16_anos_percentual(%)'] + registro['17_anos_percentual(%)']
+                idosos = sum(registro[faixa] for faixa in [
+                    '65_69_anos_percentual(%)', '70_74_anos_percentual(%)', '75_79_anos_percentual(%)',
+                    '80_84_anos_percentual(%)', '85_89_anos_percentual(%)', '90_94_anos_percentual(%)',
+                    '95_99_anos_percentual(%)', '100_anos_percentual(%)'])
+                valor = jovens + idosos
+                fig = go.Figure(
+                    go.Indicator(
+                        value=valor,
+                        title={'text': f"Percentual do eleitorado facultativo em {cidade}"},
+                        number={'font_color': '#355070', "suffix": "%",
+                                'font_size': 80, "valueformat": ".2f"},
+                        align='center'))
 
-            st.plotly_chart(fig, use_container_width=True)
+                return fig
 
-        plot_chart(estado, municipios, indexMunicipio, df)
\ No newline at end of file
+            mostra_figura(('facultativo_municipio', dados, estado, indexMunicipio), plot_chart, estado, municipios, indexMunicipio, df)
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""Aquecimento dos caches do dashboard logo que o servidor sobe.
+
+Os caches (st.cache_resource e o cache de figuras) só existem dentro de uma
+execução da página, então o aquecimento abre sessões no próprio servidor,
+como um navegador faria, e roda a página de cada eleição em cada seção
+(?dados=...&secao=..., ver figuras.aplica_parametros). Isso carrega as
+tabelas, os índices e os rankings e monta as figuras que não dependem do
+estado ou município escolhido. Ver servidor.py.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlencode
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+
+from dados import TABELAS, caminho_tabela
+from figuras import SECOES
+
+ESPERA_SERVIDOR = 0.5
+
+
+class Prontidao:
+    """Situação do aquecimento, lida pelo endpoint de prontidão: iniciando,
+    aquecendo, pronto ou falhou (alguma página deu erro, ver erros)."""
+
+    def __init__(self, paginas):
+        self.situacao = 'iniciando'
+        self.paginas = paginas
+        self.feitas = 0
+        self.erros = []
+        self.segundos = None
+        self._trava = threading.Lock()
+
+    @property
+    def pronto(self):
+        return self.situacao == 'pronto'
+
+    def atualiza(self, **campos):
+        with self._trava:
+            for campo, valor in campos.items():
+                setattr(self, campo, valor)
+
+    def como_dict(self):
+        with self._trava:
+            return {'situacao': self.situacao, 'paginas': self.paginas,
+                    'feitas': self.feitas, 'erros': list(self.erros),
+                    'segundos': self.segundos}
+
+
+def paginas_aquecimento():
+    """Parâmetros de cada página aberta pelo aquecimento, só das eleições
+    cuja tabela o ETL gerou."""
+    return [{'dados': dados, 'secao': secao}
+            for dados in TABELAS if os.path.exists(caminho_tabela(dados))
+            for secao in SECOES]
+
+
+async def espera_servidor(endereco):
+    """Espera o servidor do Streamlit responder ao health check."""
+    cliente = AsyncHTTPClient()
+    while True:
+        try:
+            await cliente.fetch(endereco + '/_stcore/health')
+            return
+        except Exception:
+            await asyncio.sleep(ESPERA_SERVIDOR)
+
+
+async def renderiza(endereco, parametros=None):
+    """Abre uma sessão no servidor em endereco (http://host:porta), roda a
+    página uma vez com parametros no endereço e fecha a sessão.
+
+    Devolve (segundos, bytes recebidos, mensagens de exceção da página).
+    """
+    conexao = await websocket_connect(
+        endereco.replace('http', 'ws', 1) + '/_stcore/stream',
+        max_message_size=1 << 30)
+    pedido = BackMsg()
+    pedido.rerun_script.query_string = urlencode(parametros or {})
+    inicio = time.perf_counter()
+    await conexao.write_message(pedido.SerializeToString(), binary=True)
+    recebidos, erros = 0, []
+    try:
+        while True:
+            bruta = await conexao.read_message()
+            if bruta is None:
+                raise ConnectionError('sessão fechada pelo servidor')
+            recebidos += len(bruta)
+            mensagem = ForwardMsg()
+            mensagem.ParseFromString(bruta)
+            tipo = mensagem.WhichOneof('type')
+            if (tipo == 'delta' and mensagem.delta.WhichOneof('type')
+                    == 'new_element' and mensagem.delta.new_element
+                    .WhichOneof('type') == 'exception'):
+                erros.append(mensagem.delta.new_element.exception.message)
+            elif tipo == 'script_finished':
+                return time.perf_counter() - inicio, recebidos, erros
+    finally:
+        conexao.close()
+
+
+async def _aquece(endereco, prontidao):
+    await espera_servidor(endereco)
+    prontidao.atualiza(situacao='aquecendo')
+    inicio = time.perf_counter()
+    erros = []
+    for feitas, parametros in enumerate(paginas_aquecimento(), 1):
+        try:
+            _, _, mensagens = await renderiza(endereco, parametros)
+        except Exception as erro:
+            mensagens = [repr(erro)]
+        erros += ['%s, %s: %s' % (parametros['dados'], parametros['secao'],
+                                  mensagem) for mensagem in mensagens]
+        prontidao.atualiza(feitas=feitas, erros=erros)
+    prontidao.atualiza(situacao='falhou' if erros else 'pronto',
+                       segundos=round(time.perf_counter() - inicio, 2))
+
+
+async def _espera(endereco, prontidao):
+    await espera_servidor(endereco)
+    prontidao.atualiza(situacao='pronto')
+
+
+def _prontidao_http(prontidao):
+    class Pedido(BaseHTTPRequestHandler):
+        def do_GET(self):
+            corpo = json.dumps(prontidao.como_dict(),
+                               ensure_ascii=False).encode()
+            self.send_response(200 if prontidao.pronto else 503)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    return Pedido
+
+
+def inicia(porta, aquecer=True, porta_prontidao=None):
+    """Aquece o servidor que vai subir em porta, numa thread à parte.
+
+    Sem aquecer só espera o servidor responder. Com porta_prontidao,
+    GET em qualquer caminho dessa porta responde 200 quando o servidor está
+    pronto e 503 antes disso ou se alguma página falhou no aquecimento, com
+    a situação em JSON (Prontidao).
+    """
+    endereco = 'http://localhost:%d' % porta
+    prontidao = Prontidao(len(paginas_aquecimento()) if aquecer else 0)
+    tarefa = _aquece if aquecer else _espera
+    threading.Thread(target=asyncio.run, args=(tarefa(endereco, prontidao),),
+                     name='aquecimento', daemon=True).start()
+    if porta_prontidao:
+        servidor = ThreadingHTTPServer(('', porta_prontidao),
+                                       _prontidao_http(prontidao))
+        threading.Thread(target=servidor.serve_forever, name='prontidao',
+                         daemon=True).start()
+    return prontidao
@@ -0,0 +1,170 @@
+import pandas as pd
+import streamlit as st
+
+# Cache único por processo: st.cache_resource a partir do Streamlit 1.18,
+# experimental_singleton antes disso
+cache_resource = getattr(st, 'cache_resource', None) or st.experimental_singleton
+
+# Tabela de cada opção de eleição e as colunas que identificam uma linha
+TABELAS = {
+    'Estadual - 1º turno': ('df_estados_1turno_2020', ['estado']),
+    'Estadual - 2º turno': ('df_estados_2turno_2020', ['estado']),
+    'Municipal - 1º turno': ('df_municipios_1turno_2020', ['estado', 'municipio']),
+    'Municipal - 2º turno': ('df_municipios_2turno_2020', ['estado', 'municipio']),
+}
+
+ESTADOS_CIVIS = ['solteiro', 'casado', 'divorciado', 'viuvo',
+                 'separado_judicialmente']
+
+ESCOLARIDADES = ['analfabeto', 'le_escreve', 'fundamental_incompleto',
+                 'fundamental_completo', 'medio_incompleto', 'medio_completo',
+                 'superior_incompleto', 'superior_completo']
+
+FAIXAS_FACULTATIVAS = ['16_anos', '17_anos', '65_69_anos', '70_74_anos',
+                       '75_79_anos', '80_84_anos', '85_89_anos', '90_94_anos',
+                       '95_99_anos', '100_anos']
+
+# Colunas lidas por cada seção do dashboard, além das chaves da tabela. As
+# demais colunas das tabelas (faixa etária por estado civil e sexo, por
+# exemplo) nunca são lidas do disco.
+GRUPOS = {
+    'resumo': ['aptos', 'eleitorado_feminino', 'eleitorado_masculino',
+               'comparecimento_percentual(%)', 'abstencao_percentual(%)'],
+    'sexo': ['eleitorado_masculino_percentual(%)',
+             'eleitorado_feminino_percentual(%)'],
+    'estado_civil': [ec + sufixo for ec in ESTADOS_CIVIS
+                     for sufixo in ['', '_masculino', '_feminino']],
+    'escolaridade': [esc + '_percentual(%)' for esc in ESCOLARIDADES],
+    'analfabetos': ['analfabeto', 'analfabeto_percentual(%)'],
+    'deficiencia': ['eleitores_deficiencia',
+                    'eleitores_deficiencia_percentual(%)'],
+    'facultativo': ['eleitorado_facultativo_percentual(%)']
+                   + [fx + '_percentual(%)' for fx in FAIXAS_FACULTATIVAS],
+}
+
+
+def caminho_tabela(dados, sufixo=''):
+    return 'Dashboard/data/' + TABELAS[dados][0] + sufixo + '.parquet'
+
+
+@cache_resource
+def _le_grupo(dados, grupo):
+    # Uma única instância por processo, compartilhada por todas as sessões
+    chaves = TABELAS[dados][1]
+    return pd.read_parquet(caminho_tabela(dados), columns=chaves + GRUPOS[grupo])
+
+
+def get_grupo(dados, grupo):
+    """Lê do parquet só as chaves e as colunas de GRUPOS[grupo].
+
+    Devolve uma cópia rasa da tabela em cache, que é a mesma para todas as
+    sessões: os dados não são copiados, mas colunas novas ou trocadas
+    (df[coluna] = ...) ficam só na cópia. Quem precisa alterar valores
+    dentro de uma coluna (loc, iloc, inplace) faz antes um .copy().
+    """
+    return _le_grupo(dados, grupo).copy(deep=False)
+
+
+def get_data(dados, *grupos):
+    """Tabela da eleição dados com as colunas dos grupos pedidos.
+
+    Cada grupo fica em cache separadamente, então seções diferentes
+    compartilham o que já foi lido. Sem grupos a tabela inteira é lida.
+    """
+    if not grupos:
+        return pd.read_parquet(caminho_tabela(dados))
+    tabela = get_grupo(dados, grupos[0])
+    for grupo in grupos[1:]:
+        # Chaves e colunas comuns a mais de um grupo entram uma vez só
+        parte = get_grupo(dados, grupo)
+        parte = parte.drop(columns=parte.columns.intersection(tabela.columns))
+        tabela = pd.concat([tabela, parte], axis=1)
+    return tabela
+
+
+@cache_resource
+def get_indice(dados):
+    """Posições das linhas da tabela, montadas uma vez por eleição.
+
+    Devolve (linhas_estado, linha_chave): estado -> posições das suas
+    linhas e chave ((estado,) ou (estado, municipio)) -> posição da linha.
+    """
+    chaves = TABELAS[dados][1]
+    df = pd.read_parquet(caminho_tabela(dados), columns=chaves)
+    linhas_estado = df.groupby('estado', sort=False).indices
+    for linhas in linhas_estado.values():
+        linhas.setflags(write=False)
+    linha_chave = {chave: posicao for posicao, chave
+                   in enumerate(df.itertuples(index=False, name=None))}
+    return linhas_estado, linha_chave
+
+
+# Grupo de onde vem cada coluna de GRUPOS
+GRUPO_COLUNA = {coluna: grupo for grupo, colunas in GRUPOS.items()
+                for coluna in colunas}
+
+
+def get_coluna(dados, coluna):
+    """Coluna da tabela da eleição dados, tirada do grupo em cache de onde
+    ela vem (GRUPO_COLUNA), sem ler o parquet de novo."""
+    return _le_grupo(dados, GRUPO_COLUNA.get(coluna, 'resumo'))[coluna]
+
+
+class Registro:
+    """Valores de uma linha da tabela, lidos coluna a coluna.
+
+    registro[coluna] vai direto à posição da linha na coluna do grupo em
+    cache: só os grupos das colunas pedidas são lidos e nenhuma linha é
+    montada.
+    """
+
+    def __init__(self, dados, posicao):
+        self.dados = dados
+        self.posicao = posicao
+
+    def __getitem__(self, coluna):
+        return get_coluna(self.dados, coluna).iat[self.posicao]
+
+
+def get_registro(dados, *chave):
+    """Registro da entidade selecionada, achada pelo índice de get_indice,
+    no lugar de um filtro booleano sobre a tabela a cada valor."""
+    return Registro(dados, get_indice(dados)[1][chave])
+
+
+@cache_resource
+def get_rankings(dados):
+    """Rankings gerados pelo ETL: (metrica, escopo) -> linhas em ordem."""
+    rankings = pd.read_parquet(caminho_tabela(dados, '_rankings'),
+                               columns=['metrica', 'escopo', 'linha'])
+    rankings = {chave: parte['linha'].to_numpy() for chave, parte
+                in rankings.groupby(['metrica', 'escopo'], sort=False)}
+    for linhas in rankings.values():
+        linhas.setflags(write=False)
+    return rankings
+
+
+def get_top(dados, metrica, n=10, estado=None):
+    """Posições das n linhas com maior metrica no Brasil ou só em estado.
+
+    Com n=None devolve a ordem completa.
+    """
+    return get_rankings(dados)[(metrica, estado or 'BR')][:n]
+
+
+@cache_resource
+def get_classes(dados, sufixo='_classes'):
+    """Classes dos indicadores geradas por code/mapas:
+    (metrica, escopo, esquema) -> (minimo, limites).
+
+    Com sufixo '_hexagonos_classes', as das médias da grade hexagonal.
+    """
+    classes = pd.read_parquet(caminho_tabela(dados, sufixo))
+    return {(metrica, escopo, esquema): (minimo, list(limites))
+            for metrica, escopo, esquema, minimo, limites
+            in classes.itertuples(index=False, name=None)}
+
+
+def get_limites(dados, metrica, esquema, estado=None, sufixo='_classes'):
+    """Mínimo e limites das classes de metrica no Brasil ou só em estado."""
+    return get_classes(dados, sufixo)[(metrica, estado or 'BR', esquema)]
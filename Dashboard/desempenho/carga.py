@@ -0,0 +1,359 @@
+"""Teste de carga: quantas sessões simultâneas um processo do dashboard aguenta.
+
+Cada sessão é um navegador sem tela: abre o websocket do servidor, como o
+frontend do Streamlit, e segue o ROTEIRO (troca a eleição, a seção, o
+estado, o município e o estado civil), esperando cada execução da página
+terminar antes do passo seguinte. Para cada nível de concorrência (número
+de sessões ao mesmo tempo) mede:
+
+- latência de cada execução da página (p50, p95, p99), do pedido ao fim
+  do script, no geral e por passo do roteiro;
+- vazão: execuções terminadas por segundo, somando as sessões;
+- memória residente do processo do servidor durante o nível (máxima) e
+  no fim.
+
+Rode da raiz do repositório:
+
+    python Dashboard/desempenho/carga.py [--concorrencia 1 2 4 8 16]
+        [--roteiros 2] [--pausa 0] [--json saida.json]
+
+Sem --endereco o próprio teste sobe `streamlit run Dashboard/app.py` numa
+porta livre e o encerra no fim; com --endereco (http://host:porta) mede um
+servidor já no ar, e a memória só aparece com --pid. Antes do primeiro
+nível uma sessão percorre o roteiro sem medir, para os caches do servidor
+não pesarem só no nível 1 (--frio desliga).
+
+As sessões rodam todas neste processo; se ele dividir a máquina com o
+servidor, o custo dos clientes (pouco, só ler as mensagens) entra na
+medida.
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+
+APP = 'Dashboard/app.py'
+CONCORRENCIA = [1, 2, 4, 8]
+PERCENTIS = [50, 95, 99]
+# Intervalo entre as leituras da memória do servidor, em segundos
+AMOSTRAGEM = 0.2
+
+# Passos de cada sessão: (widget, opção). O widget é a key dele ou, se não
+# tiver key, o rótulo; opção None escolhe uma ao acaso entre as do widget.
+ROTEIRO = [
+    ('dados', 'Estadual - 2º turno'),
+    ('secao', 'Estado civil'),
+    ('estados', None),
+    ('Selecione o estado civil', None),
+    ('dados', 'Municipal - 2º turno'),
+    ('estadosAnalfabetismoPercentualMunicipal', None),
+    ('analfabetismoPercentualMunicipal', None),
+    ('Selecione o estado civil', None),
+    ('dados', 'Estadual - 1º turno'),
+    ('secao', 'Sexo'),
+]
+ABERTURA = 'abertura'
+
+FIM_DA_PAGINA = ForwardMsg.FINISHED_SUCCESSFULLY
+FIM_DO_FRAGMENTO = ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY
+WIDGETS_DE_OPCOES = ('selectbox', 'radio')
+
+
+class Widget:
+    """Um selectbox ou radio da última execução da página."""
+
+    def __init__(self, id, rotulo, opcoes, fragmento):
+        self.id = id
+        self.rotulo = rotulo
+        self.opcoes = opcoes
+        self.fragmento = fragmento
+
+    def chamado(self, nome):
+        # O id de um widget com key termina em '-<key>'
+        return self.id.endswith('-' + nome) or self.rotulo == nome
+
+
+class Sessao:
+    """Uma sessão do navegador no servidor em endereco (http://host:porta)."""
+
+    def __init__(self, endereco):
+        self.endereco = endereco
+        self.conexao = None
+        self.widgets = {}
+        # Valores que a sessão escolheu, reenviados a cada execução como o
+        # frontend faz: {id: índice da opção}
+        self.escolhas = {}
+
+    async def abre(self):
+        self.conexao = await websocket_connect(
+            self.endereco.replace('http', 'ws', 1) + '/_stcore/stream',
+            max_message_size=1 << 30)
+
+    def fecha(self):
+        if self.conexao is not None:
+            self.conexao.close()
+
+    def widget(self, nome):
+        for widget in self.widgets.values():
+            if widget.chamado(nome):
+                return widget
+        raise LookupError('widget %r não está na página' % nome)
+
+    async def roda(self, widget=None, indice=None):
+        """Roda a página, ou só o fragmento de widget, depois de escolher a
+        opção indice em widget.
+
+        Devolve (segundos, bytes recebidos, mensagens de exceção da página).
+        """
+        pedido = BackMsg()
+        estado = pedido.rerun_script
+        # Sem escolhas a mensagem ficaria vazia e o servidor a ignoraria
+        estado.SetInParent()
+        if widget is not None:
+            self.escolhas[widget.id] = indice
+            if widget.fragmento:
+                estado.fragment_id = widget.fragmento
+        for id, escolha in self.escolhas.items():
+            if id in self.widgets:
+                valor = estado.widget_states.widgets.add()
+                valor.id = id
+                valor.int_value = escolha
+        if not estado.fragment_id:
+            self.widgets = {}
+        inicio = time.perf_counter()
+        await self.conexao.write_message(pedido.SerializeToString(),
+                                         binary=True)
+        recebidos, erros = 0, []
+        while True:
+            bruta = await self.conexao.read_message()
+            if bruta is None:
+                raise ConnectionError('sessão fechada pelo servidor')
+            recebidos += len(bruta)
+            mensagem = ForwardMsg()
+            mensagem.ParseFromString(bruta)
+            tipo = mensagem.WhichOneof('type')
+            if tipo == 'delta':
+                self._le_delta(mensagem.delta, erros)
+            elif tipo == 'script_finished':
+                segundos = time.perf_counter() - inicio
+                if mensagem.script_finished not in (FIM_DA_PAGINA,
+                                                    FIM_DO_FRAGMENTO):
+                    erros.append('execução terminou com %s' % ForwardMsg
+                                 .ScriptFinishedStatus.Name(
+                                     mensagem.script_finished))
+                return segundos, recebidos, erros
+
+    def _le_delta(self, delta, erros):
+        if delta.WhichOneof('type') != 'new_element':
+            return
+        elemento = delta.new_element
+        tipo = elemento.WhichOneof('type')
+        if tipo == 'exception':
+            erros.append(elemento.exception.message)
+        elif tipo in WIDGETS_DE_OPCOES:
+            proto = getattr(elemento, tipo)
+            self.widgets[proto.id] = Widget(proto.id, proto.label,
+                                            list(proto.options),
+                                            delta.fragment_id)
+
+
+async def percorre(endereco, roteiro, roteiros, pausa, sorteio, medidas):
+    """Uma sessão: abre a página e segue roteiro roteiros vezes.
+
+    Cada execução vai para medidas como (passo, segundos, bytes, erros).
+    """
+    sessao = Sessao(endereco)
+    try:
+        await sessao.abre()
+        medidas.append((ABERTURA,) + await sessao.roda())
+        for _ in range(roteiros):
+            for nome, opcao in roteiro:
+                await asyncio.sleep(pausa)
+                try:
+                    widget = sessao.widget(nome)
+                    indice = (widget.opcoes.index(opcao) if opcao is not None
+                              else sorteio.randrange(len(widget.opcoes)))
+                except (LookupError, ValueError) as erro:
+                    medidas.append((nome, None, 0, [str(erro)]))
+                    continue
+                medidas.append((nome,) + await sessao.roda(widget, indice))
+    except Exception as erro:
+        medidas.append((ABERTURA, None, 0, [repr(erro)]))
+    finally:
+        sessao.fecha()
+
+
+def rss_mb(pid):
+    """Memória residente atual e máxima do processo pid, em MB."""
+    campos = {}
+    with open('/proc/%d/status' % pid) as status:
+        for linha in status:
+            nome, _, valor = linha.partition(':')
+            if nome in ('VmRSS', 'VmHWM'):
+                # Vem em kB
+                campos[nome] = int(valor.split()[0]) / 2 ** 10
+    return campos['VmRSS'], campos['VmHWM']
+
+
+async def amostra_memoria(pid, amostras):
+    while True:
+        amostras.append(rss_mb(pid)[0])
+        await asyncio.sleep(AMOSTRAGEM)
+
+
+def percentil(valores, p):
+    """Percentil p de valores pelo posto mais próximo."""
+    ordenados = sorted(valores)
+    posto = max(1, -(-p * len(ordenados) // 100))
+    return ordenados[posto - 1]
+
+
+def resume_latencias(segundos):
+    if not segundos:
+        return {}
+    return {'p%d_s' % p: percentil(segundos, p) for p in PERCENTIS}
+
+
+async def mede_nivel(endereco, sessoes, roteiro, roteiros, pausa, semente,
+                     pid):
+    """Medidas de sessoes percorrendo roteiro ao mesmo tempo."""
+    medidas, amostras = [], []
+    memoria = (asyncio.create_task(amostra_memoria(pid, amostras))
+               if pid else None)
+    inicio = time.perf_counter()
+    await asyncio.gather(*[
+        percorre(endereco, roteiro, roteiros, pausa,
+                 random.Random(semente * 1000 + sessao), medidas)
+        for sessao in range(sessoes)])
+    duracao = time.perf_counter() - inicio
+    if memoria is not None:
+        memoria.cancel()
+
+    feitas = [m for m in medidas if m[1] is not None]
+    segundos = [m[1] for m in feitas]
+    resumo = {'sessoes': sessoes, 'execucoes': len(feitas),
+              'duracao_s': duracao, 'vazao_por_s': len(feitas) / duracao,
+              'mb_recebidos': sum(m[2] for m in medidas) / 2 ** 20}
+    resumo.update(resume_latencias(segundos))
+    resumo['passos'] = {
+        passo: dict(execucoes=len(tempos), **resume_latencias(tempos))
+        for passo in [ABERTURA] + list(dict.fromkeys(n for n, _ in roteiro))
+        for tempos in [[m[1] for m in feitas if m[0] == passo]]}
+    if pid:
+        resumo['rss_max_mb'] = max(amostras + [rss_mb(pid)[0]])
+        resumo['rss_mb'], resumo['pico_rss_mb'] = rss_mb(pid)
+    resumo['erros'] = sorted({'%s: %s' % (m[0], erro)
+                              for m in medidas for erro in m[3]})
+    return resumo
+
+
+def porta_livre():
+    with socket.socket() as soquete:
+        soquete.bind(('localhost', 0))
+        return soquete.getsockname()[1]
+
+
+def sobe_servidor(porta):
+    """Sobe `streamlit run APP` em porta, num processo à parte."""
+    return subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP,
+         '--server.port', str(porta), '--server.headless', 'true',
+         '--browser.gatherUsageStats', 'false'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def espera_servidor(endereco, servidor=None):
+    """Espera o servidor responder ao health check."""
+    cliente = AsyncHTTPClient()
+    while True:
+        if servidor is not None and servidor.poll() is not None:
+            raise RuntimeError('o servidor terminou com código %d'
+                               % servidor.returncode)
+        try:
+            await cliente.fetch(endereco + '/_stcore/health')
+            return
+        except Exception:
+            await asyncio.sleep(AMOSTRAGEM)
+
+
+async def mede(endereco, concorrencia, roteiros, pausa, semente, pid,
+               frio=False, servidor=None):
+    await espera_servidor(endereco, servidor)
+    if not frio:
+        await percorre(endereco, ROTEIRO, 1, 0, random.Random(semente), [])
+    resumos = []
+    for sessoes in concorrencia:
+        resumos.append(await mede_nivel(endereco, sessoes, ROTEIRO, roteiros,
+                                        pausa, semente, pid))
+        mostra(resumos[-1:], cabecalho=len(resumos) == 1)
+    return resumos
+
+
+def mostra(resumos, cabecalho=True):
+    if cabecalho:
+        print('%7s %10s %8s %8s %8s %10s %11s %11s' % (
+            'sessões', 'execuções', 'p50 (s)', 'p95 (s)', 'p99 (s)',
+            'vazão/s', 'RSS máx', 'RSS fim'))
+    for r in resumos:
+        memoria = (('%8.0f MB %8.0f MB' % (r['rss_max_mb'], r['rss_mb']))
+                   if 'rss_mb' in r else '%11s %11s' % ('-', '-'))
+        print('%7d %10d %8.2f %8.2f %8.2f %10.2f %s' % (
+            r['sessoes'], r['execucoes'], r.get('p50_s', float('nan')),
+            r.get('p95_s', float('nan')), r.get('p99_s', float('nan')),
+            r['vazao_por_s'], memoria))
+        for erro in r['erros']:
+            print('    erro:', erro.splitlines()[0])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Latência das execuções da página, vazão e memória do '
+                    'servidor do dashboard com cada vez mais sessões '
+                    'simultâneas seguindo o mesmo roteiro.')
+    parser.add_argument('--concorrencia', nargs='+', type=int,
+                        default=CONCORRENCIA,
+                        help='sessões simultâneas de cada nível')
+    parser.add_argument('--roteiros', type=int, default=1,
+                        help='vezes que cada sessão segue o roteiro')
+    parser.add_argument('--pausa', type=float, default=0,
+                        help='segundos entre os passos de uma sessão, o '
+                             'tempo de leitura do usuário')
+    parser.add_argument('--semente', type=int, default=0,
+                        help='semente das escolhas ao acaso')
+    parser.add_argument('--endereco',
+                        help='servidor já no ar (http://host:porta); sem '
+                             'ele o teste sobe o seu')
+    parser.add_argument('--pid', type=int,
+                        help='processo do servidor em --endereco, para a '
+                             'memória')
+    parser.add_argument('--frio', action='store_true',
+                        help='não percorre o roteiro antes de medir')
+    parser.add_argument('--json', help='grava os resumos também em JSON')
+    args = parser.parse_args()
+
+    servidor = None
+    endereco, pid = args.endereco, args.pid
+    if endereco is None:
+        porta = porta_livre()
+        servidor = sobe_servidor(porta)
+        endereco, pid = 'http://localhost:%d' % porta, servidor.pid
+    try:
+        resumos = asyncio.run(mede(endereco.rstrip('/'), args.concorrencia,
+                                   args.roteiros, args.pausa, args.semente,
+                                   pid, args.frio, servidor))
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait()
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resumos, arquivo, ensure_ascii=False, indent=1)
@@ -0,0 +1,124 @@
+"""Mede o início a frio do dashboard em cada eleição.
+
+Para cada eleição um processo novo, como um worker recém-criado, mede:
+
+- importacao: tempo dos imports do topo de app.py;
+- renderizacao: tempo da primeira execução da página (AppTest), com os
+  caches vazios;
+- rss_importacao / rss: memória residente depois dos imports e depois da
+  página, e o pico do processo.
+
+Rode da raiz do repositório:
+
+    python Dashboard/desempenho/inicio.py [--repeticoes 3] [--json saida.json]
+
+Com mais de uma repetição vale a mediana de cada medida.
+"""
+import argparse
+import ast
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+APP = 'Dashboard/app.py'
+ELEICOES = ['Estadual - 1º turno', 'Estadual - 2º turno',
+            'Municipal - 1º turno', 'Municipal - 2º turno']
+MEDIDAS = ['importacao_s', 'renderizacao_s', 'rss_importacao_mb', 'rss_mb',
+           'pico_rss_mb']
+
+
+def rss_mb():
+    """Memória residente atual do processo, em MB."""
+    with open('/proc/self/statm') as statm:
+        paginas = int(statm.read().split()[1])
+    return paginas * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def pico_rss_mb():
+    # ru_maxrss vem em KB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def importacoes(caminho):
+    """Só os import do topo do arquivo, compilados à parte."""
+    with open(caminho, encoding='utf-8') as arquivo:
+        arvore = ast.parse(arquivo.read(), caminho)
+    corpo = [no for no in arvore.body
+             if isinstance(no, (ast.Import, ast.ImportFrom))]
+    return compile(ast.Module(body=corpo, type_ignores=[]), caminho, 'exec')
+
+
+def mede(eleicao):
+    """Medidas de um início a frio de eleicao neste processo."""
+    sys.path.insert(0, os.path.dirname(APP))
+    inicio = time.perf_counter()
+    exec(importacoes(APP), {'__name__': '__inicio__'})
+    importacao = time.perf_counter() - inicio
+    rss_importacao = rss_mb()
+
+    from streamlit.testing.v1 import AppTest
+    pagina = AppTest.from_file(APP, default_timeout=600)
+    pagina.session_state['dados'] = eleicao
+    inicio = time.perf_counter()
+    pagina.run()
+    return {'eleicao': eleicao, 'importacao_s': importacao,
+            'renderizacao_s': time.perf_counter() - inicio,
+            'rss_importacao_mb': rss_importacao, 'rss_mb': rss_mb(),
+            'pico_rss_mb': pico_rss_mb(),
+            'erros': [str(erro.value) for erro in pagina.exception]}
+
+
+def mede_em_processo(eleicao):
+    saida = subprocess.run([sys.executable, __file__, '--filho', eleicao],
+                           capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout.splitlines()[-1])
+
+
+def resume(medicoes):
+    """Mediana de cada medida; erros de qualquer repetição."""
+    resumo = {'eleicao': medicoes[0]['eleicao']}
+    for medida in MEDIDAS:
+        resumo[medida] = statistics.median(m[medida] for m in medicoes)
+    resumo['erros'] = sorted({erro for m in medicoes for erro in m['erros']})
+    return resumo
+
+
+def mostra(resumos):
+    print('%-22s %11s %14s %13s %8s %10s' % (
+        'eleição', 'import (s)', 'primeira (s)', 'RSS import', 'RSS',
+        'pico RSS'))
+    for r in resumos:
+        print('%-22s %11.2f %14.2f %10.0f MB %5.0f MB %7.0f MB' % (
+            r['eleicao'], r['importacao_s'], r['renderizacao_s'],
+            r['rss_importacao_mb'], r['rss_mb'], r['pico_rss_mb']))
+        for erro in r['erros']:
+            print('    erro:', erro.splitlines()[0])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Tempo de importação, da primeira renderização e '
+                    'memória do dashboard em cada eleição, cada medição '
+                    'em um processo novo.')
+    parser.add_argument('--eleicoes', nargs='+', choices=ELEICOES,
+                        default=ELEICOES)
+    parser.add_argument('--repeticoes', type=int, default=1)
+    parser.add_argument('--json', help='grava as medições também em JSON')
+    parser.add_argument('--filho', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.filho:
+        print(json.dumps(mede(args.filho)))
+        sys.exit(0)
+
+    resumos = [resume([mede_em_processo(eleicao)
+                       for _ in range(args.repeticoes)])
+               for eleicao in args.eleicoes]
+    mostra(resumos)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(resumos, arquivo, ensure_ascii=False, indent=1)
@@ -0,0 +1,116 @@
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+from dados import cache_resource
+
+TAMANHO_CACHE = 512
+
+# Seções de análise da página; só a aberta é calculada e enviada ao navegador
+SECOES = ['Sexo', 'Estado civil', 'Escolaridade', 'Analfabetos',
+          'Deficiência', 'Facultativo']
+
+# Painel que reroda sozinho quando um widget dele muda: st.fragment a partir
+# do Streamlit 1.37, experimental_fragment desde o 1.33. Antes disso o
+# painel roda junto com a página inteira, como sempre.
+fragmento = (getattr(st, 'fragment', None)
+             or getattr(st, 'experimental_fragment', None)
+             or (lambda funcao: funcao))
+
+
+class CacheFiguras:
+    """LRU de figuras já montadas, com contadores de uso.
+
+    A chave é o id do gráfico mais todas as entradas de que ele depende
+    (eleição, estado, município, filtros); uma mesma chave sempre gera a
+    mesma figura, então ela pode ser servida a qualquer sessão. A figura
+    fica como objeto, não como JSON: o st.plotly_chart só a copia para
+    dicionário e serializa, sem validá-la de novo. Quem recebe uma figura
+    do cache não deve alterá-la.
+
+    Duas sessões que pedem a mesma chave ausente ao mesmo tempo não a
+    montam duas vezes: a segunda espera a trava da chave e recebe a
+    figura da primeira.
+    """
+
+    def __init__(self, tamanho=TAMANHO_CACHE):
+        self.tamanho = tamanho
+        self.acertos = 0
+        self.faltas = 0
+        self._figuras = OrderedDict()
+        self._trava = threading.Lock()
+        # Travas das chaves sendo montadas agora: chave -> Lock
+        self._montando = {}
+
+    def _acha(self, chave):
+        # Chamado com self._trava
+        figura = self._figuras.get(chave)
+        if figura is not None:
+            self._figuras.move_to_end(chave)
+            self.acertos += 1
+        return figura
+
+    def get(self, chave, monta, *args):
+        with self._trava:
+            figura = self._acha(chave)
+            if figura is not None:
+                return figura
+            trava_chave = self._montando.setdefault(chave, threading.Lock())
+        with trava_chave:
+            with self._trava:
+                figura = self._acha(chave)
+                if figura is not None:
+                    return figura
+                self.faltas += 1
+            try:
+                figura = monta(*args)
+                with self._trava:
+                    self._figuras[chave] = figura
+                    while len(self._figuras) > self.tamanho:
+                        self._figuras.popitem(last=False)
+            finally:
+                with self._trava:
+                    self._montando.pop(chave, None)
+        return figura
+
+    def estatisticas(self):
+        return {'figuras': len(self._figuras), 'acertos': self.acertos,
+                'faltas': self.faltas}
+
+
+@cache_resource
+def get_cache_figuras():
+    return CacheFiguras()
+
+
+def mostra_figura(chave, monta, *args):
+    """Desenha a figura chave; monta(*args) só roda se ela não está em cache."""
+    figura = get_cache_figuras().get(chave, monta, *args)
+    st.plotly_chart(figura, use_container_width=True)
+
+
+def escolhe_secao():
+    """Abas das seções: devolve a aberta, que fica guardada na sessão."""
+    return st.radio('Seção', SECOES, horizontal=True, key='secao',
+                    label_visibility='collapsed')
+
+
+def _parametro(nome):
+    # st.query_params a partir do Streamlit 1.30
+    parametros = getattr(st, 'query_params', None)
+    if parametros is not None:
+        return parametros.get(nome)
+    return (st.experimental_get_query_params().get(nome) or [None])[0]
+
+
+def aplica_parametros(opcoes):
+    """Leva os parâmetros do endereço (?dados=...&secao=...) aos widgets de
+    mesma chave antes de eles existirem, se forem uma das opcoes[chave].
+
+    Depois que o widget é criado o valor dele vale mais que o endereço.
+    """
+    for chave, validas in opcoes.items():
+        valor = _parametro(chave)
+        if chave not in st.session_state and valor in validas:
+            st.session_state[chave] = valor
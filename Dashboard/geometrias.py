@@ -0,0 +1,136 @@
+import os
+
+from dados import cache_resource
+
+# geopandas, pyogrio e pyarrow só são importados quando um estado é
+# escolhido ou o mapa é clicado, não no início da página
+
+# GeoPackages gerados por code/mapas (mapas.geometria.exporta_geopackage),
+# um por camada e nível de detalhe, com as coordenadas e a ordem das
+# feições do GeoJSON servido ao navegador
+PASTA_GEOMETRIAS = 'Dashboard/data/geo'
+
+# Chaves de cada camada, as mesmas colunas das tabelas df_*
+CHAVES = {
+    'estados': ['estado'],
+    'municipios': ['estado', 'municipio'],
+}
+
+# Contornos simplificados dos estados, usados só para o retângulo de busca
+# de cada UF
+CONTORNOS_ESTADOS = os.path.join(PASTA_GEOMETRIAS, 'estados_baixa.parquet')
+
+# Folga do retângulo de busca, em graus: o contorno simplificado não segue
+# exatamente a divisa dos outros níveis
+FOLGA_BBOX = 0.1
+
+# Recortes já lidos, em Arrow IPC sem compressão: o WKB é mapeado em
+# memória direto do arquivo e as páginas são compartilhadas entre processos
+PASTA_CACHE = 'Dashboard/data/geo/cache'
+
+# GeoJSON de cada recorte servido ao mapa coroplético, dentro da pasta dos
+# mapas (mapas.PASTA_MAPAS)
+PASTA_WEB = 'Dashboard/data/charts'
+PASTA_RECORTES_WEB = 'geo/recortes'
+
+# Um GeoPackage é um banco SQLite; um ponteiro do Git LFS não é
+CABECALHO_GPKG = b'SQLite format 3\0'
+
+
+def caminho_fonte(camada, detalhe):
+    return os.path.join(PASTA_GEOMETRIAS, camada + '_' + detalhe + '.gpkg')
+
+
+def tem_fonte(camada, detalhe):
+    """Indica se o GeoPackage da camada no nível detalhe está no disco (e
+    não só o ponteiro do Git LFS)."""
+    try:
+        with open(caminho_fonte(camada, detalhe), 'rb') as arquivo:
+            return arquivo.read(len(CABECALHO_GPKG)) == CABECALHO_GPKG
+    except OSError:
+        return False
+
+
+@cache_resource
+def get_bboxes():
+    """Retângulo (xmin, ymin, xmax, ymax) de cada UF, com FOLGA_BBOX."""
+    import geopandas as gpd
+
+    contornos = gpd.read_parquet(CONTORNOS_ESTADOS)
+    limites = contornos.geometry.bounds
+    limites[['minx', 'miny']] -= FOLGA_BBOX
+    limites[['maxx', 'maxy']] += FOLGA_BBOX
+    return dict(zip(contornos['estado'],
+                    limites.itertuples(index=False, name=None)))
+
+
+def le_recorte(camada, estado, detalhe):
+    """Lê do GeoPackage só as feições de estado, com as chaves e a geometria.
+
+    O retângulo da UF usa o índice espacial do GeoPackage e o WHERE descarta
+    as feições de vizinhos que caem no retângulo; nenhuma outra coluna é
+    lida. Devolve uma tabela Arrow com a geometria em WKB.
+    """
+    import pyogrio
+
+    _, tabela = pyogrio.read_arrow(caminho_fonte(camada, detalhe),
+                                   columns=CHAVES[camada],
+                                   bbox=get_bboxes()[estado],
+                                   where="estado = '%s'" % estado.replace("'", "''"))
+    return tabela
+
+
+def caminho_recorte(camada, estado, detalhe):
+    return os.path.join(PASTA_CACHE,
+                        camada + '_' + detalhe + '_' + estado + '.arrow')
+
+
+def _atualizado(caminho, origem):
+    return (os.path.exists(caminho)
+            and os.path.getmtime(caminho) >= os.path.getmtime(origem))
+
+
+@cache_resource
+def get_geometria(camada, estado, detalhe):
+    """Feições de estado na camada ('estados' ou 'municipios'), no nível
+    detalhe de code/mapas.
+
+    O recorte é lido do GeoPackage na primeira vez e gravado em PASTA_CACHE;
+    daí em diante (e em outros processos) vem do arquivo mapeado em memória,
+    até o GeoPackage mudar.
+    """
+    import geopandas as gpd
+    import pyarrow as pa
+
+    caminho = caminho_recorte(camada, estado, detalhe)
+    if not _atualizado(caminho, caminho_fonte(camada, detalhe)):
+        tabela = le_recorte(camada, estado, detalhe)
+        os.makedirs(PASTA_CACHE, exist_ok=True)
+        temporario = caminho + '.%d' % os.getpid()
+        with pa.OSFile(temporario, 'wb') as destino:
+            with pa.ipc.new_file(destino, tabela.schema) as escritor:
+                escritor.write_table(tabela)
+        os.replace(temporario, caminho)
+    tabela = pa.ipc.open_file(pa.memory_map(caminho)).read_all()
+    return gpd.GeoDataFrame.from_arrow(tabela).rename_geometry('geometry')
+
+
+@cache_resource
+def get_recorte_web(camada, estado, detalhe):
+    """GeoJSON das feições de estado (get_geometria) para o mapa coroplético.
+
+    Gravado uma vez em PASTA_WEB/PASTA_RECORTES_WEB, com as feições na
+    ordem de get_geometria; devolve o caminho relativo a PASTA_WEB.
+    """
+    relativo = (PASTA_RECORTES_WEB + '/' + camada + '_' + detalhe + '_'
+                + estado + '.json')
+    caminho = os.path.join(PASTA_WEB, relativo)
+    if _atualizado(caminho, caminho_fonte(camada, detalhe)):
+        return relativo
+    gdf = get_geometria(camada, estado, detalhe)
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = caminho + '.%d' % os.getpid()
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(gdf.to_json(drop_id=True, ensure_ascii=False))
+    os.replace(temporario, caminho)
+    return relativo
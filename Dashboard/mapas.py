@@ -0,0 +1,303 @@
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+import streamlit.components.v1 as components
+
+from dados import (TABELAS, cache_resource, caminho_tabela, get_coluna,
+                   get_indice, get_limites)
+from figuras import fragmento
+from geometrias import get_geometria, get_recorte_web, tem_fonte
+
+# Os mapas em HTML são servidos como arquivos pelo próprio servidor do
+# Streamlit (rota dos componentes), que responde com ETag e gzip; a página
+# só recebe o caminho do mapa, e o navegador revalida o arquivo com um 304
+# em vez de receber o documento inteiro a cada rerun.
+PASTA_MAPAS = os.path.abspath('Dashboard/data/charts')
+
+# Geometrias simplificadas geradas por code/mapas: o GeoParquet fica em
+# PASTA_GEOMETRIAS e o GeoJSON servido ao navegador em PASTA_MAPAS/geo, com
+# as feições na mesma ordem
+PASTA_GEOMETRIAS = 'Dashboard/data/geo'
+DETALHE_MAPA = 'media'
+
+# Grade hexagonal de code/mapas (mapas.hexagonos) mostrada na visão
+# nacional dos municípios; a partir de ZOOM_MUNICIPIOS, já na escala de um
+# estado, o navegador troca a grade pelos municípios
+GRADE = 'hexagonos'
+ZOOM_MUNICIPIOS = 6
+
+# Nível usado para achar a feição clicada: o mais fiel às divisas
+DETALHE_CLIQUE = 'alta'
+
+# Indicadores que podem colorir o mapa coroplético
+METRICAS_MAPA = {
+    'Comparecimento': 'comparecimento_percentual(%)',
+    'Abstenção': 'abstencao_percentual(%)',
+    'Eleitorado feminino': 'eleitorado_feminino_percentual(%)',
+    'Eleitorado masculino': 'eleitorado_masculino_percentual(%)',
+    'Analfabetos': 'analfabeto_percentual(%)',
+    'Eleitores com deficiência': 'eleitores_deficiencia_percentual(%)',
+    'Eleitorado facultativo': 'eleitorado_facultativo_percentual(%)',
+    'Superior completo': 'superior_completo_percentual(%)',
+}
+
+# Miniaturas em imagem geradas por code/mapas, mostradas no lugar do mapa
+# interativo até ele ser pedido: a página aparece sem esperar o Leaflet e a
+# geometria
+PASTA_IMAGENS = 'Dashboard/data/imagens'
+
+# Unidade de cada camada no título do mapa
+UNIDADES = {'estados': 'estado', 'municipios': 'município'}
+
+# Mapa de fundo: os tiles extraídos por code/mapas (--mbtiles) quando
+# existem, para funcionar sem acesso à internet, ou o OpenStreetMap
+PASTA_TILES = os.path.join(PASTA_MAPAS, 'tiles')
+FUNDO_OSM = {
+    'url': 'https://tile.openstreetmap.org/{z}/{x}/{y}.png',
+    'atribuicao': '&copy; <a href="https://www.openstreetmap.org/copyright">'
+                  'OpenStreetMap</a>',
+    'zoom_maximo': 19,
+}
+
+# Uma cor por classe (YlGn do ColorBrewer)
+CORES = ['#ffffcc', '#c2e699', '#78c679', '#31a354', '#006837']
+
+# Esquemas de classificação calculados por code/mapas (mapas.classes)
+ESQUEMAS_MAPA = {
+    'Fisher-Jenks': 'fisher_jenks',
+    'Quantis': 'quantis',
+    'Quebras naturais': 'quebras_naturais',
+}
+
+# st.rerun a partir do Streamlit 1.27, experimental_rerun antes disso
+rerun = getattr(st, 'rerun', None) or st.experimental_rerun
+
+_componente_mapa = components.declare_component('mapa', path=PASTA_MAPAS)
+
+
+def mostra_mapa(mapa, height, width=None):
+    """Mostra o mapa em PASTA_MAPAS/mapa, como o components.html fazia."""
+    _componente_mapa(mapa=mapa, altura=height, largura=width, key=mapa,
+                     default=None)
+
+
+def camada_dados(dados):
+    return 'estados' if TABELAS[dados][1] == ['estado'] else 'municipios'
+
+
+def tem_camada(camada, detalhe=DETALHE_MAPA):
+    """Indica se code/mapas já gerou a geometria da camada."""
+    return os.path.exists(os.path.join(PASTA_MAPAS, 'geo',
+                                       camada + '_' + detalhe + '.json'))
+
+
+@cache_resource
+def get_fundo():
+    """Endereço, atribuição e zoom máximo do mapa de fundo."""
+    caminho = os.path.join(PASTA_TILES, 'metadata.json')
+    if not os.path.exists(caminho):
+        return FUNDO_OSM
+    with open(caminho, encoding='utf-8') as arquivo:
+        metadados = json.load(arquivo)
+    return {'url': 'tiles/{z}/{x}/{y}.' + metadados['formato'],
+            'atribuicao': metadados['atribuicao'],
+            'zoom_maximo': metadados['zoom_maximo']}
+
+
+def usa_recorte(camada, estado):
+    """Indica se o mapa de estado usa só as feições dele, lidas do
+    GeoPackage de code/mapas (geometrias.get_recorte_web), no lugar da
+    camada inteira."""
+    return estado is not None and tem_fonte(camada, DETALHE_MAPA)
+
+
+@cache_resource
+def get_valores_mapa(dados, metrica, estado=None):
+    """Valores de metrica na ordem das feições da camada, ou só das de
+    estado (usa_recorte), arredondados para duas casas, None onde a tabela
+    não tem a feição."""
+    chaves = TABELAS[dados][1]
+    camada = camada_dados(dados)
+    if usa_recorte(camada, estado):
+        ordem = get_geometria(camada, estado, DETALHE_MAPA)[chaves]
+    else:
+        ordem = pd.read_parquet(os.path.join(
+            PASTA_GEOMETRIAS, camada + '_' + DETALHE_MAPA + '.parquet'),
+            columns=chaves)
+    linha_chave = get_indice(dados)[1]
+    posicoes = np.array([linha_chave.get(chave, -1) for chave
+                         in ordem.itertuples(index=False, name=None)])
+    coluna = get_coluna(dados, metrica)
+    valores = np.where(posicoes >= 0, coluna.to_numpy()[posicoes], np.nan)
+    return [None if np.isnan(valor) else valor
+            for valor in valores.round(2).tolist()]
+
+
+def tem_grade(dados):
+    """Indica se code/mapas gerou a grade hexagonal e as médias de dados."""
+    return (os.path.exists(os.path.join(PASTA_MAPAS, 'geo', GRADE + '.json'))
+            and os.path.exists(caminho_tabela(dados, '_hexagonos')))
+
+
+@cache_resource
+def get_valores_grade(dados, metrica):
+    """Médias de metrica na ordem das células da grade, None nas células
+    sem município da tabela."""
+    celulas = len(pd.read_parquet(
+        os.path.join(PASTA_GEOMETRIAS, GRADE + '.parquet'),
+        columns=['hexagono']))
+    medias = pd.read_parquet(caminho_tabela(dados, '_hexagonos'),
+                             columns=['hexagono', metrica])
+    valores = medias.set_index('hexagono')[metrica].reindex(range(celulas))
+    return [None if np.isnan(valor) else valor for valor in valores.tolist()]
+
+
+def cores_classes(classes):
+    """classes cores de CORES, espalhadas do mais claro ao mais escuro."""
+    return [CORES[i] for i in np.linspace(0, len(CORES) - 1, classes)
+            .round().astype(int)]
+
+
+def caminho_miniatura(dados, metrica, esquema):
+    """Miniatura gerada por code/mapas (mapas.imagens), ou None se não há."""
+    caminho = os.path.join(PASTA_IMAGENS, TABELAS[dados][0],
+                           re.sub(r'\W+', '_', metrica).strip('_')
+                           + '_' + esquema + '.webp')
+    return caminho if os.path.exists(caminho) else None
+
+
+def mapa_pedido(chave):
+    """Indica se o mapa interativo chave já foi pedido nesta sessão."""
+    return chave in st.session_state.get('mapasPedidos', ())
+
+
+def _pede_mapa(chave):
+    st.session_state.setdefault('mapasPedidos', set()).add(chave)
+
+
+def botao_mapa(chave, rotulo='Abrir mapa interativo'):
+    """Botão que pede o mapa interativo chave; depois dele o mapa continua
+    interativo pelo resto da sessão."""
+    st.button(rotulo, key='abreMapa_' + chave, on_click=_pede_mapa,
+              args=(chave,))
+
+
+def mostra_coropletico(dados, metrica, height, width=None,
+                       esquema='fisher_jenks', estado=None):
+    """Mapa coroplético de metrica sobre a camada da eleição dados.
+
+    As classes são as calculadas por code/mapas no esquema, para o Brasil
+    ou, com estado, só para os municípios dele; o mapa então enquadra o
+    estado e recebe só as feições dele (usa_recorte), ou apaga as demais
+    quando o GeoPackage da camada não está no disco. A página do mapa fica
+    aberta entre reruns (a chave é a mesma para qualquer metrica) e guarda
+    a geometria; a cada troca só os valores e as classes vão para o
+    navegador.
+
+    Até o mapa ser pedido (botao_mapa) a visão do Brasil mostra só a
+    miniatura, quando code/mapas a gerou. Na visão do Brasil dos municípios
+    o mapa começa pela grade hexagonal (tem_grade) e só baixa os municípios
+    ao chegar em ZOOM_MUNICIPIOS.
+    """
+    camada = camada_dados(dados)
+    miniatura = caminho_miniatura(dados, metrica, esquema)
+    if estado is None and miniatura and not mapa_pedido(camada):
+        st.image(miniatura, width=width)
+        botao_mapa(camada)
+        return
+    minimo, limites = get_limites(dados, metrica, esquema, estado)
+    if usa_recorte(camada, estado):
+        geometria = get_recorte_web(camada, estado, DETALHE_MAPA)
+    else:
+        geometria = 'geo/' + camada + '_' + DETALHE_MAPA + '.json'
+    valores = {'valores': get_valores_mapa(dados, metrica, estado),
+               'minimo': minimo, 'limites': limites,
+               'cores': cores_classes(len(limites)), 'estado': estado,
+               'camada': geometria, 'base': get_fundo()}
+    if camada == 'municipios' and estado is None and tem_grade(dados):
+        minimo, limites = get_limites(dados, metrica, esquema,
+                                      sufixo='_hexagonos_classes')
+        valores['agregado'] = {
+            'valores': get_valores_grade(dados, metrica), 'minimo': minimo,
+            'limites': limites, 'cores': cores_classes(len(limites)),
+            'camada': 'geo/' + GRADE + '.json', 'zoom': ZOOM_MUNICIPIOS}
+    clique = _componente_mapa(mapa='coropletico.html', altura=height,
+                              largura=width, valores=valores,
+                              key='coropletico_' + camada, default=None)
+    _trata_clique(camada, clique)
+
+
+@fragmento
+def painel_coropletico(dados, height, width=None, estado=None):
+    """Seletores de indicador e de classificação e o mapa coroplético.
+
+    Como fragmento, trocar o indicador ou a classificação só reroda este
+    painel; um clique no mapa ainda reroda a página (ver _trata_clique).
+    """
+    camada = camada_dados(dados)
+    sufixo = camada.capitalize()
+    metrica = st.selectbox('Indicador do mapa', options=list(METRICAS_MAPA),
+                           key='metricaMapa' + sufixo)
+    esquema = st.selectbox('Classificação do mapa',
+                           options=list(ESQUEMAS_MAPA),
+                           key='esquemaMapa' + sufixo)
+    st.write(f'{metrica} percentual por {UNIDADES[camada]}')
+    mostra_coropletico(dados, METRICAS_MAPA[metrica], height, width,
+                       ESQUEMAS_MAPA[esquema], estado)
+
+
+@cache_resource
+def get_arvore(camada, estado=None):
+    """STRtree sobre os polígonos da camada, ou só dos de estado, e a chave
+    de cada polígono."""
+    # geopandas e shapely só são carregados no primeiro clique no mapa
+    import geopandas as gpd
+    import shapely
+
+    if estado is None:
+        gdf = gpd.read_parquet(os.path.join(
+            PASTA_GEOMETRIAS, camada + '_' + DETALHE_CLIQUE + '.parquet'))
+    else:
+        gdf = get_geometria(camada, estado, DETALHE_CLIQUE)
+    chaves = gdf.drop(columns='geometry').itertuples(index=False, name=None)
+    return shapely.STRtree(gdf.geometry.values), list(chaves)
+
+
+def _feicao(arvore, chaves, ponto):
+    achadas = arvore.query(ponto, predicate='intersects')
+    return chaves[achadas[0]] if len(achadas) else None
+
+
+def feicao_no_ponto(camada, longitude, latitude):
+    """Chave da feição da camada que contém o ponto, ou None.
+
+    Com o GeoPackage da camada no disco, o estado do ponto sai da camada
+    leve dos estados e só os municípios dele são lidos (get_geometria);
+    sem ele a busca é na camada inteira de code/mapas.
+    """
+    import shapely
+
+    ponto = shapely.Point(longitude, latitude)
+    if camada == 'estados' or not tem_fonte(camada, DETALHE_CLIQUE):
+        return _feicao(*get_arvore(camada), ponto)
+    estado = _feicao(*get_arvore('estados'), ponto)
+    if estado is None:
+        return None
+    return _feicao(*get_arvore(camada, estado[0]), ponto)
+
+
+def _trata_clique(camada, clique):
+    # O componente devolve o último clique em todo rerun; só um clique novo
+    # vira seleção. Os selectboxes já foram criados neste rerun, então a
+    # chave vai em feicaoClicada e o app a aplica a eles no próximo.
+    if not clique or clique['clique'] == st.session_state.get('ultimoClique'):
+        return
+    st.session_state['ultimoClique'] = clique['clique']
+    chave = feicao_no_ponto(camada, clique['longitude'], clique['latitude'])
+    if chave is not None:
+        st.session_state['feicaoClicada'] = chave
+        rerun()
@@ -0,0 +1,43 @@
+"""Sobe o dashboard com o aquecimento dos caches e um endpoint de prontidão.
+
+Rode da raiz do repositório, no lugar de `streamlit run Dashboard/app.py`:
+
+    python Dashboard/servidor.py --aquecer --porta-prontidao 8502 \
+        [opções do streamlit run, como --server.port 8501]
+
+Com --aquecer, assim que o servidor sobe uma thread abre cada eleição em
+cada seção (aquecimento.py); o balanceador de carga só deve mandar
+usuários quando GET na porta de prontidão responder 200.
+"""
+import argparse
+import os
+import sys
+
+# O Streamlit é importado antes das threads do aquecimento
+from streamlit.web import cli
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import aquecimento  # noqa: E402
+
+APP = 'Dashboard/app.py'
+PORTA_PADRAO = 8501
+
+parser = argparse.ArgumentParser(
+    description='Sobe o dashboard e, com --aquecer, carrega os caches de '
+                'todas as eleições antes de se declarar pronto. As demais '
+                'opções vão para o streamlit run.')
+parser.add_argument('--aquecer', action='store_true',
+                    help='abre cada eleição em cada seção ao subir')
+parser.add_argument('--porta-prontidao', type=int,
+                    help='porta do endpoint de prontidão (200 quando pronto, '
+                         '503 antes ou se o aquecimento falhou)')
+args, opcoes_streamlit = parser.parse_known_args()
+
+porta = argparse.ArgumentParser(add_help=False)
+porta.add_argument('--server.port', dest='porta', type=int,
+                   default=PORTA_PADRAO)
+
+aquecimento.inicia(porta.parse_known_args(opcoes_streamlit)[0].porta,
+                   args.aquecer, args.porta_prontidao)
+sys.argv = ['streamlit', 'run', APP] + opcoes_streamlit
+cli.main()
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Os módulos do dashboard se importam pelo nome, como no streamlit run
+sys.path.insert(0, os.path.join(RAIZ, 'Dashboard'))
+
+
+@pytest.fixture
+def raiz(monkeypatch):
+    """Roda o teste da raiz do repositório, de onde o dashboard lê os dados."""
+    monkeypatch.chdir(RAIZ)
+    return RAIZ
@@ -0,0 +1,40 @@
+import asyncio
+import os
+
+import aquecimento
+from dados import TABELAS, caminho_tabela
+
+
+def test_paginas_so_das_tabelas_geradas(raiz):
+    eleicoes = {pagina['dados'] for pagina in aquecimento.paginas_aquecimento()}
+    assert eleicoes == {dados for dados in TABELAS
+                        if os.path.exists(caminho_tabela(dados))}
+
+
+def _aquece(monkeypatch, erros):
+    async def espera_servidor(endereco):
+        pass
+
+    async def renderiza(endereco, parametros):
+        return 0, 0, erros.get(parametros['dados'], [])
+
+    monkeypatch.setattr(aquecimento, 'espera_servidor', espera_servidor)
+    monkeypatch.setattr(aquecimento, 'renderiza', renderiza)
+    monkeypatch.setattr(aquecimento, 'paginas_aquecimento', lambda: [
+        {'dados': 'A', 'secao': 'Sexo'}, {'dados': 'B', 'secao': 'Sexo'}])
+    prontidao = aquecimento.Prontidao(2)
+    asyncio.run(aquecimento._aquece('http://localhost:0', prontidao))
+    return prontidao
+
+
+def test_aquecimento_sem_erros_fica_pronto(monkeypatch):
+    prontidao = _aquece(monkeypatch, {})
+    assert prontidao.pronto
+    assert prontidao.como_dict()['feitas'] == 2
+
+
+def test_aquecimento_com_erro_falha(monkeypatch):
+    prontidao = _aquece(monkeypatch, {'B': ['KeyError']})
+    assert not prontidao.pronto
+    assert prontidao.situacao == 'falhou'
+    assert prontidao.erros == ['B, Sexo: KeyError']
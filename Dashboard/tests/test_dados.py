@@ -0,0 +1,19 @@
+import pandas as pd
+
+import dados
+
+
+def test_get_coluna_igual_a_coluna_da_tabela(raiz):
+    eleicao = 'Estadual - 1º turno'
+    coluna = 'comparecimento_percentual(%)'
+    lida = pd.read_parquet(dados.caminho_tabela(eleicao), columns=[coluna])
+    assert dados.get_coluna(eleicao, coluna).equals(lida[coluna])
+
+
+def test_registro_le_a_linha_da_chave(raiz):
+    eleicao = 'Estadual - 1º turno'
+    tabela = pd.read_parquet(dados.caminho_tabela(eleicao))
+    linha = tabela[tabela['estado'] == 'SP'].iloc[0]
+    registro = dados.get_registro(eleicao, 'SP')
+    for coluna in ['aptos', 'analfabeto_percentual(%)']:
+        assert registro[coluna] == linha[coluna]
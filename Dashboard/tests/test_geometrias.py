@@ -0,0 +1,72 @@
+import json
+import os
+
+import geopandas as gpd
+import pytest
+import shapely
+
+import geometrias
+
+
+def quadrado(x, y, lado=1):
+    return shapely.box(x, y, x + lado, y + lado)
+
+
+@pytest.fixture
+def municipios(tmp_path, monkeypatch):
+    """GeoPackage com municípios de X e Y; o retângulo de X também pega um
+    município de Y, e um município de X fica fora dele."""
+    gdf = gpd.GeoDataFrame(
+        {'estado': ['X', 'Y', 'Y', 'X'],
+         'municipio': ['A', 'B', 'C', 'D'],
+         'populacao': [1, 2, 3, 4]},
+        geometry=[quadrado(0, 0), quadrado(0.5, 0.5, 0.2), quadrado(10, 10),
+                  quadrado(20, 20)],
+        crs='EPSG:4326')
+    monkeypatch.setattr(geometrias, 'PASTA_GEOMETRIAS', str(tmp_path))
+    arquivo = geometrias.caminho_fonte('municipios', 'alta')
+    gdf.to_file(arquivo, driver='GPKG')
+    monkeypatch.setattr(geometrias, 'get_bboxes',
+                        lambda: {'X': (-0.1, -0.1, 1.1, 1.1)})
+    monkeypatch.setattr(geometrias, 'PASTA_CACHE', str(tmp_path / 'cache'))
+    return arquivo
+
+
+def test_le_recorte_usa_retangulo_e_where(municipios):
+    tabela = geometrias.le_recorte('municipios', 'X', 'alta')
+    # B cai no retângulo mas é de Y (WHERE); D é de X mas fica fora dele
+    assert tabela.column('municipio').to_pylist() == ['A']
+    assert 'populacao' not in tabela.column_names
+
+
+def test_get_geometria_grava_recorte(municipios):
+    gdf = geometrias.get_geometria('municipios', 'X', 'alta')
+    assert list(gdf['municipio']) == ['A']
+    assert gdf.geometry.iloc[0].equals(quadrado(0, 0))
+    assert geometrias._atualizado(
+        geometrias.caminho_recorte('municipios', 'X', 'alta'), municipios)
+
+
+def test_tem_fonte_recusa_ponteiro_lfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometrias, 'PASTA_GEOMETRIAS', str(tmp_path))
+    with open(geometrias.caminho_fonte('municipios', 'alta'), 'w') as ponteiro:
+        ponteiro.write('version https://git-lfs.github.com/spec/v1\n')
+    assert not geometrias.tem_fonte('municipios', 'alta')
+
+
+def test_recorte_web_igual_ao_geojson_de_code_mapas(raiz, tmp_path,
+                                                    monkeypatch):
+    if not geometrias.tem_fonte('estados', 'media'):
+        pytest.skip('code/mapas não gerou estados_media.gpkg')
+    monkeypatch.setattr(geometrias, 'PASTA_CACHE', str(tmp_path / 'cache'))
+    monkeypatch.setattr(geometrias, 'PASTA_WEB', str(tmp_path))
+    with open('Dashboard/data/charts/geo/estados_media.json',
+              encoding='utf-8') as arquivo:
+        camada = json.load(arquivo)['features']
+    for estado in sorted({feicao['properties']['estado'] for feicao in camada}):
+        relativo = geometrias.get_recorte_web('estados', estado, 'media')
+        with open(os.path.join(tmp_path, relativo),
+                  encoding='utf-8') as arquivo:
+            recorte = json.load(arquivo)['features']
+        assert recorte == [feicao for feicao in camada
+                           if feicao['properties']['estado'] == estado]
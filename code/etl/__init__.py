@@ -0,0 +1,8 @@
+from .leitura import (le_perfil, le_blocos, le_trecho, divide_arquivo,
+                      filtra_perfil)
+from .agregacao import (agrega_perfil, agrega_blocos, soma_blocos, monta_tabela,
+                        monta_tabelas, gera_tabelas)
+from .artefatos import FORMATOS, tipa_tabela, salva_tabelas, converte_csvs
+from .percentuais import PERCENTUAIS, percentual, calcula_percentuais
+from .paralelo import agrega_paralelo, gera_tabelas_paralelo
+from .rankings import METRICAS_RANKING, NACIONAL, calcula_rankings
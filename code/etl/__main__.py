@@ -0,0 +1,30 @@
+import argparse
+
+from .agregacao import gera_tabelas
+from .artefatos import FORMATOS, salva_tabelas
+from .leitura import TAMANHO_BLOCO
+from .paralelo import gera_tabelas_paralelo
+
+parser = argparse.ArgumentParser(
+    prog='python -m etl',
+    description='Gera as tabelas df_*_turno_2020 do dashboard a partir do '
+                'perfil_comparecimento_abstencao do TSE.')
+parser.add_argument('perfil', help='caminho do perfil_comparecimento_abstencao_2020.csv')
+parser.add_argument('--destino', default='../Dashboard/data',
+                    help='pasta onde as tabelas são gravadas')
+parser.add_argument('--ano', type=int, default=2020)
+parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO,
+                    help='linhas lidas por vez do arquivo do TSE')
+parser.add_argument('--processos', type=int, default=1,
+                    help='processos que dividem a leitura do arquivo '
+                         '(0 usa todos os núcleos)')
+parser.add_argument('--formato', choices=list(FORMATOS), default='parquet',
+                    help='formato das tabelas gravadas')
+args = parser.parse_args()
+
+if args.processos == 1:
+    tabelas = gera_tabelas(args.perfil, args.ano, args.bloco)
+else:
+    tabelas = gera_tabelas_paralelo(args.perfil, args.ano, args.bloco,
+                                    args.processos or None)
+salva_tabelas(tabelas, args.destino, args.formato)
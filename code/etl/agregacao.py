@@ -0,0 +1,153 @@
+import pandas as pd
+
+from .colunas import (DIMENSOES, QUANTIDADES, GENERO, ESCOLARIDADE,
+                      ESTADO_CIVIL, ESTADO_CIVIL_FAIXA, FAIXA_ETARIA, GENEROS,
+                      ESCOLARIDADES, ESTADOS_CIVIS, FAIXAS,
+                      FAIXAS_FACULTATIVAS, NIVEIS, TABELAS)
+from .leitura import TAMANHO_BLOCO, le_blocos
+from .percentuais import calcula_percentuais
+
+
+def soma_cubo(df):
+    return df.groupby(DIMENSOES, observed=True)[QUANTIDADES].sum().reset_index()
+
+
+def nomeia_categorias(cubo):
+    # Os nomes das categorias passam a ser os sufixos usados nas colunas
+    cubo = cubo.copy()
+    cubo['SG_UF'] = cubo['SG_UF'].astype(str)
+    cubo['NM_MUNICIPIO'] = cubo['NM_MUNICIPIO'].astype(str)
+    for coluna, nomes in [('DS_GENERO', GENERO),
+                          ('DS_GRAU_ESCOLARIDADE', ESCOLARIDADE),
+                          ('DS_ESTADO_CIVIL', ESTADO_CIVIL),
+                          ('DS_FAIXA_ETARIA', FAIXA_ETARIA)]:
+        cubo[coluna] = cubo[coluna].astype(str).str.strip().replace(nomes)
+    return cubo
+
+
+def agrega_perfil(df):
+    """Soma os QT_* em um único groupby sobre todas as dimensões.
+
+    O resultado (o "cubo") tem uma linha por combinação de turno, UF,
+    município, gênero, estado civil, faixa etária e escolaridade, e é a
+    única entrada de monta_tabela; o arquivo original não é mais varrido.
+    """
+    return nomeia_categorias(soma_cubo(df))
+
+
+def soma_blocos(blocos, limite=4 * TAMANHO_BLOCO):
+    """Soma uma sequência de blocos em um único cubo parcial.
+
+    Cada bloco vira um cubo parcial; quando os parciais acumulados passam
+    de limite linhas eles são somados em um só, então a memória depende do
+    tamanho do bloco e do número de combinações, não do tamanho do arquivo.
+    """
+    parciais = []
+    linhas = 0
+    for bloco in blocos:
+        parciais.append(soma_cubo(bloco))
+        linhas += len(parciais[-1])
+        if linhas > limite and len(parciais) > 1:
+            parciais = [soma_cubo(pd.concat(parciais, ignore_index=True))]
+            linhas = len(parciais[0])
+    return soma_cubo(pd.concat(parciais, ignore_index=True))
+
+
+def agrega_blocos(blocos, limite=4 * TAMANHO_BLOCO):
+    """Versão de agrega_perfil para os blocos de leitura.le_blocos."""
+    return nomeia_categorias(soma_blocos(blocos, limite))
+
+
+def _pivota(parte, chave, indice, dimensoes, categorias):
+    # Abre cada combinação de categorias das dimensões em uma coluna
+    tabela = parte.groupby(chave + dimensoes, observed=True)['QT_APTOS'].sum()
+    tabela = tabela.unstack(dimensoes, fill_value=0)
+    colunas = pd.MultiIndex.from_product(categorias, names=dimensoes)
+    return tabela.reindex(index=indice, columns=colunas, fill_value=0)
+
+
+def _soma(tabela, niveis):
+    return tabela.T.groupby(level=niveis, sort=False).sum().T
+
+
+def monta_tabela(cubo, turno, nivel):
+    """Monta uma tabela df_*_turno_2020 a partir do cubo de agrega_perfil.
+
+    nivel é 'estados' ou 'municipios' (ver colunas.NIVEIS).
+    """
+    chave = list(NIVEIS[nivel])
+    parte = cubo[cubo['NR_TURNO'] == turno]
+
+    totais = parte.groupby(chave, observed=True)[QUANTIDADES].sum()
+    indice = totais.index
+
+    # Dois pivots detalhados; as demais contagens são somas das colunas deles
+    detalhe = _pivota(parte, chave, indice,
+                      ['DS_GENERO', 'DS_ESTADO_CIVIL', 'DS_FAIXA_ETARIA'],
+                      [GENEROS, ESTADOS_CIVIS, FAIXAS])
+    escolaridade_genero = _pivota(parte, chave, indice,
+                                  ['DS_GENERO', 'DS_GRAU_ESCOLARIDADE'],
+                                  [GENEROS, ESCOLARIDADES])
+
+    genero = _soma(detalhe, 'DS_GENERO')
+    escolaridade = _soma(escolaridade_genero, 'DS_GRAU_ESCOLARIDADE')
+    faixa = _soma(detalhe, 'DS_FAIXA_ETARIA')
+    faixa_genero = _soma(detalhe, ['DS_GENERO', 'DS_FAIXA_ETARIA'])
+    estado_civil = _soma(detalhe, 'DS_ESTADO_CIVIL')
+    estado_civil_genero = _soma(detalhe, ['DS_GENERO', 'DS_ESTADO_CIVIL'])
+
+    colunas = {
+        'aptos': totais['QT_APTOS'],
+        'comparecimento': totais['QT_COMPARECIMENTO'],
+        'abstencao': totais['QT_ABSTENCAO'],
+        'comparecimento_deficiencia': totais['QT_COMPARECIMENTO_DEFICIENCIA'],
+        'abstencao_deficiencia': totais['QT_ABSTENCAO_DEFICIENCIA'],
+        'eleitores_deficiencia': (totais['QT_COMPARECIMENTO_DEFICIENCIA']
+                                  + totais['QT_ABSTENCAO_DEFICIENCIA']),
+        'eleitorado_feminino': genero['feminino'],
+        'eleitorado_masculino': genero['masculino'],
+    }
+
+    for esc in ESCOLARIDADES:
+        colunas[esc] = escolaridade[esc]
+    for sexo in GENEROS:
+        for esc in ESCOLARIDADES:
+            colunas[esc + '_' + sexo] = escolaridade_genero[(sexo, esc)]
+
+    for fx in FAIXAS:
+        colunas[fx] = faixa[fx]
+    for sexo in GENEROS:
+        for fx in FAIXAS:
+            colunas[fx + '_' + sexo] = faixa_genero[(sexo, fx)]
+
+    facultativo = faixa[FAIXAS_FACULTATIVAS].sum(axis=1)
+    facultativo_masculino = faixa_genero['masculino'][FAIXAS_FACULTATIVAS].sum(axis=1)
+    colunas['eleitorado_facultativo'] = facultativo
+    colunas['eleitorado_facultativo_masculino'] = facultativo_masculino
+    colunas['eleitorado_facultativo_feminino'] = facultativo - facultativo_masculino
+
+    for ec in ESTADOS_CIVIS:
+        colunas[ec] = estado_civil[ec]
+    for sexo in GENEROS:
+        for ec in ESTADOS_CIVIS:
+            colunas[ec + '_' + sexo] = estado_civil_genero[(sexo, ec)]
+
+    for sexo in GENEROS:
+        for ec in ESTADOS_CIVIS:
+            sufixo = '_' + ESTADO_CIVIL_FAIXA[ec] + '_' + sexo
+            for fx in FAIXAS:
+                colunas[fx + sufixo] = detalhe[(sexo, ec, fx)]
+
+    tabela = calcula_percentuais(pd.DataFrame(colunas, index=indice))
+    return tabela.reset_index().rename(columns=NIVEIS[nivel])
+
+
+def monta_tabelas(cubo):
+    """Produz as quatro tabelas df_*_turno_2020 a partir do mesmo cubo."""
+    return {nome: monta_tabela(cubo, turno, nivel)
+            for nome, (turno, nivel) in TABELAS.items()}
+
+
+def gera_tabelas(caminho, ano=2020, tamanho_bloco=TAMANHO_BLOCO):
+    blocos = le_blocos(caminho, tamanho_bloco, ano)
+    return monta_tabelas(agrega_blocos(blocos, 4 * tamanho_bloco))
@@ -0,0 +1,70 @@
+import os
+
+import pandas as pd
+
+from .colunas import NIVEIS
+from .rankings import calcula_rankings
+
+# Extensão de cada formato aceito por salva_tabelas. O parquet é o que o
+# dashboard lê; o feather pode ser mapeado em memória e o csv fica para
+# quem ainda abre as tabelas em planilha.
+FORMATOS = {
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'csv': '.csv',
+}
+
+
+def tipa_tabela(tabela):
+    """Fixa o esquema das tabelas: chaves como texto, contagens em int32 e
+    percentuais em float64.
+
+    As contagens cabem com folga em int32 (o maior valor é o total de aptos
+    de SP); os percentuais ficam em float64 para manter os mesmos valores
+    arredondados dos csv.
+    """
+    tabela = tabela.loc[:, ~tabela.columns.str.startswith('Unnamed')]
+    chaves = [coluna for coluna in NIVEIS['municipios'].values()
+              if coluna in tabela]
+    percentuais = tabela.columns[tabela.columns.str.endswith('_percentual(%)')]
+    contagens = tabela.columns.difference(chaves).difference(percentuais)
+    tipos = {coluna: 'string' for coluna in chaves}
+    tipos.update({coluna: 'int32' for coluna in contagens})
+    tipos.update({coluna: 'float64' for coluna in percentuais})
+    return tabela.astype(tipos)
+
+
+def _salva(tabela, caminho, formato):
+    if formato == 'parquet':
+        tabela.to_parquet(caminho, index=False, compression='zstd')
+    elif formato == 'feather':
+        # Sem compressão o arquivo pode ser mapeado em memória
+        tabela.to_feather(caminho, compression='uncompressed')
+    else:
+        tabela.to_csv(caminho, index=False)
+
+
+def salva_tabelas(tabelas, destino, formato='parquet'):
+    """Grava cada tabela e, ao lado, os seus rankings (<nome>_rankings)."""
+    os.makedirs(destino, exist_ok=True)
+    for nome, tabela in tabelas.items():
+        tabela = tipa_tabela(tabela)
+        _salva(tabela, os.path.join(destino, nome + FORMATOS[formato]), formato)
+        _salva(calcula_rankings(tabela),
+               os.path.join(destino, nome + '_rankings' + FORMATOS[formato]),
+               formato)
+
+
+def converte_csvs(pasta, formato='parquet'):
+    """Converte as tabelas df_*.csv já publicadas em pasta para formato.
+
+    As colunas 'Unnamed: 0' e 'Unnamed: 0.1', índices deixados pelos
+    to_csv encadeados dos notebooks, são descartadas.
+    """
+    tabelas = {}
+    for arquivo in sorted(os.listdir(pasta)):
+        nome, extensao = os.path.splitext(arquivo)
+        if nome.startswith('df_') and extensao == '.csv':
+            tabelas[nome] = pd.read_csv(os.path.join(pasta, arquivo))
+    salva_tabelas(tabelas, pasta, formato)
+    return list(tabelas)
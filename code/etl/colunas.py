@@ -0,0 +1,101 @@
+# Dimensões do arquivo perfil_comparecimento_abstencao do TSE e os nomes
+# que cada categoria recebe nas tabelas df_*_turno_2020 usadas pelo dashboard
+
+DIMENSOES = ['NR_TURNO', 'SG_UF', 'NM_MUNICIPIO', 'DS_GENERO',
+             'DS_ESTADO_CIVIL', 'DS_FAIXA_ETARIA', 'DS_GRAU_ESCOLARIDADE']
+
+QUANTIDADES = ['QT_APTOS', 'QT_COMPARECIMENTO', 'QT_ABSTENCAO',
+               'QT_COMPARECIMENTO_DEFICIENCIA', 'QT_ABSTENCAO_DEFICIENCIA']
+
+# Linhas descartadas pelos notebooks antes de qualquer agregação
+VALORES_INVALIDOS = {
+    'DS_GENERO': 'NÃO INFORMADO',
+    'DS_GRAU_ESCOLARIDADE': 'NÃO INFORMADO',
+    'DS_FAIXA_ETARIA': 'Inválido',
+    'DS_ESTADO_CIVIL': 'NÃO INFORMADO',
+    'SG_UF': 'ZZ',
+}
+
+GENERO = {
+    'MASCULINO': 'masculino',
+    'FEMININO': 'feminino',
+}
+
+ESCOLARIDADE = {
+    'ANALFABETO': 'analfabeto',
+    'LÊ E ESCREVE': 'le_escreve',
+    'ENSINO FUNDAMENTAL INCOMPLETO': 'fundamental_incompleto',
+    'ENSINO FUNDAMENTAL COMPLETO': 'fundamental_completo',
+    'ENSINO MÉDIO INCOMPLETO': 'medio_incompleto',
+    'ENSINO MÉDIO COMPLETO': 'medio_completo',
+    'SUPERIOR INCOMPLETO': 'superior_incompleto',
+    'SUPERIOR COMPLETO': 'superior_completo',
+}
+
+ESTADO_CIVIL = {
+    'SOLTEIRO': 'solteiro',
+    'CASADO': 'casado',
+    'DIVORCIADO': 'divorciado',
+    'VIÚVO': 'viuvo',
+    'SEPARADO JUDICIALMENTE': 'separado_judicialmente',
+}
+
+# Nas colunas de faixa etária por estado civil os notebooks abreviam
+# 'separado_judicialmente' para 'separado'
+ESTADO_CIVIL_FAIXA = {
+    'solteiro': 'solteiro',
+    'casado': 'casado',
+    'divorciado': 'divorciado',
+    'viuvo': 'viuvo',
+    'separado_judicialmente': 'separado',
+}
+
+FAIXA_ETARIA = {
+    '16 anos': '16_anos',
+    '17 anos': '17_anos',
+    '18 anos': '18_anos',
+    '19 anos': '19_anos',
+    '20 anos': '20_anos',
+    '21 a 24 anos': '21_24_anos',
+    '25 a 29 anos': '25_29_anos',
+    '30 a 34 anos': '30_34_anos',
+    '35 a 39 anos': '35_39_anos',
+    '40 a 44 anos': '40_44_anos',
+    '45 a 49 anos': '45_49_anos',
+    '50 a 54 anos': '50_54_anos',
+    '55 a 59 anos': '55_59_anos',
+    '60 a 64 anos': '60_64_anos',
+    '65 a 69 anos': '65_69_anos',
+    '70 a 74 anos': '70_74_anos',
+    '75 a 79 anos': '75_79_anos',
+    '80 a 84 anos': '80_84_anos',
+    '85 a 89 anos': '85_89_anos',
+    '90 a 94 anos': '90_94_anos',
+    '95 a 99 anos': '95_99_anos',
+    '100 anos ou mais': '100_anos',
+}
+
+GENEROS = list(GENERO.values())
+ESCOLARIDADES = list(ESCOLARIDADE.values())
+ESTADOS_CIVIS = list(ESTADO_CIVIL.values())
+FAIXAS = list(FAIXA_ETARIA.values())
+
+# Faixas somadas no eleitorado facultativo (16, 17 e 65 anos ou mais,
+# o mesmo recorte dos notebooks)
+FAIXAS_FACULTATIVAS = ['16_anos', '17_anos', '65_69_anos', '70_74_anos',
+                       '75_79_anos', '80_84_anos', '85_89_anos',
+                       '90_94_anos', '95_99_anos', '100_anos']
+
+# Chave de agrupamento e nome final das colunas de cada nível
+NIVEIS = {
+    'estados': {'SG_UF': 'estado'},
+    'municipios': {'SG_UF': 'estado', 'NM_MUNICIPIO': 'municipio'},
+}
+
+# Tabelas geradas para o dashboard: nome -> (turno, nível)
+TABELAS = {
+    'df_estados_1turno_2020': (1, 'estados'),
+    'df_estados_2turno_2020': (2, 'estados'),
+    'df_municipios_1turno_2020': (1, 'municipios'),
+    'df_municipios_2turno_2020': (2, 'municipios'),
+}
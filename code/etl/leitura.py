@@ -0,0 +1,118 @@
+import io
+import os
+
+import pandas as pd
+
+from .colunas import DIMENSOES, QUANTIDADES, VALORES_INVALIDOS
+
+COLUNAS = ['ANO_ELEICAO'] + DIMENSOES + QUANTIDADES
+
+# Os DS_*, a UF e o município se repetem milhões de vezes: como categorias
+# cada linha guarda só um código. As contagens por linha cabem em int32.
+TIPOS = {
+    'ANO_ELEICAO': 'int16',
+    'NR_TURNO': 'int8',
+    'SG_UF': 'category',
+    'NM_MUNICIPIO': 'category',
+    'DS_GENERO': 'category',
+    'DS_ESTADO_CIVIL': 'category',
+    'DS_FAIXA_ETARIA': 'category',
+    'DS_GRAU_ESCOLARIDADE': 'category',
+}
+TIPOS.update({coluna: 'int32' for coluna in QUANTIDADES})
+
+TAMANHO_BLOCO = 500_000
+
+
+def _le_csv(caminho, **kwargs):
+    return pd.read_csv(caminho, encoding='latin-1', sep=';',
+                       usecols=COLUNAS, dtype=TIPOS, **kwargs)
+
+
+def filtra_perfil(df, ano=2020):
+    validos = df['ANO_ELEICAO'] == ano
+    for coluna, valor in VALORES_INVALIDOS.items():
+        validos &= df[coluna] != valor
+    return df.loc[validos, DIMENSOES + QUANTIDADES]
+
+
+def le_perfil(caminho, ano=2020):
+    """Lê o arquivo do TSE inteiro, já sem as linhas inválidas."""
+    return filtra_perfil(_le_csv(caminho), ano)
+
+
+def le_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO, ano=2020):
+    """Lê o arquivo do TSE em blocos de tamanho_bloco linhas.
+
+    Cada bloco já sai com as colunas e os tipos de TIPOS e sem as linhas
+    inválidas, de modo que só um bloco fica em memória por vez.
+    """
+    with _le_csv(caminho, chunksize=tamanho_bloco) as leitor:
+        for bloco in leitor:
+            yield filtra_perfil(bloco, ano)
+
+
+def divide_arquivo(caminho, partes):
+    """Divide o arquivo em até partes intervalos de bytes (inicio, fim).
+
+    Os limites são deslocados para o começo da linha seguinte, então cada
+    linha cai em exatamente um intervalo; o cabeçalho fica de fora. O
+    arquivo do TSE não tem quebras de linha dentro de campos.
+    """
+    tamanho = os.path.getsize(caminho)
+    with open(caminho, 'rb') as arquivo:
+        arquivo.readline()
+        limites = [arquivo.tell()]
+        passo = max((tamanho - limites[0]) // partes, 1)
+        for i in range(1, partes):
+            arquivo.seek(max(limites[0] + i * passo - 1, limites[-1]))
+            arquivo.readline()
+            posicao = arquivo.tell()
+            if posicao >= tamanho:
+                break
+            if posicao > limites[-1]:
+                limites.append(posicao)
+        limites.append(tamanho)
+    return list(zip(limites[:-1], limites[1:]))
+
+
+def le_cabecalho(caminho):
+    return list(pd.read_csv(caminho, encoding='latin-1', sep=';', nrows=0).columns)
+
+
+class Trecho(io.RawIOBase):
+    """Os bytes [inicio, fim) de um arquivo aberto, como um arquivo que
+    termina em fim.
+
+    Os bytes são lidos do arquivo à medida que o leitor do CSV pede, então
+    o trecho nunca fica inteiro em memória.
+    """
+
+    def __init__(self, arquivo, inicio, fim):
+        arquivo.seek(inicio)
+        self._arquivo = arquivo
+        self._restantes = fim - inicio
+
+    def readable(self):
+        return True
+
+    def readinto(self, destino):
+        tamanho = min(len(destino), self._restantes)
+        if tamanho <= 0:
+            return 0
+        lidos = self._arquivo.readinto(memoryview(destino)[:tamanho])
+        self._restantes -= lidos
+        return lidos
+
+
+def le_trecho(caminho, inicio, fim, nomes, tamanho_bloco=TAMANHO_BLOCO, ano=2020):
+    """Como le_blocos, mas só para os bytes [inicio, fim) do arquivo.
+
+    nomes são as colunas do cabeçalho (le_cabecalho), que o trecho não tem.
+    """
+    with open(caminho, 'rb') as arquivo:
+        trecho = io.BufferedReader(Trecho(arquivo, inicio, fim))
+        with _le_csv(trecho, header=None, names=nomes,
+                     chunksize=tamanho_bloco) as leitor:
+            for bloco in leitor:
+                yield filtra_perfil(bloco, ano)
@@ -0,0 +1,41 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .agregacao import agrega_perfil, monta_tabelas, soma_blocos
+from .leitura import TAMANHO_BLOCO, divide_arquivo, le_cabecalho, le_trecho
+
+# Mais trechos que processos, para que um trecho mais lento não segure os
+# outros núcleos parados no fim
+TRECHOS_POR_PROCESSO = 4
+
+
+def _soma_trecho(caminho, inicio, fim, nomes, tamanho_bloco, ano):
+    blocos = le_trecho(caminho, inicio, fim, nomes, tamanho_bloco, ano)
+    return soma_blocos(blocos, 4 * tamanho_bloco)
+
+
+def agrega_paralelo(caminho, processos=None, tamanho_bloco=TAMANHO_BLOCO,
+                    ano=2020):
+    """Versão de agrega_blocos que divide o arquivo entre processos.
+
+    Cada processo soma um intervalo de bytes do arquivo (leitura.divide_arquivo)
+    e devolve só o seu cubo parcial, que é pequeno perto do trecho lido; os
+    parciais são somados aqui. Como a soma é a mesma, o cubo é idêntico ao
+    do caminho serial.
+    """
+    processos = processos or os.cpu_count()
+    nomes = le_cabecalho(caminho)
+    trechos = divide_arquivo(caminho, processos * TRECHOS_POR_PROCESSO)
+    with ProcessPoolExecutor(processos) as executor:
+        futuros = [executor.submit(_soma_trecho, caminho, inicio, fim, nomes,
+                                   tamanho_bloco, ano)
+                   for inicio, fim in trechos]
+        parciais = [futuro.result() for futuro in futuros]
+    return agrega_perfil(pd.concat(parciais, ignore_index=True))
+
+
+def gera_tabelas_paralelo(caminho, ano=2020, tamanho_bloco=TAMANHO_BLOCO,
+                          processos=None):
+    return monta_tabelas(agrega_paralelo(caminho, processos, tamanho_bloco, ano))
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from .colunas import (GENEROS, ESCOLARIDADES, ESTADOS_CIVIS, ESTADO_CIVIL_FAIXA,
+                      FAIXAS)
+
+
+def _sufixa(colunas, sufixo):
+    return [coluna + sufixo for coluna in colunas]
+
+
+# Cada grupo é (numeradores, denominador): o denominador é uma coluna única,
+# aplicada a todos os numeradores, ou uma lista alinhada com eles. O
+# percentual de cada numerador vai para '<numerador>_percentual(%)', logo
+# depois da última coluna do grupo.
+PERCENTUAIS = [
+    (['comparecimento'], 'aptos'),
+    (['abstencao'], 'aptos'),
+    (['eleitores_deficiencia'], 'aptos'),
+    (['eleitorado_feminino'], 'aptos'),
+    (['eleitorado_masculino'], 'aptos'),
+    (ESCOLARIDADES, 'aptos'),
+    (_sufixa(ESCOLARIDADES, '_masculino'), ESCOLARIDADES),
+    (_sufixa(ESCOLARIDADES, '_feminino'), ESCOLARIDADES),
+    (FAIXAS, 'aptos'),
+    (_sufixa(FAIXAS, '_masculino'), FAIXAS),
+    (_sufixa(FAIXAS, '_feminino'), FAIXAS),
+    (['eleitorado_facultativo'], 'aptos'),
+    (['eleitorado_facultativo_masculino'], 'aptos'),
+    (['eleitorado_facultativo_feminino'], 'aptos'),
+    (ESTADOS_CIVIS, 'aptos'),
+    (_sufixa(ESTADOS_CIVIS, '_masculino'), ESTADOS_CIVIS),
+    (_sufixa(ESTADOS_CIVIS, '_feminino'), ESTADOS_CIVIS),
+] + [
+    (_sufixa(FAIXAS, '_' + ESTADO_CIVIL_FAIXA[ec] + '_' + sexo), FAIXAS)
+    for sexo in GENEROS for ec in ESTADOS_CIVIS
+]
+
+
+def percentual(numerador, denominador):
+    """(numerador / denominador) * 100 com duas casas, sobre arrays inteiros.
+
+    Onde o denominador é zero o percentual é 0.0, como em
+    define_escolaridade_percentual_masculina nos notebooks.
+    """
+    numerador = np.asarray(numerador, dtype='float64')
+    denominador = np.asarray(denominador, dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        resultado = np.where(denominador != 0,
+                             numerador / denominador * 100, 0.0)
+    return np.round(resultado, 2)
+
+
+def calcula_percentuais(df, especificacao=PERCENTUAIS):
+    """Acrescenta a df as colunas _percentual(%) de todos os grupos.
+
+    Cada grupo é resolvido numa única operação sobre a matriz
+    linhas x numeradores, sem apply nem laços por linha.
+    """
+    blocos = {}
+    for numeradores, denominador in especificacao:
+        if isinstance(denominador, str):
+            divisor = df[[denominador]].to_numpy()
+        else:
+            divisor = df[denominador].to_numpy()
+        valores = percentual(df[numeradores].to_numpy(), divisor)
+        blocos[numeradores[-1]] = pd.DataFrame(
+            valores, index=df.index,
+            columns=_sufixa(numeradores, '_percentual(%)'))
+
+    partes = []
+    inicio = 0
+    for posicao, coluna in enumerate(df.columns):
+        if coluna in blocos:
+            partes.append(df.iloc[:, inicio:posicao + 1])
+            partes.append(blocos[coluna])
+            inicio = posicao + 1
+    partes.append(df.iloc[:, inicio:])
+    return pd.concat(partes, axis=1)
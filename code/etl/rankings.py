@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+
+from .colunas import ESTADOS_CIVIS
+
+# Métricas com gráfico de ranking no dashboard
+METRICAS_RANKING = [
+    'analfabeto', 'analfabeto_percentual(%)',
+    'eleitores_deficiencia', 'eleitores_deficiencia_percentual(%)',
+    'eleitorado_facultativo_percentual(%)',
+    'superior_completo_percentual(%)',
+] + ESTADOS_CIVIS
+
+# Escopo do ranking nacional; os rankings por UF usam a sigla como escopo
+NACIONAL = 'BR'
+
+
+def _ranking(metrica, escopo, linhas):
+    return pd.DataFrame({'metrica': metrica, 'escopo': escopo,
+                         'posicao': np.arange(len(linhas), dtype='int32'),
+                         'linha': linhas.astype('int32')})
+
+
+def calcula_rankings(tabela):
+    """Ordena as linhas de tabela por cada métrica, da maior para a menor.
+
+    Cada linha do resultado diz que a linha `linha` da tabela está na
+    posição `posicao` do ranking de `metrica` em `escopo` (NACIONAL ou, nas
+    tabelas de municípios, a UF). Empates mantêm a ordem da tabela.
+    """
+    partes = []
+    estados = None
+    if 'municipio' in tabela:
+        estados = tabela['estado'].to_numpy()
+    for metrica in METRICAS_RANKING:
+        valores = tabela[metrica].to_numpy()
+        partes.append(_ranking(metrica, NACIONAL,
+                               np.argsort(-valores, kind='stable')))
+        if estados is None:
+            continue
+        ordem = np.lexsort((-valores, estados))
+        for estado, linhas in zip(*_divide(estados[ordem], ordem)):
+            partes.append(_ranking(metrica, estado, linhas))
+    return pd.concat(partes, ignore_index=True)
+
+
+def _divide(chaves, valores):
+    # Separa valores (ordenados por chaves) nos trechos de cada chave
+    inicios = np.flatnonzero(np.r_[True, chaves[1:] != chaves[:-1]])
+    return chaves[inicios], np.split(valores, inicios[1:])
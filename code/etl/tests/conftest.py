@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from etl.colunas import ESCOLARIDADE, ESTADO_CIVIL, FAIXA_ETARIA, GENERO
+
+COLUNAS = ['DT_GERACAO', 'HH_GERACAO', 'ANO_ELEICAO', 'NR_TURNO', 'SG_UF',
+           'CD_MUNICIPIO', 'NM_MUNICIPIO', 'CD_GENERO', 'DS_GENERO',
+           'CD_ESTADO_CIVIL', 'DS_ESTADO_CIVIL', 'CD_FAIXA_ETARIA',
+           'DS_FAIXA_ETARIA', 'CD_GRAU_ESCOLARIDADE', 'DS_GRAU_ESCOLARIDADE',
+           'QT_APTOS', 'QT_COMPARECIMENTO', 'QT_ABSTENCAO',
+           'QT_COMPARECIMENTO_DEFICIENCIA', 'QT_ABSTENCAO_DEFICIENCIA']
+
+MUNICIPIOS = {
+    'SP': ['SÃO PAULO', 'CAMPINAS'],
+    'RJ': ['RIO DE JANEIRO'],
+    'MG': ['BELO HORIZONTE', 'UBERABA'],
+    'ZZ': ['LISBOA'],
+}
+
+
+def _escolhe(categorias):
+    # Também sorteia os valores que filtra_perfil descarta
+    return random.choice(list(categorias) + ['NÃO INFORMADO', 'Inválido'])
+
+
+@pytest.fixture(scope='session')
+def perfil(tmp_path_factory):
+    """Um perfil_comparecimento_abstencao sintético, no formato do TSE
+    (latin-1, ';' e aspas), com linhas de 2016, da UF ZZ e inválidas."""
+    random.seed(0)
+    caminho = tmp_path_factory.mktemp('tse') / 'perfil.csv'
+    with open(caminho, 'w', encoding='latin-1') as arquivo:
+        arquivo.write(';'.join('"%s"' % coluna for coluna in COLUNAS) + '\n')
+        for _ in range(20_000):
+            uf = random.choice(list(MUNICIPIOS))
+            aptos = random.randint(0, 50)
+            comparecimento = random.randint(0, aptos)
+            linha = ['01/01/2021', '10:00', random.choice([2020, 2020, 2016]),
+                     random.choice([1, 2]), uf, 1,
+                     random.choice(MUNICIPIOS[uf]), 1, _escolhe(GENERO), 1,
+                     _escolhe(ESTADO_CIVIL), 1, _escolhe(FAIXA_ETARIA), 1,
+                     _escolhe(ESCOLARIDADE), aptos, comparecimento,
+                     aptos - comparecimento, random.randint(0, 3),
+                     random.randint(0, 3)]
+            arquivo.write(';'.join('"%s"' % valor for valor in linha) + '\n')
+    return str(caminho)
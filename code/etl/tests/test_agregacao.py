@@ -0,0 +1,43 @@
+import os
+
+import pandas as pd
+import pytest
+
+from etl import (agrega_blocos, agrega_perfil, gera_tabelas,
+                 gera_tabelas_paralelo, le_blocos, le_perfil)
+from etl.colunas import DIMENSOES, QUANTIDADES, TABELAS
+
+# Tabelas dos notebooks publicadas com o dashboard
+DADOS = os.path.join(os.path.dirname(__file__), '..', '..', '..',
+                     'Dashboard', 'data')
+
+
+def test_cubo_tem_uma_linha_por_combinacao(perfil):
+    df = le_perfil(perfil)
+    cubo = agrega_perfil(df)
+    assert not cubo.duplicated(DIMENSOES).any()
+    assert (cubo[QUANTIDADES].sum() == df[QUANTIDADES].sum()).all()
+
+
+def test_cubo_dos_blocos_igual_ao_do_arquivo_inteiro(perfil):
+    # limite pequeno para forçar a soma intermediária dos parciais
+    cubo = agrega_blocos(le_blocos(perfil, tamanho_bloco=2_000), limite=500)
+    pd.testing.assert_frame_equal(cubo, agrega_perfil(le_perfil(perfil)))
+
+
+def test_paralelo_igual_ao_serial(perfil):
+    serial = gera_tabelas(perfil, tamanho_bloco=2_000)
+    paralelo = gera_tabelas_paralelo(perfil, tamanho_bloco=2_000, processos=2)
+    assert list(paralelo) == list(serial) == list(TABELAS)
+    for nome in TABELAS:
+        pd.testing.assert_frame_equal(paralelo[nome], serial[nome])
+
+
+@pytest.mark.parametrize('nome', ['df_estados_1turno_2020',
+                                  'df_estados_2turno_2020',
+                                  'df_municipios_2turno_2020'])
+def test_colunas_iguais_as_dos_csvs(perfil, nome):
+    publicadas = pd.read_csv(os.path.join(DADOS, nome + '.csv'), nrows=0)
+    colunas = [coluna for coluna in publicadas.columns
+               if not coluna.startswith('Unnamed')]
+    assert list(gera_tabelas(perfil)[nome].columns) == colunas
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from etl import (FORMATOS, METRICAS_RANKING, NACIONAL, calcula_rankings,
+                 gera_tabelas, salva_tabelas)
+from etl.colunas import TABELAS
+
+
+def test_rankings_ordenam_cada_escopo(perfil):
+    tabela = gera_tabelas(perfil)['df_municipios_1turno_2020']
+    rankings = calcula_rankings(tabela)
+    escopos = {NACIONAL} | set(tabela['estado'])
+    assert set(rankings['metrica']) == set(METRICAS_RANKING)
+    assert set(rankings['escopo']) == escopos
+    for (metrica, escopo), ranking in rankings.groupby(['metrica', 'escopo']):
+        parte = tabela if escopo == NACIONAL else tabela[tabela['estado'] == escopo]
+        assert sorted(ranking['linha']) == sorted(parte.index)
+        assert ranking['posicao'].tolist() == list(range(len(parte)))
+        valores = tabela[metrica].to_numpy()[ranking['linha']]
+        assert (np.diff(valores) <= 0).all()
+
+
+def test_salva_tabelas_grava_os_rankings_em_parquet(perfil, tmp_path):
+    tabelas = gera_tabelas(perfil)
+    salva_tabelas(tabelas, tmp_path)
+    for nome in TABELAS:
+        tabela = pd.read_parquet(tmp_path / (nome + FORMATOS['parquet']))
+        rankings = pd.read_parquet(tmp_path / (nome + '_rankings.parquet'))
+        assert tabela['aptos'].dtype == 'int32'
+        assert tabela['estado'].dtype == 'string'
+        pd.testing.assert_frame_equal(rankings, calcula_rankings(tabela))
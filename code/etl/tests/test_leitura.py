@@ -0,0 +1,22 @@
+import pandas as pd
+
+from etl import divide_arquivo, le_blocos, le_perfil, le_trecho
+from etl.leitura import le_cabecalho
+
+
+def test_blocos_somam_o_perfil(perfil):
+    blocos = pd.concat(le_blocos(perfil, tamanho_bloco=3_000),
+                       ignore_index=True)
+    pd.testing.assert_frame_equal(blocos, le_perfil(perfil).reset_index(drop=True))
+
+
+def test_trechos_cobrem_o_arquivo_uma_vez(perfil):
+    nomes = le_cabecalho(perfil)
+    trechos = divide_arquivo(perfil, 7)
+    assert trechos[0][1] > trechos[0][0]
+    assert all(fim == inicio for (_, fim), (inicio, _) in zip(trechos, trechos[1:]))
+    lidos = pd.concat([bloco for inicio, fim in trechos
+                       for bloco in le_trecho(perfil, inicio, fim, nomes,
+                                              tamanho_bloco=1_000)],
+                      ignore_index=True)
+    pd.testing.assert_frame_equal(lidos, le_perfil(perfil).reset_index(drop=True))
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from etl import calcula_percentuais, percentual
+
+DADOS = os.path.join(os.path.dirname(__file__), '..', '..', '..',
+                     'Dashboard', 'data')
+
+
+def test_percentual_com_denominador_zero():
+    assert percentual([1, 2, 0], [3, 0, 0]).tolist() == [33.33, 0.0, 0.0]
+
+
+def test_cada_percentual_vem_depois_do_seu_grupo():
+    df = pd.DataFrame({'a': [1, 2], 'b': [3, 0], 'total': [4, 2]})
+    resultado = calcula_percentuais(df, [(['a', 'b'], 'total'),
+                                         (['total'], ['a'])])
+    assert list(resultado.columns) == ['a', 'b', 'a_percentual(%)',
+                                       'b_percentual(%)', 'total',
+                                       'total_percentual(%)']
+    assert resultado['b_percentual(%)'].tolist() == [75.0, 0.0]
+    assert resultado['total_percentual(%)'].tolist() == [400.0, 100.0]
+
+
+# O df_municipios_2turno_2020.csv publicado traz os percentuais de
+# escolaridade por gênero sobre outra base, então fica de fora
+@pytest.mark.parametrize('nome', ['df_estados_1turno_2020',
+                                  'df_estados_2turno_2020'])
+def test_percentuais_iguais_aos_dos_notebooks(nome):
+    publicada = pd.read_csv(os.path.join(DADOS, nome + '.csv'))
+    publicada = publicada.loc[:, ~publicada.columns.str.startswith('Unnamed')]
+    contagens = publicada.loc[:, ~publicada.columns.str.endswith('_percentual(%)')]
+    calculada = calcula_percentuais(contagens)
+    assert list(calculada.columns) == list(publicada.columns)
+    numericas = publicada.select_dtypes('number').columns
+    np.testing.assert_allclose(calculada[numericas], publicada[numericas],
+                               atol=0.01)
@@ -0,0 +1,17 @@
+from .geometria import (CAMADAS, DETALHES, CRS_METRICO, CRS_SAIDA,
+                        PRECISAO_WEB, PONTEIRO_LFS, ponteiro_lfs, le_camada,
+                        limpa_cobertura, simplifica_camada, caminho_geometria,
+                        arredonda, exporta_geojson, exporta_geopackage,
+                        gera_camada, gera_geometrias)
+from .web import PASTA_TILES, extrai_mbtiles, url_tiles
+from .classes import (METRICAS, ESQUEMAS, CLASSES, classifica,
+                      calcula_classes, gera_classes)
+from .imagens import (PASTA_IMAGENS, DETALHE_IMAGEM, FORMATO_IMAGEM,
+                      nome_imagem, caminho_imagem, gera_imagens)
+from .hexagonos import (LADO_HEXAGONO, DETALHE_GRADE, GRADE, ATRIBUICAO,
+                        grade_hexagonal, gera_grade, agrega_hexagonos)
+from .construcao import (MANIFESTO, resumo_arquivo, chave_tarefa,
+                         tarefas_geometria, tarefas_classes,
+                         tarefas_imagens, tarefas_grade,
+                         tarefas_hexagonos, tarefas_tiles,
+                         constroi, constroi_mapas)
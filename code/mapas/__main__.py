@@ -0,0 +1,44 @@
+import argparse
+import os
+import sys
+
+from .construcao import constroi_mapas
+from .geometria import CAMADAS, ponteiro_lfs
+
+parser = argparse.ArgumentParser(
+    prog='python -m mapas',
+    description='Gera as geometrias simplificadas e os mapas do dashboard a '
+                'partir das tabelas do ETL e dos GeoPackages de estados e '
+                'municípios. Só refaz o que teve alguma entrada alterada.')
+parser.add_argument('--dados', default='../Dashboard/data',
+                    help='pasta das tabelas do ETL, onde os mapas são gravados')
+parser.add_argument('--origem', default='.',
+                    help='pasta com estados.gpkg e municipios.gpkg (por '
+                         'padrão a atual, code/; os de Dashboard/data ficam '
+                         'no Git LFS)')
+parser.add_argument('--camadas', nargs='+', choices=list(CAMADAS),
+                    help='camadas geradas (todas por padrão)')
+parser.add_argument('--processos', type=int, default=0,
+                    help='processos do pool (0 usa todos os núcleos)')
+parser.add_argument('--mbtiles',
+                    help='MBTiles (png/jpg) do mapa de fundo, servido pelo '
+                         'próprio dashboard no lugar do OpenStreetMap')
+parser.add_argument('--forcar', action='store_true',
+                    help='refaz tudo, mesmo o que não mudou')
+args = parser.parse_args()
+
+for nome in args.camadas or CAMADAS:
+    caminho = os.path.join(args.origem, CAMADAS[nome][0])
+    if ponteiro_lfs(caminho):
+        parser.error(caminho + ' é só o ponteiro do Git LFS: rode git lfs '
+                     'pull ou indique em --origem a pasta do GeoPackage')
+
+gerados, pulados, falhas = constroi_mapas(args.dados, args.origem, args.camadas,
+                                          args.processos or None, args.forcar,
+                                          args.mbtiles)
+for caminho in gerados:
+    print('gerado', caminho)
+print(len(pulados), 'arquivos sem mudança')
+for saidas, erro in falhas:
+    print('falhou', ', '.join(saidas) + ':', erro, file=sys.stderr)
+sys.exit(1 if falhas else 0)
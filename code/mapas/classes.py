@@ -0,0 +1,89 @@
+import warnings
+
+import mapclassify
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+
+from etl.rankings import NACIONAL
+
+# Indicadores que o mapa coroplético do dashboard pode mostrar
+# (Dashboard/mapas.py, METRICAS_MAPA)
+METRICAS = ['comparecimento_percentual(%)', 'abstencao_percentual(%)',
+            'eleitorado_feminino_percentual(%)',
+            'eleitorado_masculino_percentual(%)', 'analfabeto_percentual(%)',
+            'eleitores_deficiencia_percentual(%)',
+            'eleitorado_facultativo_percentual(%)',
+            'superior_completo_percentual(%)']
+
+CLASSES = 5
+
+# Semente do k-means das quebras naturais: as mesmas classes a cada build
+SEMENTE = 0
+
+
+class QuebrasNaturais:
+    """Quebras naturais (k-means em uma dimensão), como
+    mapclassify.NaturalBreaks.
+
+    O NaturalBreaks não recebe semente e sorteia os centros com o gerador
+    global do NumPy; aqui o KMeans tem a própria, e o gerador global dos
+    processos do pool fica intocado.
+    """
+
+    def __init__(self, y, k=CLASSES, initial=10):
+        y = np.asarray(y, dtype='float64')
+        rotulos = KMeans(n_clusters=k, init='k-means++', n_init=initial,
+                         random_state=SEMENTE).fit_predict(y.reshape(-1, 1))
+        self.bins = np.sort([y[rotulos == classe].max()
+                             for classe in np.unique(rotulos)])
+
+
+ESQUEMAS = {
+    'quantis': mapclassify.Quantiles,
+    'fisher_jenks': mapclassify.FisherJenks,
+    'quebras_naturais': QuebrasNaturais,
+}
+
+
+def classifica(valores, esquema, classes=CLASSES):
+    """Menor valor e limite superior de cada classe de valores no esquema.
+
+    Com menos valores distintos que classes cada valor vira uma classe.
+    """
+    valores = valores[~np.isnan(valores)]
+    classes = min(classes, len(np.unique(valores)))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        limites = ESQUEMAS[esquema](valores, k=classes).bins
+    return float(valores.min()), np.round(limites, 2).tolist()
+
+
+def calcula_classes(tabela, metricas=METRICAS):
+    """Classes de cada metrica × escopo × esquema.
+
+    O escopo é NACIONAL e, nas tabelas de municípios, também cada UF, como
+    em etl.rankings. Uma linha por combinação, com o mínimo e a lista de
+    limites.
+    """
+    escopos = [(NACIONAL, tabela)]
+    if 'municipio' in tabela:
+        escopos += list(tabela.groupby('estado', sort=False))
+    linhas = []
+    for metrica in metricas:
+        for escopo, parte in escopos:
+            for esquema in ESQUEMAS:
+                minimo, limites = classifica(
+                    parte[metrica].to_numpy(dtype='float64'), esquema)
+                linhas.append({'metrica': metrica, 'escopo': escopo,
+                               'esquema': esquema, 'minimo': minimo,
+                               'limites': limites})
+    return pd.DataFrame(linhas)
+
+
+def gera_classes(tabela, chaves, caminho):
+    """Grava em caminho as classes da tabela do ETL em tabela."""
+    valores = pd.read_parquet(tabela, columns=chaves + METRICAS)
+    calcula_classes(valores).to_parquet(caminho, index=False,
+                                        compression='zstd')
+    return [caminho]
@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from etl.colunas import NIVEIS, TABELAS
+from .classes import ESQUEMAS, METRICAS, gera_classes
+from .geometria import CAMADAS, DETALHES, caminho_geometria, gera_camada
+from .hexagonos import (ATRIBUICAO, DETALHE_GRADE, GRADE, agrega_hexagonos,
+                        gera_grade)
+from .imagens import (DETALHE_IMAGEM, PASTA_IMAGENS, caminho_imagem,
+                      gera_imagens)
+from .web import PASTA_TILES, extrai_mbtiles
+
+# Resumo das entradas de cada arquivo gerado, gravado na pasta das geometrias
+MANIFESTO = 'manifesto.json'
+
+
+def pastas(dados):
+    """Pastas de saída dentro de dados: (geometrias, GeoJSON, charts)."""
+    return (os.path.join(dados, 'geo'), os.path.join(dados, 'charts', 'geo'),
+            os.path.join(dados, 'charts'))
+
+
+def resumo_arquivo(caminho):
+    """sha256 do conteúdo do arquivo."""
+    resumo = hashlib.sha256()
+    with open(caminho, 'rb') as arquivo:
+        for bloco in iter(lambda: arquivo.read(1 << 20), b''):
+            resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def _resumo_codigo():
+    # Mudar o código de code/mapas invalida tudo o que ele gerou
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    resumo = hashlib.sha256()
+    for arquivo in sorted(os.listdir(pasta)):
+        if arquivo.endswith('.py'):
+            resumo.update(resumo_arquivo(os.path.join(pasta, arquivo)).encode())
+    return resumo.hexdigest()
+
+
+def chave_tarefa(tarefa, codigo):
+    """Resumo de tudo de que a tarefa depende: código, argumentos e o
+    conteúdo de cada arquivo de entrada."""
+    funcao, args, entradas, _ = tarefa
+    resumo = hashlib.sha256(codigo.encode())
+    resumo.update(funcao.__name__.encode())
+    resumo.update(repr(args).encode())
+    for entrada in entradas:
+        resumo.update(resumo_arquivo(entrada).encode())
+    return resumo.hexdigest()
+
+
+def tarefas_geometria(origem, dados, camadas=None):
+    """Uma tarefa (funcao, args, entradas, saidas) por camada."""
+    geo, web, _ = pastas(dados)
+    tarefas = []
+    for nome in camadas or CAMADAS:
+        saidas = [caminho_geometria(pasta, nome, detalhe, extensao)
+                  for detalhe in DETALHES
+                  for pasta, extensao in [(geo, '.parquet'), (geo, '.gpkg'),
+                                          (web, '.json')]]
+        tarefas.append((gera_camada, (origem, nome, geo, web),
+                        [os.path.join(origem, CAMADAS[nome][0])], saidas))
+    return tarefas
+
+
+def tarefas_classes(dados):
+    """Uma tarefa por tabela do ETL: <tabela>_classes.parquet ao lado dela."""
+    tarefas = []
+    for nome, (_, nivel) in TABELAS.items():
+        tabela = os.path.join(dados, nome + '.parquet')
+        caminho = os.path.join(dados, nome + '_classes.parquet')
+        tarefas.append((gera_classes,
+                        (tabela, list(NIVEIS[nivel].values()), caminho),
+                        [tabela], [caminho]))
+    return tarefas
+
+
+def tarefas_imagens(dados, camadas=None):
+    """Uma tarefa por tabela do ETL × indicador, com as miniaturas dele em
+    cada esquema de classes."""
+    geo = pastas(dados)[0]
+    tarefas = []
+    for nome, (_, nivel) in TABELAS.items():
+        if camadas and nivel not in camadas:
+            continue
+        tabela = os.path.join(dados, nome + '.parquet')
+        classes = os.path.join(dados, nome + '_classes.parquet')
+        geometria = caminho_geometria(geo, nivel, DETALHE_IMAGEM)
+        destino = os.path.join(dados, PASTA_IMAGENS, nome)
+        for metrica in METRICAS:
+            saidas = [caminho_imagem(dados, nome, metrica, esquema)
+                      for esquema in ESQUEMAS]
+            tarefas.append((gera_imagens,
+                            (tabela, classes, geometria,
+                             list(NIVEIS[nivel].values()), metrica, destino),
+                            [tabela, classes, geometria], saidas))
+    return tarefas
+
+
+def tarefas_grade(dados, camadas=None):
+    """Grade hexagonal da visão nacional e a célula de cada município."""
+    if camadas and 'municipios' not in camadas:
+        return []
+    geo, web, _ = pastas(dados)
+    geometria = caminho_geometria(geo, 'municipios', DETALHE_GRADE)
+    return [(gera_grade, (geometria, geo, web), [geometria],
+             [os.path.join(geo, GRADE + '.parquet'),
+              os.path.join(web, GRADE + '.json'),
+              os.path.join(geo, ATRIBUICAO + '.parquet')])]
+
+
+def tarefas_hexagonos(dados, camadas=None):
+    """Uma tarefa por tabela de municípios: as médias de cada célula da
+    grade em <tabela>_hexagonos.parquet e as classes delas em
+    <tabela>_hexagonos_classes.parquet."""
+    if camadas and 'municipios' not in camadas:
+        return []
+    atribuicao = os.path.join(pastas(dados)[0], ATRIBUICAO + '.parquet')
+    tarefas = []
+    for nome, (_, nivel) in TABELAS.items():
+        if nivel != 'municipios':
+            continue
+        tabela = os.path.join(dados, nome + '.parquet')
+        saidas = [os.path.join(dados, nome + '_hexagonos.parquet'),
+                  os.path.join(dados, nome + '_hexagonos_classes.parquet')]
+        tarefas.append((agrega_hexagonos, (tabela, atribuicao, *saidas),
+                        [tabela, atribuicao], saidas))
+    return tarefas
+
+
+def tarefas_tiles(mbtiles, dados):
+    """Extração do MBTiles do mapa de fundo para charts/tiles."""
+    destino = os.path.join(pastas(dados)[2], PASTA_TILES)
+    return [(extrai_mbtiles, (mbtiles, destino), [mbtiles],
+             [os.path.join(destino, 'metadata.json')])]
+
+
+def constroi(fases, manifesto, processos=None, forcar=False):
+    """Executa as tarefas de cada fase em um pool de processos.
+
+    As fases rodam em ordem (as tarefas de uma fase podem ler o que a
+    anterior gerou). Uma tarefa é pulada quando o manifesto registra a
+    mesma chave_tarefa para todas as suas saídas e elas existem; uma tarefa
+    sem alguma entrada ou que falha não impede as outras. Devolve
+    (gerados, pulados, falhas), este último com (saidas, erro).
+    """
+    registro = {}
+    if os.path.exists(manifesto):
+        with open(manifesto, encoding='utf-8') as arquivo:
+            registro = json.load(arquivo)
+    codigo = _resumo_codigo()
+    gerados, pulados, falhas = [], [], []
+    with ProcessPoolExecutor(processos) as executor:
+        for tarefas in fases:
+            futuros = {}
+            for tarefa in tarefas:
+                funcao, args, entradas, saidas = tarefa
+                faltando = [e for e in entradas if not os.path.exists(e)]
+                if faltando:
+                    falhas.append((saidas, 'sem ' + ', '.join(faltando)))
+                    continue
+                chave = chave_tarefa(tarefa, codigo)
+                if not forcar and all(registro.get(saida) == chave
+                                      and os.path.exists(saida)
+                                      for saida in saidas):
+                    pulados += saidas
+                    continue
+                futuros[executor.submit(funcao, *args)] = (saidas, chave)
+            for futuro in as_completed(futuros):
+                saidas, chave = futuros[futuro]
+                try:
+                    futuro.result()
+                except Exception as erro:
+                    falhas.append((saidas, repr(erro)))
+                    continue
+                gerados += saidas
+                registro.update(dict.fromkeys(saidas, chave))
+    os.makedirs(os.path.dirname(manifesto) or '.', exist_ok=True)
+    with open(manifesto, 'w', encoding='utf-8') as arquivo:
+        json.dump(registro, arquivo, indent=1, sort_keys=True)
+    return gerados, pulados, falhas
+
+
+def constroi_mapas(dados, origem=None, camadas=None, processos=None,
+                   forcar=False, mbtiles=None):
+    """Gera as geometrias e as classes dos indicadores, depois as
+    miniaturas e a grade hexagonal e por fim as médias de cada célula da
+    grade, a partir das tabelas em dados e dos GeoPackages em
+    origem (por padrão a própria dados).
+
+    Com mbtiles o mapa de fundo também é extraído (web.extrai_mbtiles).
+    """
+    origem = origem or dados
+    fases = [tarefas_geometria(origem, dados, camadas) + tarefas_classes(dados),
+             tarefas_imagens(dados, camadas) + tarefas_grade(dados, camadas),
+             tarefas_hexagonos(dados, camadas)]
+    if mbtiles:
+        fases[0] += tarefas_tiles(mbtiles, dados)
+    manifesto = os.path.join(pastas(dados)[0], MANIFESTO)
+    return constroi(fases, manifesto, processos, forcar)
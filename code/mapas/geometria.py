@@ -0,0 +1,156 @@
+import os
+
+import geopandas as gpd
+import shapely
+
+# Camadas de origem: nome -> (arquivo, camada do GeoPackage, chaves). As
+# chaves são as mesmas colunas das tabelas df_* (ver etl.colunas.NIVEIS);
+# camada None lê a primeira camada do arquivo.
+CAMADAS = {
+    'estados': ('estados.gpkg', 'lim_unidade_federacao_a', ['estado']),
+    'municipios': ('municipios.gpkg', None, ['estado', 'municipio']),
+}
+
+# Tolerância de simplificação, em metros, de cada nível de detalhe
+DETALHES = {
+    'alta': 200,
+    'media': 1000,
+    'baixa': 5000,
+}
+
+# A simplificação é feita em uma projeção métrica (Policônica do IBGE) e o
+# resultado é gravado em coordenadas geográficas, como o folium espera
+CRS_METRICO = 'EPSG:5880'
+CRS_SAIDA = 'EPSG:4326'
+
+# Casas decimais do GeoJSON servido ao navegador: 1e-5 grau é cerca de 1 m
+PRECISAO_WEB = 1e-5
+
+# Os GeoPackages de Dashboard/data estão no Git LFS; sem git lfs pull o
+# arquivo no disco é só o ponteiro, um texto que começa assim
+PONTEIRO_LFS = b'version https://git-lfs.github.com/spec/'
+
+
+def ponteiro_lfs(caminho):
+    """Indica se caminho é um ponteiro do Git LFS no lugar do arquivo."""
+    try:
+        with open(caminho, 'rb') as arquivo:
+            return arquivo.read(len(PONTEIRO_LFS)) == PONTEIRO_LFS
+    except OSError:
+        return False
+
+
+def le_camada(caminho, camada, chaves):
+    """Lê do GeoPackage só as chaves e a geometria, em CRS_METRICO."""
+    if ponteiro_lfs(caminho):
+        raise ValueError(caminho + ' é só o ponteiro do Git LFS '
+                         '(falta git lfs pull)')
+    gdf = gpd.read_file(caminho, layer=camada, columns=chaves)
+    return gdf[chaves + ['geometry']].to_crs(CRS_METRICO)
+
+
+def limpa_cobertura(gdf, encaixe=-1):
+    """Ajusta os polígonos para formarem uma cobertura.
+
+    Os limites do IBGE têm sobreposições e vãos minúsculos entre vizinhos;
+    depois da limpeza cada divisa é a mesma sequência de vértices nos dois
+    polígonos, o que a simplificação a seguir precisa para não abrir frestas.
+    encaixe é a distância em que vértices próximos são unidos (-1 deixa o
+    GEOS escolher pela extensão da camada, 0 não une nenhum).
+    """
+    gdf = gdf.copy()
+    gdf['geometry'] = shapely.coverage_clean(gdf.geometry.values,
+                                             snapping_distance=encaixe)
+    return gdf
+
+
+def simplifica_camada(gdf, tolerancia):
+    """Simplifica uma cobertura sem abrir vãos nem sobrepor vizinhos.
+
+    Ao contrário de GeoSeries.simplify, coverage_simplify trata cada divisa
+    uma única vez, como os arcos compartilhados do TopoJSON.
+    """
+    gdf = gdf.copy()
+    gdf['geometry'] = shapely.coverage_simplify(gdf.geometry.values, tolerancia)
+    return gdf
+
+
+def caminho_geometria(destino, nome, detalhe, extensao='.parquet'):
+    return os.path.join(destino, nome + '_' + detalhe + extensao)
+
+
+def arredonda(gdf):
+    """Arredonda as coordenadas a PRECISAO_WEB, como vão para o dashboard."""
+    gdf = gdf.copy()
+    gdf['geometry'] = shapely.set_precision(gdf.geometry.values, PRECISAO_WEB)
+    return gdf
+
+
+def exporta_geojson(gdf, caminho):
+    """Grava a camada como GeoJSON para o mapa coroplético do dashboard.
+
+    As propriedades são só as chaves e as feições ficam na mesma ordem do
+    GeoParquet: o dashboard manda ao navegador apenas a lista de valores
+    nessa ordem, sem repetir as chaves.
+    """
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(gdf.to_json(drop_id=True, ensure_ascii=False))
+
+
+def exporta_geopackage(gdf, caminho, nome):
+    """Grava a camada como GeoPackage, com índice espacial, para o dashboard
+    ler só as feições de um estado (Dashboard/geometrias.py).
+
+    As coordenadas, o tipo de cada geometria e a ordem das feições são os
+    do GeoJSON: o recorte de um estado é o mesmo trecho do GeoJSON, sem
+    repetir a simplificação.
+    """
+    if os.path.exists(caminho):
+        os.remove(caminho)
+    # Sem promote_to_multi o GDAL transformaria os Polygon em MultiPolygon
+    gdf.to_file(caminho, layer=nome, driver='GPKG', engine='pyogrio',
+                promote_to_multi=False)
+
+
+def gera_camada(origem, nome, destino, destino_web=None, detalhes=DETALHES):
+    """Grava <nome>_<detalhe>.parquet (GeoParquet) e <nome>_<detalhe>.gpkg
+    (exporta_geopackage) para cada nível de detalhe da camada nome e
+    devolve os caminhos gravados.
+
+    origem é a pasta dos GeoPackages. Com destino_web cada nível também é
+    gravado em <nome>_<detalhe>.json nessa pasta (ver exporta_geojson).
+    """
+    arquivo, camada, chaves = CAMADAS[nome]
+    cobertura = limpa_cobertura(le_camada(os.path.join(origem, arquivo),
+                                          camada, chaves))
+    os.makedirs(destino, exist_ok=True)
+    if destino_web:
+        os.makedirs(destino_web, exist_ok=True)
+    gravados = []
+    for detalhe, tolerancia in detalhes.items():
+        gdf = simplifica_camada(cobertura, tolerancia).to_crs(CRS_SAIDA)
+        # Um vértice que caía no meio da divisa do vizinho deixa de cair
+        # nela depois da reprojeção; a segunda limpeza só insere esses
+        # vértices no vizinho, sem mover nenhum
+        gdf = limpa_cobertura(gdf, encaixe=0)
+        caminho = caminho_geometria(destino, nome, detalhe)
+        gdf.to_parquet(caminho, index=False, compression='zstd')
+        gravados.append(caminho)
+        web = arredonda(gdf)
+        caminho = caminho_geometria(destino, nome, detalhe, '.gpkg')
+        exporta_geopackage(web, caminho, nome)
+        gravados.append(caminho)
+        if destino_web:
+            caminho = caminho_geometria(destino_web, nome, detalhe, '.json')
+            exporta_geojson(web, caminho)
+            gravados.append(caminho)
+    return gravados
+
+
+def gera_geometrias(origem, destino, destino_web=None, camadas=None,
+                    detalhes=DETALHES):
+    """gera_camada para cada camada de CAMADAS (ou só as de camadas)."""
+    gravados = []
+    for nome in camadas or CAMADAS:
+        gravados += gera_camada(origem, nome, destino, destino_web, detalhes)
+    return gravados
@@ -0,0 +1,97 @@
+import math
+import os
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from .classes import METRICAS, calcula_classes
+from .geometria import CRS_METRICO, CRS_SAIDA, exporta_geojson
+
+# Grade hexagonal da visão nacional dos municípios: com 100 km de lado
+# sobram algumas centenas de células com município, no lugar de 5.570
+# polígonos
+LADO_HEXAGONO = 100_000
+# Nível de detalhe dos municípios de onde sai o ponto interno de cada um
+DETALHE_GRADE = 'alta'
+GRADE = 'hexagonos'
+ATRIBUICAO = 'hexagonos_municipios'
+CHAVES_MUNICIPIO = ['estado', 'municipio']
+
+
+def grade_hexagonal(limites, lado=LADO_HEXAGONO):
+    """Hexágonos (vértice para cima) de lado metros cobrindo limites
+    (xmin, ymin, xmax, ymax), linha a linha de baixo para cima."""
+    xmin, ymin, xmax, ymax = limites
+    largura = math.sqrt(3) * lado
+    angulos = np.radians(np.arange(6) * 60 + 30)
+    contorno = np.column_stack([np.cos(angulos), np.sin(angulos)]) * lado
+    hexagonos = []
+    for linha, y in enumerate(np.arange(ymin, ymax + 1.5 * lado, 1.5 * lado)):
+        deslocamento = largura / 2 if linha % 2 else 0
+        for x in np.arange(xmin - deslocamento, xmax + largura, largura):
+            hexagonos.append(shapely.Polygon(contorno + (x, y)))
+    return np.array(hexagonos)
+
+
+def gera_grade(geometria, destino, destino_web, lado=LADO_HEXAGONO):
+    """Atribui cada município da geometria a uma célula da grade hexagonal.
+
+    O município vai para a célula do seu ponto interno
+    (representative_point). Só as células com algum município ficam,
+    numeradas em hexagono na ordem do GeoJSON. Grava destino/GRADE.parquet,
+    destino_web/GRADE.json (com o número de municípios de cada célula) e
+    destino/ATRIBUICAO.parquet (estado, municipio, hexagono).
+    """
+    municipios = gpd.read_parquet(geometria).to_crs(CRS_METRICO)
+    pontos = municipios.representative_point().values
+    hexagonos = grade_hexagonal(municipios.total_bounds, lado)
+    ponto, hexagono = shapely.STRtree(hexagonos).query(pontos,
+                                                       predicate='within')
+    # Um ponto exatamente na aresta cai em duas células: fica a primeira
+    _, primeiro = np.unique(ponto, return_index=True)
+    ponto, hexagono = ponto[primeiro], hexagono[primeiro]
+    usados, hexagono = np.unique(hexagono, return_inverse=True)
+    atribuicao = municipios[CHAVES_MUNICIPIO].iloc[ponto].assign(
+        hexagono=hexagono)
+    grade = gpd.GeoDataFrame(
+        {'hexagono': np.arange(len(usados)),
+         'municipios': np.bincount(hexagono, minlength=len(usados))},
+        geometry=hexagonos[usados], crs=CRS_METRICO).to_crs(CRS_SAIDA)
+    os.makedirs(destino, exist_ok=True)
+    os.makedirs(destino_web, exist_ok=True)
+    caminhos = [os.path.join(destino, GRADE + '.parquet'),
+                os.path.join(destino_web, GRADE + '.json'),
+                os.path.join(destino, ATRIBUICAO + '.parquet')]
+    grade.to_parquet(caminhos[0], index=False, compression='zstd')
+    exporta_geojson(grade, caminhos[1])
+    atribuicao.to_parquet(caminhos[2], index=False, compression='zstd')
+    return caminhos
+
+
+def agrega_hexagonos(tabela, atribuicao, caminho, caminho_classes,
+                     metricas=METRICAS):
+    """Média de cada metrica por célula, ponderada pelos aptos.
+
+    Os percentuais têm os aptos como base, então a média ponderada é o
+    percentual da célula inteira. Grava em caminho uma linha por célula
+    com algum município da tabela (hexagono, aptos, municipios e as
+    metricas) e em caminho_classes as classes nacionais dessas médias
+    (classes.calcula_classes).
+    """
+    valores = pd.read_parquet(tabela,
+                              columns=CHAVES_MUNICIPIO + ['aptos'] + metricas)
+    valores = valores.merge(pd.read_parquet(atribuicao), on=CHAVES_MUNICIPIO)
+    pesos = valores[metricas].notna().mul(valores['aptos'], axis=0)
+    somas = valores[metricas].mul(valores['aptos'], axis=0)
+    celulas = valores.groupby('hexagono')
+    medias = (somas.groupby(valores['hexagono']).sum()
+              / pesos.groupby(valores['hexagono']).sum()).round(2)
+    medias.insert(0, 'municipios', celulas.size())
+    medias.insert(0, 'aptos', celulas['aptos'].sum())
+    medias = medias.reset_index()
+    medias.to_parquet(caminho, index=False, compression='zstd')
+    calcula_classes(medias, metricas).to_parquet(caminho_classes, index=False,
+                                                 compression='zstd')
+    return [caminho, caminho_classes]
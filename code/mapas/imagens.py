@@ -0,0 +1,85 @@
+import os
+import re
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+# Figure sem pyplot: sem janela nem estado global nos processos do pool
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from etl.rankings import NACIONAL
+from .classes import ESQUEMAS
+
+# Miniaturas de cada mapa coroplético, em Dashboard/data/imagens, mostradas
+# pelo dashboard até o mapa interativo ser pedido
+PASTA_IMAGENS = 'imagens'
+DETALHE_IMAGEM = 'baixa'
+FORMATO_IMAGEM = 'webp'
+
+# Mesmas cores do mapa interativo (Dashboard/mapas.py, CORES)
+CORES = ['#ffffcc', '#c2e699', '#78c679', '#31a354', '#006837']
+COR_SEM_DADOS = '#cccccc'
+
+# 620x460 px, o tamanho do mapa interativo de estados
+TAMANHO = (6.2, 4.6)
+DPI = 100
+
+
+def nome_imagem(metrica, esquema):
+    """Nome do arquivo da miniatura: 'comparecimento_percentual_quantis.webp'."""
+    return '%s_%s.%s' % (re.sub(r'\W+', '_', metrica).strip('_'), esquema,
+                         FORMATO_IMAGEM)
+
+
+def caminho_imagem(dados, tabela, metrica, esquema):
+    return os.path.join(dados, PASTA_IMAGENS, tabela,
+                        nome_imagem(metrica, esquema))
+
+
+def _cores(valores, limites):
+    # Uma cor por classe, espalhadas pela escala como no mapa interativo
+    cores = [CORES[i] for i in np.linspace(0, len(CORES) - 1, len(limites))
+             .round().astype(int)]
+    classe = np.minimum(np.searchsorted(limites, valores), len(limites) - 1)
+    return [COR_SEM_DADOS if np.isnan(valor) else cores[i]
+            for valor, i in zip(valores, classe)], cores
+
+
+def _legenda(minimo, limites, cores):
+    inicios = [minimo] + limites[:-1]
+    return [Patch(facecolor=cor, edgecolor='#555555',
+                  label='%.2f – %.2f' % (inicio, fim))
+            for cor, inicio, fim in zip(cores, inicios, limites)]
+
+
+def gera_imagens(tabela, classes, geometria, chaves, metrica, destino):
+    """Miniaturas de metrica em cada esquema de classes.ESQUEMAS.
+
+    Usa as classes nacionais de classes (gera_classes) e a geometria mais
+    leve; cada imagem vai para destino/nome_imagem(metrica, esquema).
+    """
+    valores = pd.read_parquet(tabela, columns=chaves + [metrica])
+    gdf = gpd.read_parquet(geometria).merge(valores, on=chaves, how='left')
+    classes = pd.read_parquet(classes).set_index(['metrica', 'escopo',
+                                                  'esquema'])
+    os.makedirs(destino, exist_ok=True)
+    caminhos = []
+    for esquema in ESQUEMAS:
+        minimo, limites = classes.loc[(metrica, NACIONAL, esquema),
+                                      ['minimo', 'limites']]
+        limites = list(limites)
+        cores, cores_classes = _cores(gdf[metrica].to_numpy(dtype='float64'),
+                                      limites)
+        figura = Figure(figsize=TAMANHO, dpi=DPI)
+        eixo = figura.add_subplot()
+        gdf.plot(ax=eixo, color=cores, edgecolor='#555555', linewidth=0.3)
+        eixo.set_axis_off()
+        eixo.legend(handles=_legenda(minimo, limites, cores_classes),
+                    loc='lower right', fontsize=8, frameon=True)
+        figura.tight_layout(pad=0.2)
+        caminho = os.path.join(destino, nome_imagem(metrica, esquema))
+        figura.savefig(caminho, format=FORMATO_IMAGEM,
+                       pil_kwargs={'quality': 80})
+        caminhos.append(caminho)
+    return caminhos
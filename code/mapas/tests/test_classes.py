@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from etl.rankings import NACIONAL
+from mapas import ESQUEMAS, calcula_classes, classifica
+from mapas.classes import QuebrasNaturais
+
+
+def _valores():
+    return np.random.default_rng(1).gamma(2.0, 10.0, 500).round(2)
+
+
+def test_quebras_naturais_reproduziveis():
+    valores = _valores()
+    np.random.seed(3)
+    primeira = QuebrasNaturais(valores).bins
+    np.random.seed(4)
+    assert QuebrasNaturais(valores).bins.tolist() == primeira.tolist()
+
+
+def test_classifica_cada_esquema():
+    valores = np.r_[_valores(), np.nan]
+    for esquema in ESQUEMAS:
+        minimo, limites = classifica(valores, esquema)
+        assert minimo == np.nanmin(valores)
+        assert len(limites) == 5
+        assert limites == sorted(limites)
+        assert limites[-1] == np.nanmax(valores)
+        assert classifica(valores, esquema) == (minimo, limites)
+
+
+def test_poucos_valores_distintos_viram_uma_classe_cada():
+    assert classifica(np.array([1.0, 1.0, 2.0]), 'quantis') == (1.0, [1.0, 2.0])
+
+
+def test_classes_por_escopo():
+    tabela = pd.DataFrame({'estado': ['SP', 'SP', 'SP', 'RJ', 'RJ'],
+                           'municipio': list('abcde'),
+                           'indice': [1.0, 2.0, 3.0, 4.0, 5.0]})
+    classes = calcula_classes(tabela, ['indice'])
+    assert len(classes) == 3 * len(ESQUEMAS)
+    assert set(classes['escopo']) == {NACIONAL, 'SP', 'RJ'}
+    rj = classes[(classes['escopo'] == 'RJ') & (classes['esquema'] == 'quantis')]
+    assert rj['minimo'].item() == 4.0
+    assert len(rj['limites'].item()) == 2
+    assert rj['limites'].item()[-1] == 5.0
+    pd.testing.assert_frame_equal(calcula_classes(tabela, ['indice']), classes)
@@ -0,0 +1,39 @@
+import json
+import os
+
+import geopandas as gpd
+
+from mapas import constroi, tarefas_geometria
+from mapas.construcao import MANIFESTO
+
+# code/, onde fica o estados.gpkg de origem
+ORIGEM = os.path.join(os.path.dirname(__file__), '..', '..')
+
+
+def test_constroi_pula_o_que_nao_mudou(tmp_path):
+    manifesto = tmp_path / MANIFESTO
+    fases = [tarefas_geometria(ORIGEM, str(tmp_path), ['estados'])]
+    saidas = fases[0][0][3]
+
+    gerados, pulados, falhas = constroi(fases, manifesto, processos=1)
+    assert (sorted(gerados), pulados, falhas) == (sorted(saidas), [], [])
+    registro = json.loads(manifesto.read_text(encoding='utf-8'))
+    assert set(registro) == set(saidas)
+    assert len(gpd.read_parquet(saidas[0])) == 27
+
+    modificados = [os.path.getmtime(saida) for saida in saidas]
+    gerados, pulados, falhas = constroi(fases, manifesto, processos=1)
+    assert (gerados, sorted(pulados), falhas) == ([], sorted(saidas), [])
+    assert [os.path.getmtime(saida) for saida in saidas] == modificados
+
+    gerados, pulados, _ = constroi(fases, manifesto, processos=1, forcar=True)
+    assert (sorted(gerados), pulados) == (sorted(saidas), [])
+
+
+def test_tarefa_sem_entrada_falha_sem_parar_as_outras(tmp_path):
+    fases = [tarefas_geometria(str(tmp_path), str(tmp_path / 'dados'),
+                               ['estados', 'municipios'])]
+    gerados, pulados, falhas = constroi(fases, tmp_path / MANIFESTO,
+                                        processos=1)
+    assert (gerados, pulados) == ([], [])
+    assert [erro.startswith('sem ') for _, erro in falhas] == [True, True]
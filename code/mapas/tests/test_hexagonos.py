@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import shapely
+
+from mapas import agrega_hexagonos, grade_hexagonal
+
+
+def test_grade_cobre_os_limites():
+    limites = (0, 0, 1_000_000, 600_000)
+    hexagonos = grade_hexagonal(limites, lado=100_000)
+    assert all(len(shapely.get_coordinates(h)) == 7 for h in hexagonos)
+    np.testing.assert_allclose(shapely.area(hexagonos),
+                               3 * np.sqrt(3) / 2 * 100_000 ** 2)
+    pontos = shapely.points(np.random.default_rng(0).uniform(
+        limites[:2], limites[2:], (1_000, 2)))
+    cobertos = shapely.STRtree(hexagonos).query(pontos, predicate='within')[0]
+    assert set(cobertos) == set(range(len(pontos)))
+
+
+def test_media_ponderada_pelos_aptos(tmp_path):
+    tabela = pd.DataFrame({'estado': ['SP', 'SP', 'RJ'],
+                           'municipio': ['A', 'B', 'C'],
+                           'aptos': [100, 300, 50],
+                           'indice': [10.0, 20.0, np.nan]})
+    atribuicao = pd.DataFrame({'estado': ['SP', 'SP', 'RJ'],
+                               'municipio': ['A', 'B', 'C'],
+                               'hexagono': [0, 0, 1]})
+    tabela.to_parquet(tmp_path / 'tabela.parquet')
+    atribuicao.to_parquet(tmp_path / 'atribuicao.parquet')
+    agrega_hexagonos(tmp_path / 'tabela.parquet',
+                     tmp_path / 'atribuicao.parquet',
+                     tmp_path / 'medias.parquet', tmp_path / 'classes.parquet',
+                     ['indice'])
+    medias = pd.read_parquet(tmp_path / 'medias.parquet')
+    assert medias['hexagono'].tolist() == [0, 1]
+    assert medias['aptos'].tolist() == [400, 50]
+    assert medias['municipios'].tolist() == [2, 1]
+    assert medias['indice'].iloc[0] == 17.5
+    assert np.isnan(medias['indice'].iloc[1])
+    assert len(pd.read_parquet(tmp_path / 'classes.parquet')) > 0
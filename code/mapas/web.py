@@ -0,0 +1,46 @@
+import json
+import os
+import sqlite3
+from contextlib import closing
+
+# Tiles extraídos de um MBTiles, dentro de Dashboard/data/charts
+PASTA_TILES = 'tiles'
+
+
+def extrai_mbtiles(mbtiles, destino):
+    """Grava os tiles de um MBTiles em destino/{z}/{x}/{y}.<formato>.
+
+    O componente de mapas serve arquivos estáticos, não um banco SQLite;
+    metadata.json guarda o formato, os zooms e a atribuição, lidos pelo
+    dashboard. Só MBTiles de imagens (png, jpg, webp) servem ao Leaflet; o
+    MBTiles numera as linhas de baixo para cima (TMS).
+    """
+    with closing(sqlite3.connect(mbtiles)) as banco:
+        metadados = dict(banco.execute('SELECT name, value FROM metadata'))
+        formato = metadados.get('format', 'png')
+        for z, x, linha, dados in banco.execute(
+                'SELECT zoom_level, tile_column, tile_row, tile_data FROM tiles'):
+            y = (1 << z) - 1 - linha
+            pasta = os.path.join(destino, str(z), str(x))
+            os.makedirs(pasta, exist_ok=True)
+            with open(os.path.join(pasta, '%d.%s' % (y, formato)), 'wb') as tile:
+                tile.write(dados)
+    caminho = os.path.join(destino, 'metadata.json')
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump({'formato': formato,
+                   'zoom_minimo': int(metadados.get('minzoom', 0)),
+                   'zoom_maximo': int(metadados.get('maxzoom', 18)),
+                   'atribuicao': metadados.get('attribution', '')},
+                  arquivo, ensure_ascii=False, indent=1)
+    return [caminho]
+
+
+def url_tiles(destino):
+    """Endereço {z}/{x}/{y} dos tiles de extrai_mbtiles, relativo a charts,
+    ou None se eles não foram extraídos."""
+    caminho = os.path.join(destino, 'metadata.json')
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, encoding='utf-8') as arquivo:
+        formato = json.load(arquivo)['formato']
+    return PASTA_TILES + '/{z}/{x}/{y}.' + formato